@@ -1,13 +1,18 @@
 """SynthLang CLI package."""
-from synthlang.config import Config, ConfigManager
-from synthlang.core import (
-    SynthLangModule,
-    FrameworkTranslator,
-    SystemPromptGenerator
-)
+import importlib
 
 __version__ = "0.1.2"
 
+# Public names and the modules that define them; these are imported on
+# first access so that importing the package (e.g. for __version__) stays cheap
+_LAZY_ATTRS = {
+    "Config": "synthlang.config",
+    "ConfigManager": "synthlang.config",
+    "SynthLangModule": "synthlang.core",
+    "FrameworkTranslator": "synthlang.core",
+    "SystemPromptGenerator": "synthlang.core",
+}
+
 __all__ = [
     "Config",
     "ConfigManager",
@@ -16,3 +21,14 @@ __all__ = [
     "SystemPromptGenerator",
     "__version__"
 ]
+
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the package."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 import dspy
 
 from .base import SynthLangModule
-from .types import SynthLangSymbols
+from .types import CORE_SYMBOLS_RE
 
 class PromptEvolver(SynthLangModule):
     """Evolves prompts using genetic algorithms and self-play tournaments."""
@@ -87,8 +87,7 @@ Example mutations:
     def _calculate_fitness(self, prompt: str) -> Dict[str, float]:
         """Calculate fitness scores for a prompt."""
         # Clarity score based on symbol usage
-        clarity = sum(1 for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT] 
-                     if sym in prompt) / 3.0
+        clarity = len(set(CORE_SYMBOLS_RE.findall(prompt))) / 3.0
                      
         # Specificity score based on operators and joins
         specificity = (
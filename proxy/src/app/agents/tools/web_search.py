@@ -9,6 +9,7 @@ import logging
 import traceback
 from typing import Dict, Any, Optional
 from openai import OpenAI
+from starlette.concurrency import run_in_threadpool
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -48,13 +49,16 @@ def get_openai_client():
         The OpenAI client instance
     """
     global client
-    if client is None:
+    # Rebuild the client if the shared pool was closed at shutdown
+    if client is None or client.is_closed():
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             logger.error("OPENAI_API_KEY environment variable not set")
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        client = OpenAI(api_key=api_key)
+        # Reuse the provider's pooled connections instead of opening a separate pool
+        from src.app.llm_providers.providers.openai_provider import get_shared_http_client
+        client = OpenAI(api_key=api_key, http_client=get_shared_http_client())
     
     return client
 
@@ -135,9 +139,8 @@ async def async_perform_web_search(query: str, user_message: Optional[str] = Non
     Returns:
         A dictionary containing the search results
     """
-    # For now, just call the synchronous version
-    # In a real implementation, this would use an async client
-    return perform_web_search(query, user_message, user_id)
+    # Run the synchronous client call in the threadpool so it doesn't block the event loop
+    return await run_in_threadpool(perform_web_search, query, user_message, user_id)
 
 
 # Register the tool
@@ -29,6 +29,7 @@ from .roles import (
     add_user_role,
     remove_user_role,
     require_role,
+    on_roles_changed,
     USER_ROLES,
     DEFAULT_ROLES,
     ROLE_HIERARCHY
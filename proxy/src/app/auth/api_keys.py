@@ -126,18 +126,23 @@ def get_rate_limit(api_key: str) -> int:
     user_id = get_user_id(api_key)
     return RATE_LIMITS.get(user_id, DEFAULT_RATE_LIMIT)
 
-def check_rate_limit(request: Request, api_key: str) -> None:
+def check_rate_limit(request: Request, api_key: str, user_id: Optional[str] = None) -> None:
     """
     Check if a request exceeds the rate limit.
     
+    The limiter is a per-process fixed window kept in memory, so the check
+    never leaves the process.
+    
     Args:
         request: The FastAPI request object
         api_key: The API key
+        user_id: The user ID if the caller already resolved it
         
     Raises:
         HTTPException: If the rate limit is exceeded
     """
-    user_id = get_user_id(api_key)
+    if user_id is None:
+        user_id = get_user_id(api_key)
     
     # Get current time
     current_time = time.time()
@@ -157,7 +162,7 @@ def check_rate_limit(request: Request, api_key: str) -> None:
         return
     
     # Get rate limit for this user
-    rate_limit = get_rate_limit(api_key)
+    rate_limit = RATE_LIMITS.get(user_id, DEFAULT_RATE_LIMIT)
     
     # Check if rate limit is exceeded
     if count >= rate_limit:
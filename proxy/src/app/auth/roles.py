@@ -5,7 +5,7 @@ This module provides functions for managing user roles and permissions.
 """
 import os
 import logging
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, List, Set, Optional
 import asyncio
 from sqlalchemy import select, insert, delete, update, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,6 +28,32 @@ ROLE_HIERARCHY: Dict[str, List[str]] = {
     "basic": []
 }
 
+# Functions called with a user ID when that user's roles change, or with
+# None when all roles are reloaded
+_role_change_listeners: List[Callable[[Optional[str]], None]] = []
+
+def on_roles_changed(listener: Callable[[Optional[str]], None]) -> None:
+    """
+    Register a function to call whenever roles change.
+    
+    Modules that cache roles use this to drop stale entries.
+    
+    Args:
+        listener: Function called with the affected user ID, or with None
+            when the roles of all users were reloaded
+    """
+    _role_change_listeners.append(listener)
+
+def _notify_roles_changed(user_id: Optional[str]) -> None:
+    """
+    Call the registered role change listeners.
+    
+    Args:
+        user_id: The user whose roles changed, or None for all users
+    """
+    for listener in _role_change_listeners:
+        listener(user_id)
+
 async def init_user_roles() -> None:
     """
     Initialize user roles from the database.
@@ -82,6 +108,8 @@ async def init_user_roles() -> None:
         logger.error(f"Error initializing user roles: {e}")
         # Ensure we have at least an empty cache
         USER_ROLES.clear()
+    finally:
+        _notify_roles_changed(None)
 
 def get_user_roles(user_id: str) -> List[str]:
     """
@@ -140,7 +168,7 @@ def has_role(user_id: str, role: str) -> bool:
     """
     roles = get_user_roles(user_id)
     has_role = role in roles
-    logger.info(f"Checking if user '{user_id}' has role '{role}': {has_role} (user roles: {roles})")
+    logger.debug("Checking if user '%s' has role '%s': %s (user roles: %s)", user_id, role, has_role, roles)
     return has_role
 
 async def add_user_role_db(user_id: str, role: str) -> bool:
@@ -196,6 +224,7 @@ async def add_user_role_db(user_id: str, role: str) -> bool:
                 USER_ROLES[user_id] = [role]
             elif role not in USER_ROLES[user_id]:
                 USER_ROLES[user_id].append(role)
+            _notify_roles_changed(user_id)
             
             logger.info(f"Added role '{role}' to user '{user_id}' in database")
             return True
@@ -223,6 +252,7 @@ def add_user_role(user_id: str, role: str) -> None:
     if role not in USER_ROLES[user_id]:
         USER_ROLES[user_id].append(role)
         logger.info(f"Added role '{role}' to user '{user_id}' in memory")
+        _notify_roles_changed(user_id)
     
     # Schedule database update asynchronously
     asyncio.create_task(add_user_role_db(user_id, role))
@@ -291,6 +321,8 @@ def remove_user_role(user_id: str, role: str) -> None:
         if not USER_ROLES[user_id]:
             USER_ROLES[user_id] = DEFAULT_ROLES.copy()
             logger.info(f"Assigned default roles to user '{user_id}' in memory")
+        
+        _notify_roles_changed(user_id)
     
     # Schedule database update asynchronously
     asyncio.create_task(remove_user_role_db(user_id, role))
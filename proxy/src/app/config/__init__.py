@@ -35,6 +35,13 @@ MASK_PII_IN_LOGS = bool(int(os.getenv("MASK_PII_IN_LOGS", "1")))
 DEFAULT_RATE_LIMIT_QPM = int(os.getenv("DEFAULT_RATE_LIMIT_QPM", "60"))
 PREMIUM_RATE_LIMIT_QPM = int(os.getenv("PREMIUM_RATE_LIMIT_QPM", "120"))
 
+# Maximum number of concurrent SynthLang language model operations per worker
+SYNTHLANG_MAX_CONCURRENCY = int(os.getenv("SYNTHLANG_MAX_CONCURRENCY", "8"))
+
+# Build the SynthLang language model at import time so `gunicorn --preload`
+# creates it once in the master process and workers inherit it on fork
+SYNTHLANG_PRELOAD_LM = bool(int(os.getenv("SYNTHLANG_PRELOAD_LM", "0")))
+
 # SQLite configuration
 USE_SQLITE = bool(int(os.getenv("USE_SQLITE", "0")))
 SQLITE_PATH = os.getenv("SQLITE_PATH", "sqlite+aiosqlite:///./synthlang_proxy.db")
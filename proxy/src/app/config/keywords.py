@@ -101,18 +101,25 @@ def save_keyword_config(config: Dict[str, Any], config_file: Optional[str] = Non
     """
     config_file = config_file or get_config_file_path()
     
+    # Save configuration to a temporary file and move it into place, so
+    # a crash never leaves a truncated configuration behind
+    tmp_file = config_file + ".tmp"
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(config_file), exist_ok=True)
         
-        # Save configuration
-        with open(config_file, "wb") as f:
-            tomli_w.dump(config, f)
+        with open(tmp_file, "wb") as f:
+            f.write(tomli_w.dumps(config).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, config_file)
         
         logger.info(f"Saved keyword configuration to {config_file}")
         return True
     except Exception as e:
         logger.error(f"Error saving configuration to {config_file}: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         return False
 
 def pattern_to_toml(pattern: KeywordPattern) -> Dict[str, Any]:
@@ -7,7 +7,7 @@ import logging
 import time
 from typing import Dict, Any, Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, Header, Body, Path
+from fastapi import APIRouter, Depends, HTTPException, Header, Body, Path, Request
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN
 
 from src.app import auth
@@ -55,24 +55,28 @@ def verify_auth(authorization: Optional[str] = Header(None)) -> str:
     return auth.verify_api_key(authorization)
 
 
-@router.get("/patterns")
-async def get_patterns(
+def require_admin(
+    request: Request,
     api_key: str = Depends(verify_auth)
-):
+) -> str:
     """
-    List all keyword patterns.
+    Rate limit and authorize an admin request.
     
     Args:
+        request: The incoming request
         api_key: The API key
         
     Returns:
-        List of keyword patterns
+        The admin's user ID
+        
+    Raises:
+        HTTPException: If the rate limit is exceeded or the user is not an admin
     """
     # Get user ID from API key
     user_id = auth.get_user_id(api_key)
     
     # Check rate limit
-    auth.check_rate_limit(None, api_key)
+    auth.check_rate_limit(request, api_key, user_id)
     
     # Check if user has required role
     if not auth.has_role(user_id, "admin"):
@@ -87,6 +91,22 @@ async def get_patterns(
             }
         )
     
+    return user_id
+
+
+@router.get("/patterns")
+async def get_patterns(
+    user_id: str = Depends(require_admin)
+):
+    """
+    List all keyword patterns.
+    
+    Args:
+        user_id: The authorized admin user
+        
+    Returns:
+        List of keyword patterns
+    """
     # Log the request
     logger.info(f"List patterns request from user {user_id}")
     
@@ -112,7 +132,7 @@ async def create_pattern(
     priority: int = Body(50),
     required_role: str = Body("basic"),
     enabled: bool = Body(True),
-    api_key: str = Depends(verify_auth)
+    user_id: str = Depends(require_admin)
 ):
     """
     Add a new keyword pattern.
@@ -125,30 +145,11 @@ async def create_pattern(
         priority: Pattern priority (higher = checked first)
         required_role: Required role to use this pattern
         enabled: Whether the pattern is enabled
-        api_key: The API key
+        user_id: The authorized admin user
         
     Returns:
         Added pattern
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    if not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": f"User '{user_id}' does not have required role 'admin'",
-                    "type": "permission_error",
-                    "code": HTTP_403_FORBIDDEN
-                }
-            }
-        )
-    
     # Log the request
     logger.info(f"Create pattern request from user {user_id}")
     
@@ -207,7 +208,7 @@ async def update_pattern_endpoint(
     priority: Optional[int] = Body(None),
     required_role: Optional[str] = Body(None),
     enabled: Optional[bool] = Body(None),
-    api_key: str = Depends(verify_auth)
+    user_id: str = Depends(require_admin)
 ):
     """
     Update an existing keyword pattern.
@@ -220,30 +221,11 @@ async def update_pattern_endpoint(
         priority: Pattern priority (higher = checked first)
         required_role: Required role to use this pattern
         enabled: Whether the pattern is enabled
-        api_key: The API key
+        user_id: The authorized admin user
         
     Returns:
         Updated pattern
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    if not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": f"User '{user_id}' does not have required role 'admin'",
-                    "type": "permission_error",
-                    "code": HTTP_403_FORBIDDEN
-                }
-            }
-        )
-    
     # Log the request
     logger.info(f"Update pattern request from user {user_id}")
     
@@ -328,37 +310,18 @@ async def update_pattern_endpoint(
 @router.delete("/patterns/{name}")
 async def delete_pattern_endpoint(
     name: str = Path(...),
-    api_key: str = Depends(verify_auth)
+    user_id: str = Depends(require_admin)
 ):
     """
     Delete a keyword pattern.
     
     Args:
         name: Pattern name
-        api_key: The API key
+        user_id: The authorized admin user
         
     Returns:
         Deletion result
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    if not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": f"User '{user_id}' does not have required role 'admin'",
-                    "type": "permission_error",
-                    "code": HTTP_403_FORBIDDEN
-                }
-            }
-        )
-    
     # Log the request
     logger.info(f"Delete pattern request from user {user_id}")
     
@@ -405,36 +368,17 @@ async def delete_pattern_endpoint(
 
 @router.get("/settings")
 async def get_settings_endpoint(
-    api_key: str = Depends(verify_auth)
+    user_id: str = Depends(require_admin)
 ):
     """
     Get keyword detection settings.
     
     Args:
-        api_key: The API key
+        user_id: The authorized admin user
         
     Returns:
         Keyword detection settings
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    if not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": f"User '{user_id}' does not have required role 'admin'",
-                    "type": "permission_error",
-                    "code": HTTP_403_FORBIDDEN
-                }
-            }
-        )
-    
     # Log the request
     logger.info(f"Get settings request from user {user_id}")
     
@@ -453,7 +397,7 @@ async def update_settings_endpoint(
     enable_detection: Optional[bool] = Body(None),
     detection_threshold: Optional[float] = Body(None),
     default_role: Optional[str] = Body(None),
-    api_key: str = Depends(verify_auth)
+    user_id: str = Depends(require_admin)
 ):
     """
     Update keyword detection settings.
@@ -462,30 +406,11 @@ async def update_settings_endpoint(
         enable_detection: Whether to enable keyword detection
         detection_threshold: Threshold for keyword detection
         default_role: Default role for users
-        api_key: The API key
+        user_id: The authorized admin user
         
     Returns:
         Updated settings
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    if not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": f"User '{user_id}' does not have required role 'admin'",
-                    "type": "permission_error",
-                    "code": HTTP_403_FORBIDDEN
-                }
-            }
-        )
-    
     # Log the request
     logger.info(f"Update settings request from user {user_id}")
     
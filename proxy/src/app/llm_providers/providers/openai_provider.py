@@ -8,7 +8,7 @@ import logging
 import os
 import time
 import httpx
-from typing import List, Dict, Any, AsyncGenerator
+from typing import List, Dict, Any, AsyncGenerator, Optional
 
 from openai import OpenAI, AsyncOpenAI
 
@@ -31,6 +31,50 @@ logger = logging.getLogger(__name__)
 # Get API key from environment
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
+# Connection pool limits shared by every OpenAI client in the process
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Shared HTTP connection pools, created on first use
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.Client:
+    """
+    Get the pooled HTTP client shared by synchronous OpenAI clients.
+    
+    Returns:
+        The shared httpx client
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(limits=HTTP_LIMITS, timeout=httpx.Timeout(600.0, connect=5.0))
+    return _http_client
+
+
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client shared by async OpenAI clients.
+    
+    Returns:
+        The shared async httpx client
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=httpx.Timeout(600.0, connect=5.0))
+    return _async_http_client
+
+
+async def close_shared_http_clients() -> None:
+    """Close the shared HTTP connection pools."""
+    global _http_client, _async_http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+
 
 class OpenAIProvider(BaseLLMProvider):
     """
@@ -52,12 +96,13 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             LLMAuthenticationError: If the API key is not set
         """
-        if self.client is None:
+        # Rebuild the client if the shared pool was closed at shutdown
+        if self.client is None or self.client.is_closed():
             api_key = OPENAI_API_KEY
             if not api_key:
                 logger.error("OPENAI_API_KEY is not set. Using environment variable is required.")
                 raise LLMAuthenticationError("OPENAI_API_KEY environment variable is not set")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=get_shared_http_client())
         return self.client
     
     def get_async_openai_client(self):
@@ -70,12 +115,13 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             LLMAuthenticationError: If the API key is not set
         """
-        if self.async_client is None:
+        # Rebuild the client if the shared pool was closed at shutdown
+        if self.async_client is None or self.async_client.is_closed():
             api_key = OPENAI_API_KEY
             if not api_key:
                 logger.error("OPENAI_API_KEY is not set. Using environment variable is required.")
                 raise LLMAuthenticationError("OPENAI_API_KEY environment variable is not set")
-            self.async_client = AsyncOpenAI(api_key=api_key)
+            self.async_client = AsyncOpenAI(api_key=api_key, http_client=get_shared_async_http_client())
         return self.async_client
     
     def get_model_params(self, model: str, params: Dict[str, Any]) -> Dict[str, Any]:
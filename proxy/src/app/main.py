@@ -14,7 +14,8 @@ from typing import List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends, HTTPException, Request, Response, Header
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.status import HTTP_401_UNAUTHORIZED
 
@@ -35,6 +36,7 @@ from .cache.endpoints import router as cache_router
 from .agents.endpoints import router as tools_router
 from .keywords.endpoints import router as keywords_router
 from .config.keywords import initialize_from_config
+from .validation_handler import validation_exception_handler
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +45,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("app")
 
+# Preload the shared DSPy language model before workers are forked
+from .config import SYNTHLANG_PRELOAD_LM
+if SYNTHLANG_PRELOAD_LM:
+    from .synthlang.api import synthlang_api
+    from .synthlang.utils import get_dspy_lm
+    preloaded_lm = get_dspy_lm()
+    if preloaded_lm is not None:
+        synthlang_api.set_language_model(preloaded_lm)
+        logger.info("Preloaded SynthLang language model")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -98,13 +110,23 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error initializing keyword detection system: {e}")
     
+    # Open the SynthLang prompt store
+    from .synthlang.api import synthlang_api
+    try:
+        await synthlang_api.connect()
+        logger.info("SynthLang prompt store opened")
+    except Exception as e:
+        logger.error(f"Error opening SynthLang prompt store: {e}")
+    
     logger.info("Application initialization complete")
     
     yield  # This is where the application runs
     
     # Shutdown logic
     logger.info("Shutting down application...")
-    # Add any cleanup tasks here
+    await synthlang_api.close()
+    from .llm_providers.providers.openai_provider import close_shared_http_clients
+    await close_shared_http_clients()
     logger.info("Application shutdown complete")
 
 
@@ -114,6 +136,8 @@ app = FastAPI(
     description="A high-speed LLM router and proxy with SynthLang integration",
     version="0.1.0",
     lifespan=lifespan,
+    # Serialize route results with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -133,7 +157,7 @@ app.include_router(tools_router)
 app.include_router(keywords_router)
 
 
-@app.get("/", response_model=APIInfo)
+@app.get("/", responses={200: {"model": APIInfo}})
 async def root():
     """
     Get basic API information.
@@ -141,15 +165,15 @@ async def root():
     Returns:
         Basic information about the API
     """
-    return {
+    return ORJSONResponse({
         "name": "SynthLang Router API",
         "version": "0.1.0",
         "status": "operational",
         "documentation": "/docs"
-    }
+    })
 
 
-@app.get("/health", response_model=HealthCheck)
+@app.get("/health", responses={200: {"model": HealthCheck}})
 async def health_check():
     """
     Check the health of the API.
@@ -157,12 +181,13 @@ async def health_check():
     Returns:
         Health status information
     """
-    return {
+    # Health checks are polled constantly, so skip response model validation
+    return ORJSONResponse({
         "status": "healthy",
         "timestamp": int(time.time()),
         "synthlang_available": is_synthlang_available(),
         "version": "0.1.0"
-    }
+    })
 
 
 @app.post("/v1/chat/completions", response_model=ChatResponse)
@@ -470,7 +495,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     
     # If the exception already has a structured error detail, use it
     if isinstance(exc.detail, dict) and "error" in exc.detail:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=exc.detail,
             headers=exc.headers
@@ -485,13 +510,18 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     }
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response,
         headers=exc.headers
     )
 
 
+# Serialize request validation errors with orjson; the response matches
+# FastAPI's default {"detail": [...]} format
+app.add_exception_handler(RequestValidationError, validation_exception_handler)
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
@@ -516,7 +546,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         }
     }
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_response
     )
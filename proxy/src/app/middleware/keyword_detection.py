@@ -3,10 +3,13 @@ Keyword detection middleware.
 
 This module provides middleware for detecting keywords in messages.
 """
+import asyncio
 import logging
 import re
 from typing import Dict, List, Any, Optional, Set
 
+from starlette.concurrency import run_in_threadpool
+
 from src.app.auth.roles import get_user_roles
 from src.app.keywords.registry import list_patterns, ENABLE_KEYWORD_DETECTION, DETECTION_THRESHOLD
 from src.app.agents.registry import get_tool
@@ -93,7 +96,11 @@ async def process_message_with_keywords(message: str, user_id: str) -> Optional[
                 
                 # Execute the tool
                 try:
-                    result = await tool(**parameters)
+                    if asyncio.iscoroutinefunction(tool):
+                        result = await tool(**parameters)
+                    else:
+                        # Synchronous tools block on network I/O; run them off the event loop
+                        result = await run_in_threadpool(tool, **parameters)
                     return result
                 except Exception as e:
                     logger.error(f"Tool execution error: {e}")
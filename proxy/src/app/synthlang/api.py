@@ -3,8 +3,10 @@ SynthLang API interface.
 
 This module provides a clean API interface to the SynthLang core functionality.
 """
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
 import os
 
 from src.app.config import USE_SYNTHLANG
@@ -44,6 +46,12 @@ class SynthLangAPI:
         """
         self.lm = lm
         self.enabled = ENABLE_SYNTHLANG
+        self._lm_lock = threading.Lock()
+        
+        # Streaming operations in flight mapped to the user who started
+        # them, and those asked to stop early
+        self._active_streams: Dict[str, Optional[str]] = {}
+        self._aborted_streams: Set[str] = set()
         
         # Initialize core modules if enabled
         if self.enabled:
@@ -56,7 +64,7 @@ class SynthLangAPI:
                 self.prompt_manager = PromptManager(storage_dir)
                 logger.info("SynthLang API initialized with core modules")
             except Exception as e:
-                logger.error(f"Failed to initialize SynthLang API: {e}")
+                logger.exception("Failed to initialize SynthLang API: %s", e)
                 self.enabled = False
         
     def set_enabled(self, enabled: bool) -> None:
@@ -88,20 +96,25 @@ class SynthLangAPI:
         if not self.enabled:
             logger.warning("SynthLang API is disabled, not setting language model")
             return
-            
-        self.lm = lm
         
-        # Update language model for core modules
-        if hasattr(self, 'translator') and self.translator:
-            self.translator.lm = lm
-        if hasattr(self, 'generator') and self.generator:
-            self.generator.lm = lm
-        if hasattr(self, 'optimizer') and self.optimizer:
-            self.optimizer.lm = lm
-        if hasattr(self, 'evolver') and self.evolver:
-            self.evolver.lm = lm
-        if hasattr(self, 'classifier') and self.classifier:
-            self.classifier.lm = lm
+        with self._lm_lock:
+            self.lm = lm
+            
+            # Update language model for core modules, creating any that
+            # were skipped because no model was available at startup
+            for attr, module_cls in (
+                ('translator', FrameworkTranslator),
+                ('generator', SystemPromptGenerator),
+                ('optimizer', PromptOptimizer),
+                ('evolver', PromptEvolver),
+            ):
+                module = getattr(self, attr, None)
+                if module:
+                    module.lm = lm
+                else:
+                    setattr(self, attr, module_cls(lm))
+            if hasattr(self, 'classifier') and self.classifier:
+                self.classifier.lm = lm
             
         logger.info("Updated language model for SynthLang API")
     
@@ -154,7 +167,7 @@ class SynthLangAPI:
         try:
             return self.translator.translate(text, instructions)
         except Exception as e:
-            logger.error(f"Translation error: {e}")
+            logger.exception("Translation error: %s", e)
             return {"source": text, "target": text, "explanation": f"Error: {str(e)}"}
     
     def generate(self, task_description: str) -> GenerationResult:
@@ -174,7 +187,7 @@ class SynthLangAPI:
         try:
             return self.generator.generate(task_description)
         except Exception as e:
-            logger.error(f"Generation error: {e}")
+            logger.exception("Generation error: %s", e)
             return {"prompt": "", "rationale": f"Error: {str(e)}", "metadata": {}}
     
     def optimize(self, prompt: str, max_iterations: int = 5) -> OptimizationResult:
@@ -195,7 +208,7 @@ class SynthLangAPI:
         try:
             return self.optimizer.optimize(prompt, max_iterations)
         except Exception as e:
-            logger.error(f"Optimization error: {e}")
+            logger.exception("Optimization error: %s", e)
             return {"optimized": prompt, "improvements": [], "metrics": {}, "original": prompt}
     
     def evolve(self, seed_prompt: str, n_generations: int = 10) -> Dict[str, Any]:
@@ -216,9 +229,155 @@ class SynthLangAPI:
         try:
             return self.evolver.evolve(seed_prompt, n_generations)
         except Exception as e:
-            logger.error(f"Evolution error: {e}")
+            logger.exception("Evolution error: %s", e)
             return {"best_prompt": seed_prompt, "fitness": {}, "generations": 0}
     
+    async def evolve_async(
+        self,
+        seed_prompt: str,
+        n_generations: int = 10,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
+        """
+        Evolve a prompt using SynthLang, scoring variants concurrently.
+        
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            semaphore: Optional semaphore bounding concurrent language model calls
+            
+        Returns:
+            Dictionary containing evolution result
+        """
+        if not self.enabled or not self.evolver or not self.lm:
+            logger.warning("SynthLang API is disabled or evolver not initialized")
+            return {"best_prompt": seed_prompt, "fitness": {}, "generations": 0}
+            
+        try:
+            return await self.evolver.evolve_async(seed_prompt, n_generations, semaphore)
+        except Exception as e:
+            logger.exception("Evolution error: %s", e)
+            return {"best_prompt": seed_prompt, "fitness": {}, "generations": 0}
+    
+    async def _track_stream(
+        self,
+        request_id: str,
+        steps: AsyncIterator[Dict[str, Any]],
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Tag streamed steps with their request ID and stop once aborted.
+        
+        Args:
+            request_id: Identifier clients can pass to abort()
+            steps: The underlying progress stream
+            user_id: User who started the stream and may abort it
+            
+        Yields:
+            Progress events, ending with "result" or "aborted"
+        """
+        self._active_streams[request_id] = user_id
+        try:
+            async for step in steps:
+                if request_id in self._aborted_streams:
+                    logger.info(f"Aborted SynthLang stream {request_id}")
+                    yield {"event": "aborted", "request_id": request_id}
+                    return
+                step["request_id"] = request_id
+                yield step
+        finally:
+            self._active_streams.pop(request_id, None)
+            self._aborted_streams.discard(request_id)
+    
+    async def optimize_stream(
+        self,
+        request_id: str,
+        prompt: str,
+        max_iterations: int = 5,
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Optimize a prompt, yielding progress after every iteration.
+        
+        Args:
+            request_id: Identifier clients can pass to abort()
+            prompt: The prompt to optimize
+            max_iterations: Maximum optimization iterations
+            user_id: User who started the stream and may abort it
+            
+        Yields:
+            Progress events, ending with "result" or "aborted"
+        """
+        if not self.enabled or not self.optimizer or not self.lm:
+            logger.warning("SynthLang API is disabled or optimizer not initialized")
+            yield {"event": "result", "request_id": request_id, "optimized": prompt,
+                   "improvements": [], "metrics": {}, "original": prompt}
+            return
+        
+        try:
+            steps = self.optimizer.optimize_stream(prompt, max_iterations)
+            async for step in self._track_stream(request_id, steps, user_id):
+                yield step
+        except Exception as e:
+            logger.exception("Optimization error: %s", e)
+            yield {"event": "error", "request_id": request_id, "message": str(e)}
+    
+    async def evolve_stream(
+        self,
+        request_id: str,
+        seed_prompt: str,
+        n_generations: int = 10,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        user_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Evolve a prompt, yielding progress after every generation.
+        
+        Args:
+            request_id: Identifier clients can pass to abort()
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            semaphore: Optional semaphore bounding concurrent language model calls
+            user_id: User who started the stream and may abort it
+            
+        Yields:
+            Progress events, ending with "result" or "aborted"
+        """
+        if not self.enabled or not self.evolver or not self.lm:
+            logger.warning("SynthLang API is disabled or evolver not initialized")
+            yield {"event": "result", "request_id": request_id, "best_prompt": seed_prompt,
+                   "fitness": {}, "generations": 0}
+            return
+        
+        try:
+            steps = self.evolver.evolve_stream(seed_prompt, n_generations, semaphore)
+            async for step in self._track_stream(request_id, steps, user_id):
+                yield step
+        except Exception as e:
+            logger.exception("Evolution error: %s", e)
+            yield {"event": "error", "request_id": request_id, "message": str(e)}
+    
+    def abort(self, request_id: str, user_id: Optional[str] = None) -> bool:
+        """
+        Ask a streaming operation to stop after its current step.
+        
+        Streams are tracked in this process only, so with several server
+        workers an abort succeeds only on the worker serving the stream.
+        
+        Args:
+            request_id: Identifier of the streaming operation
+            user_id: User asking to stop it; must be the user who started it
+            
+        Returns:
+            True if the operation was in flight and owned by the user,
+            False otherwise
+        """
+        if request_id not in self._active_streams or self._active_streams[request_id] != user_id:
+            return False
+        
+        self._aborted_streams.add(request_id)
+        return True
+    
     def classify(self, text: str, labels: List[str]) -> Dict[str, Any]:
         """
         Classify a prompt using SynthLang.
@@ -240,16 +399,22 @@ class SynthLangAPI:
                 self.classifier = PromptClassifier(self.lm, labels)
                 logger.info(f"Initialized classifier with labels: {labels}")
             except Exception as e:
-                logger.error(f"Failed to initialize classifier: {e}")
+                logger.exception("Failed to initialize classifier: %s", e)
                 return {"input": text, "label": "", "explanation": f"Error: {str(e)}"}
             
         try:
             return self.classifier.classify(text)
         except Exception as e:
-            logger.error(f"Classification error: {e}")
+            logger.exception("Classification error: %s", e)
             return {"input": text, "label": "", "explanation": f"Error: {str(e)}"}
     
-    def save_prompt(self, name: str, prompt: str, metadata: Optional[Dict] = None) -> None:
+    async def save_prompt_async(
+        self,
+        name: str,
+        prompt: str,
+        metadata: Optional[Dict] = None,
+        user_id: Optional[str] = None
+    ) -> None:
         """
         Save a prompt with metadata.
         
@@ -257,18 +422,25 @@ class SynthLangAPI:
             name: Name to save prompt under
             prompt: The prompt content
             metadata: Optional metadata about the prompt
+            user_id: Only replace an existing prompt if it belongs to this user
+            
+        Raises:
+            PermissionError: If a prompt with the name belongs to a different user
         """
         if not self.enabled or not hasattr(self, 'prompt_manager') or not self.prompt_manager:
             logger.warning("SynthLang API is disabled or prompt manager not initialized")
             return
             
         try:
-            self.prompt_manager.save(name, prompt, metadata)
+            await self.prompt_manager.save(name, prompt, metadata, user_id)
             logger.info(f"Saved prompt: {name}")
+        except PermissionError:
+            logger.warning(f"Prompt {name} belongs to another user")
+            raise
         except Exception as e:
-            logger.error(f"Failed to save prompt: {e}")
+            logger.exception("Failed to save prompt: %s", e)
     
-    def load_prompt(self, name: str) -> Dict[str, Any]:
+    async def load_prompt_async(self, name: str) -> Dict[str, Any]:
         """
         Load a saved prompt.
         
@@ -283,18 +455,21 @@ class SynthLangAPI:
             return {"name": name, "prompt": "", "metadata": {}}
             
         try:
-            return self.prompt_manager.load(name)
+            return await self.prompt_manager.load(name)
         except FileNotFoundError:
             logger.warning(f"No prompt found with name: {name}")
             return {"name": name, "prompt": "", "metadata": {}}
         except Exception as e:
-            logger.error(f"Failed to load prompt: {e}")
+            logger.exception("Failed to load prompt: %s", e)
             return {"name": name, "prompt": "", "metadata": {}}
     
-    def list_prompts(self) -> List[Dict[str, Any]]:
+    async def list_prompts_async(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        List all saved prompts.
+        List saved prompts.
         
+        Args:
+            user_id: Only list prompts saved by this user; all prompts if None
+            
         Returns:
             List of prompt data dictionaries
         """
@@ -303,43 +478,76 @@ class SynthLangAPI:
             return []
             
         try:
-            return self.prompt_manager.list()
+            return await self.prompt_manager.list(user_id)
         except Exception as e:
-            logger.error(f"Failed to list prompts: {e}")
+            logger.exception("Failed to list prompts: %s", e)
             return []
     
-    def delete_prompt(self, name: str) -> bool:
+    async def load_prompts_async(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load several saved prompts at once.
+        
+        Args:
+            names: Names of prompts to load
+            
+        Returns:
+            Dictionary mapping each found name to its prompt data
+        """
+        if not self.enabled or not hasattr(self, 'prompt_manager') or not self.prompt_manager:
+            logger.warning("SynthLang API is disabled or prompt manager not initialized")
+            return {}
+            
+        try:
+            return await self.prompt_manager.load_many(names)
+        except Exception as e:
+            logger.exception("Failed to load prompts: %s", e)
+            return {}
+    
+    async def delete_prompt_async(self, name: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Delete a saved prompt.
         
         Args:
             name: Name of prompt to delete
+            user_id: Only delete the prompt if it belongs to this user
             
         Returns:
-            True if prompt was deleted, False otherwise
+            Metadata of the deleted prompt, or None if it was not deleted
+            
+        Raises:
+            PermissionError: If the prompt belongs to a different user
         """
         if not self.enabled or not hasattr(self, 'prompt_manager') or not self.prompt_manager:
             logger.warning("SynthLang API is disabled or prompt manager not initialized")
-            return False
+            return None
             
         try:
-            self.prompt_manager.delete(name)
+            metadata = await self.prompt_manager.delete(name, user_id)
             logger.info(f"Deleted prompt: {name}")
-            return True
+            return metadata
+        except PermissionError:
+            logger.warning(f"Prompt {name} belongs to another user")
+            raise
         except FileNotFoundError:
             logger.warning(f"No prompt found with name: {name}")
-            return False
+            return None
         except Exception as e:
-            logger.error(f"Failed to delete prompt: {e}")
-            return False
+            logger.exception("Failed to delete prompt: %s", e)
+            return None
     
-    def compare_prompts(self, name1: str, name2: str) -> Dict[str, Any]:
+    async def compare_prompts_async(
+        self,
+        name1: str,
+        name2: str,
+        loaded: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Compare two saved prompts.
         
         Args:
             name1: First prompt name
             name2: Second prompt name
+            loaded: Prompt data already loaded with load_prompts_async, if any
             
         Returns:
             Dictionary containing comparison results
@@ -349,13 +557,23 @@ class SynthLangAPI:
             return {"prompts": {}, "metrics": {}, "differences": {}}
             
         try:
-            return self.prompt_manager.compare(name1, name2)
+            return await self.prompt_manager.compare(name1, name2, loaded)
         except FileNotFoundError as e:
             logger.warning(f"Prompt comparison failed: {e}")
             return {"prompts": {}, "metrics": {}, "differences": {}}
         except Exception as e:
-            logger.error(f"Failed to compare prompts: {e}")
+            logger.exception("Failed to compare prompts: %s", e)
             return {"prompts": {}, "metrics": {}, "differences": {}}
+    
+    async def connect(self) -> None:
+        """Open the prompt store so the first request doesn't pay for it."""
+        if self.enabled and hasattr(self, 'prompt_manager') and self.prompt_manager:
+            await self.prompt_manager.connect()
+    
+    async def close(self) -> None:
+        """Release resources held by the prompt store."""
+        if hasattr(self, 'prompt_manager') and self.prompt_manager:
+            await self.prompt_manager.close()
 
 
 # Create a singleton instance of SynthLangAPI
@@ -4,13 +4,25 @@ SynthLang module base classes.
 This module defines the base classes for SynthLang modules that provide
 various functionality like translation, generation, optimization, etc.
 """
+import asyncio
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import aiosqlite
+import orjson
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Largest number of passes a single optimization may run
+MAX_ITERATIONS = 20
+
+# Largest number of generations a single evolution may run
+MAX_GENERATIONS = 100
+
 
 class SynthLangModule(ABC):
     """
@@ -182,6 +194,21 @@ class PromptOptimizer(SynthLangModule):
         """
         return self.lm is not None
     
+    def optimize_step(self, prompt: str) -> Tuple[str, List[str]]:
+        """
+        Run a single optimization pass over a prompt.
+        
+        Args:
+            prompt: The prompt to improve
+            
+        Returns:
+            Tuple of the improved prompt and the improvements made
+        """
+        # This is a placeholder implementation
+        # In a real implementation, this would use the language model
+        # to optimize the prompt
+        return prompt, ["Placeholder optimization"]
+    
     def optimize(self, prompt: str, max_iterations: int = 5) -> OptimizationResult:
         """
         Optimize a prompt using SynthLang.
@@ -197,13 +224,61 @@ class PromptOptimizer(SynthLangModule):
             logger.warning("Optimizer not properly configured")
             return {"optimized": prompt, "improvements": [], "metrics": {}, "original": prompt}
         
-        # This is a placeholder implementation
-        # In a real implementation, this would use the language model
-        # to optimize the prompt
+        current, improvements, iterations = prompt, [], 0
+        
+        # Iterate until a pass leaves the prompt unchanged
+        for iterations in range(1, max_iterations + 1):
+            optimized, step_improvements = self.optimize_step(current)
+            improvements.extend(step_improvements)
+            converged = optimized == current
+            current = optimized
+            if converged:
+                break
+        
         return {
-            "optimized": prompt,
-            "improvements": ["Placeholder optimization"],
-            "metrics": {"iterations": 1},
+            "optimized": current,
+            "improvements": improvements,
+            "metrics": {"iterations": iterations},
+            "original": prompt
+        }
+    
+    async def optimize_stream(self, prompt: str, max_iterations: int = 5) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Optimize a prompt, yielding progress after every iteration.
+        
+        Args:
+            prompt: The prompt to optimize
+            max_iterations: Maximum optimization iterations
+            
+        Yields:
+            One "iteration" event per pass, then a "result" event
+        """
+        if not self.validate():
+            logger.warning("Optimizer not properly configured")
+            yield {"event": "result", "optimized": prompt, "improvements": [], "metrics": {}, "original": prompt}
+            return
+        
+        current, improvements, iterations = prompt, [], 0
+        
+        for iterations in range(1, max_iterations + 1):
+            optimized, step_improvements = await asyncio.to_thread(self.optimize_step, current)
+            improvements.extend(step_improvements)
+            converged = optimized == current
+            current = optimized
+            yield {
+                "event": "iteration",
+                "iteration": iterations,
+                "optimized": current,
+                "improvements": step_improvements
+            }
+            if converged:
+                break
+        
+        yield {
+            "event": "result",
+            "optimized": current,
+            "improvements": improvements,
+            "metrics": {"iterations": iterations},
             "original": prompt
         }
 
@@ -225,6 +300,79 @@ class PromptEvolver(SynthLangModule):
         """
         return self.lm is not None
     
+    # Number of variants created from the current best prompt per generation
+    population_size = 4
+    
+    # Whether mutate and score call the language model; the placeholder
+    # versions below cannot improve on the seed prompt, so evolution stops
+    # after one generation and runs on the calling thread until they do
+    uses_lm = False
+    
+    def mutate(self, prompt: str, index: int) -> str:
+        """
+        Create a variant of a prompt.
+        
+        Args:
+            prompt: The prompt to mutate
+            index: Position of the variant within its generation
+            
+        Returns:
+            The mutated prompt
+        """
+        # This is a placeholder implementation
+        # In a real implementation, this would use the language model
+        # to rewrite the prompt
+        return prompt
+    
+    def score(self, prompt: str) -> float:
+        """
+        Score a prompt variant.
+        
+        Args:
+            prompt: The prompt to score
+            
+        Returns:
+            Fitness score between 0 and 1
+        """
+        # This is a placeholder implementation
+        # In a real implementation, this would use the language model
+        # to evaluate the prompt
+        return 0.5
+    
+    def _generation_count(self, n_generations: int) -> int:
+        """
+        Limit a requested number of generations to what this evolver runs.
+        
+        Args:
+            n_generations: Requested number of generations
+            
+        Returns:
+            The requested number, capped at MAX_GENERATIONS, or at one
+            generation while mutate and score are placeholders
+        """
+        return min(n_generations, MAX_GENERATIONS if self.uses_lm else 1)
+    
+    async def _call_lm(self, func, *args, semaphore: Optional[asyncio.Semaphore] = None):
+        """
+        Call mutate or score, in a worker thread if it uses the language model.
+        
+        Args:
+            func: The method to call
+            *args: Arguments for the method
+            semaphore: Optional semaphore bounding concurrent LM calls
+            
+        Returns:
+            The method's result
+        """
+        if not self.uses_lm:
+            return func(*args)
+        
+        if semaphore is None:
+            return await asyncio.to_thread(func, *args)
+        
+        async with semaphore:
+            return await asyncio.to_thread(func, *args)
+    
     def evolve(self, seed_prompt: str, n_generations: int = 10) -> Dict[str, Any]:
         """
         Evolve a prompt using SynthLang.
@@ -240,14 +388,112 @@ class PromptEvolver(SynthLangModule):
             logger.warning("Evolver not properly configured")
             return {"best_prompt": seed_prompt, "fitness": {}, "generations": 0}
         
-        # This is a placeholder implementation
-        # In a real implementation, this would use the language model
-        # to evolve the prompt
+        n_generations = self._generation_count(n_generations)
+        
+        best_prompt, best_score = seed_prompt, self.score(seed_prompt)
+        total_variants = successful_mutations = 0
+        
+        for _ in range(n_generations):
+            variants = [self.mutate(best_prompt, i) for i in range(self.population_size)]
+            scores = [self.score(variant) for variant in variants]
+            total_variants += len(variants)
+            
+            for variant, variant_score in zip(variants, scores):
+                if variant_score > best_score:
+                    best_prompt, best_score = variant, variant_score
+                    successful_mutations += 1
+        
         return {
-            "best_prompt": seed_prompt,
-            "fitness": {"score": 0.5},
-            "generations": 1
+            "best_prompt": best_prompt,
+            "fitness": {"score": best_score},
+            "generations": n_generations,
+            "total_variants": total_variants,
+            "successful_mutations": successful_mutations
+        }
+    
+    async def evolve_stream(
+        self,
+        seed_prompt: str,
+        n_generations: int = 10,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Evolve a prompt, yielding progress after every generation.
+        
+        Variants within a generation are created and scored concurrently.
+        
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            semaphore: Optional semaphore bounding concurrent scoring calls
+            
+        Yields:
+            One "generation" event per generation, then a "result" event
+        """
+        if not self.validate():
+            logger.warning("Evolver not properly configured")
+            yield {"event": "result", "best_prompt": seed_prompt, "fitness": {}, "generations": 0}
+            return
+        
+        n_generations = self._generation_count(n_generations)
+        best_prompt = seed_prompt
+        best_score = await self._call_lm(self.score, seed_prompt, semaphore=semaphore)
+        total_variants = successful_mutations = 0
+        
+        for generation in range(1, n_generations + 1):
+            variants = await asyncio.gather(*(
+                self._call_lm(self.mutate, best_prompt, i, semaphore=semaphore)
+                for i in range(self.population_size)
+            ))
+            scores = await asyncio.gather(
+                *(self._call_lm(self.score, variant, semaphore=semaphore) for variant in variants)
+            )
+            total_variants += len(variants)
+            
+            for variant, variant_score in zip(variants, scores):
+                if variant_score > best_score:
+                    best_prompt, best_score = variant, variant_score
+                    successful_mutations += 1
+            
+            yield {
+                "event": "generation",
+                "generation": generation,
+                "best_prompt": best_prompt,
+                "fitness": {"score": best_score}
+            }
+        
+        yield {
+            "event": "result",
+            "best_prompt": best_prompt,
+            "fitness": {"score": best_score},
+            "generations": n_generations,
+            "total_variants": total_variants,
+            "successful_mutations": successful_mutations
         }
+    
+    async def evolve_async(
+        self,
+        seed_prompt: str,
+        n_generations: int = 10,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
+        """
+        Evolve a prompt, scoring each generation's variants concurrently.
+        
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            semaphore: Optional semaphore bounding concurrent scoring calls
+            
+        Returns:
+            Dictionary containing evolution result
+        """
+        result: Dict[str, Any] = {}
+        async for step in self.evolve_stream(seed_prompt, n_generations, semaphore):
+            result = step
+        
+        result.pop("event", None)
+        return result
 
 
 class PromptClassifier(SynthLangModule):
@@ -307,7 +553,24 @@ class PromptManager:
     Module for managing saved prompts.
     
     This module provides functionality for saving, loading, and
-    comparing prompts.
+    comparing prompts. Prompts are stored in a SQLite database accessed
+    through aiosqlite so storage operations never block the event loop.
+    """
+    
+    # Schema for the prompt store
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS prompts (
+            name TEXT PRIMARY KEY,
+            prompt TEXT NOT NULL,
+            metadata_json TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """
+    
+    # Expression index so per-user listings are an index lookup, not a scan
+    USER_INDEX = """
+        CREATE INDEX IF NOT EXISTS prompts_user_id
+        ON prompts (json_extract(metadata_json, '$.user_id'), name)
     """
     
     def __init__(self, storage_dir: Optional[str] = None):
@@ -318,8 +581,46 @@ class PromptManager:
             storage_dir: Optional directory for prompt storage
         """
         self.storage_dir = storage_dir or "prompts"
+        self.db_path = os.path.join(self.storage_dir, "prompts.db")
+        self._db: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
     
-    def save(self, name: str, prompt: str, metadata: Optional[Dict] = None) -> None:
+    async def connect(self) -> aiosqlite.Connection:
+        """
+        Open the prompt database, creating the schema on first use.
+        
+        Returns:
+            The shared database connection
+        """
+        if self._db is not None:
+            return self._db
+        
+        async with self._connect_lock:
+            if self._db is None:
+                os.makedirs(self.storage_dir, exist_ok=True)
+                db = await aiosqlite.connect(self.db_path)
+                await db.execute("PRAGMA journal_mode=WAL")
+                await db.execute(self.SCHEMA)
+                await db.execute(self.USER_INDEX)
+                await db.commit()
+                self._db = db
+                logger.info(f"Opened prompt store at {self.db_path}")
+        
+        return self._db
+    
+    async def close(self) -> None:
+        """Close the prompt database connection if it is open."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+    
+    async def save(
+        self,
+        name: str,
+        prompt: str,
+        metadata: Optional[Dict] = None,
+        user_id: Optional[str] = None
+    ) -> None:
         """
         Save a prompt with metadata.
         
@@ -327,12 +628,31 @@ class PromptManager:
             name: Name to save prompt under
             prompt: The prompt content
             metadata: Optional metadata about the prompt
-        """
-        # This is a placeholder implementation
-        # In a real implementation, this would save the prompt to a file
-        logger.info(f"Saving prompt: {name}")
+            user_id: Only replace an existing prompt if its metadata names this user
+            
+        Raises:
+            PermissionError: If a prompt with the name belongs to a different user
+        """
+        db = await self.connect()
+        query = (
+            "INSERT INTO prompts (name, prompt, metadata_json, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET prompt = excluded.prompt, "
+            "metadata_json = excluded.metadata_json, updated_at = excluded.updated_at"
+        )
+        params = (name, prompt, orjson.dumps(metadata or {}).decode(), time.time())
+        if user_id is not None:
+            # Check ownership in the same statement, so the check cannot race the write
+            query += " WHERE json_extract(prompts.metadata_json, '$.user_id') = ?"
+            params += (user_id,)
+        
+        async with db.execute(query, params) as cursor:
+            saved = cursor.rowcount > 0
+        await db.commit()
+        
+        if not saved:
+            raise PermissionError(f"Prompt '{name}' belongs to another user")
     
-    def load(self, name: str) -> Dict[str, Any]:
+    async def load(self, name: str) -> Dict[str, Any]:
         """
         Load a saved prompt.
         
@@ -341,47 +661,151 @@ class PromptManager:
             
         Returns:
             Dictionary containing prompt data
+            
+        Raises:
+            FileNotFoundError: If no prompt is stored under the name
+        """
+        db = await self.connect()
+        async with db.execute(
+            "SELECT prompt, metadata_json FROM prompts WHERE name = ?", (name,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        
+        if row is None:
+            raise FileNotFoundError(f"No prompt found with name: {name}")
+        
+        return {"name": name, "prompt": row[0], "metadata": orjson.loads(row[1])}
+    
+    async def load_many(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would load the prompt from a file
-        logger.info(f"Loading prompt: {name}")
-        return {"name": name, "prompt": "", "metadata": {}}
+        Load several saved prompts with a single query.
+        
+        Args:
+            names: Names of prompts to load
+            
+        Returns:
+            Dictionary mapping each stored name to its prompt data; missing
+            names are left out
+        """
+        db = await self.connect()
+        placeholders = ", ".join("?" for _ in names)
+        async with db.execute(
+            f"SELECT name, prompt, metadata_json FROM prompts WHERE name IN ({placeholders})",
+            tuple(names)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        
+        return {
+            name: {"name": name, "prompt": prompt, "metadata": orjson.loads(metadata_json)}
+            for name, prompt, metadata_json in rows
+        }
     
-    def list(self) -> List[Dict[str, Any]]:
+    async def list(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        List all saved prompts.
+        List saved prompts.
         
+        Args:
+            user_id: Only list prompts whose metadata names this user
+            
         Returns:
             List of prompt data dictionaries
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would list all saved prompts
-        logger.info("Listing prompts")
-        return []
+        db = await self.connect()
+        if user_id is None:
+            query, params = "SELECT name, prompt, metadata_json FROM prompts ORDER BY name", ()
+        else:
+            query = (
+                "SELECT name, prompt, metadata_json FROM prompts "
+                "WHERE json_extract(metadata_json, '$.user_id') = ? ORDER BY name"
+            )
+            params = (user_id,)
+        
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+        
+        return [
+            {"name": name, "prompt": prompt, "metadata": orjson.loads(metadata_json)}
+            for name, prompt, metadata_json in rows
+        ]
     
-    def delete(self, name: str) -> None:
+    async def delete(self, name: str, user_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Delete a saved prompt.
         
         Args:
             name: Name of prompt to delete
-        """
-        # This is a placeholder implementation
-        # In a real implementation, this would delete the prompt file
-        logger.info(f"Deleting prompt: {name}")
+            user_id: Only delete the prompt if its metadata names this user
+            
+        Returns:
+            Metadata of the deleted prompt
+            
+        Raises:
+            FileNotFoundError: If no prompt is stored under the name
+            PermissionError: If the prompt belongs to a different user
+        """
+        db = await self.connect()
+        if user_id is None:
+            query, params = "DELETE FROM prompts WHERE name = ? RETURNING metadata_json", (name,)
+        else:
+            query = (
+                "DELETE FROM prompts WHERE name = ? "
+                "AND json_extract(metadata_json, '$.user_id') = ? RETURNING metadata_json"
+            )
+            params = (name, user_id)
+        
+        async with db.execute(query, params) as cursor:
+            row = await cursor.fetchone()
+        await db.commit()
+        
+        if row is not None:
+            return orjson.loads(row[0])
+        
+        # Nothing was deleted; report whether the prompt exists at all
+        if user_id is not None and await self.load_many([name]):
+            raise PermissionError(f"Prompt '{name}' belongs to another user")
+        raise FileNotFoundError(f"No prompt found with name: {name}")
     
-    def compare(self, name1: str, name2: str) -> Dict[str, Any]:
+    async def compare(
+        self,
+        name1: str,
+        name2: str,
+        loaded: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Compare two saved prompts.
         
         Args:
             name1: First prompt name
             name2: Second prompt name
+            loaded: Prompt data already loaded with load_many, if any
             
         Returns:
             Dictionary containing comparison results
+            
+        Raises:
+            FileNotFoundError: If either prompt does not exist
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would compare the two prompts
-        logger.info(f"Comparing prompts: {name1} and {name2}")
-        return {"prompts": {}, "metrics": {}, "differences": {}}
\ No newline at end of file
+        if loaded is None:
+            loaded = await self.load_many([name1, name2])
+        
+        for name in (name1, name2):
+            if name not in loaded:
+                raise FileNotFoundError(f"No prompt found with name: {name}")
+        
+        prompt1 = loaded[name1]["prompt"]
+        prompt2 = loaded[name2]["prompt"]
+        
+        metrics = {
+            name: {"length": len(text), "word_count": len(text.split())}
+            for name, text in ((name1, prompt1), (name2, prompt2))
+        }
+        
+        return {
+            "prompts": {name1: prompt1, name2: prompt2},
+            "metrics": metrics,
+            "differences": {
+                "length_diff": metrics[name2]["length"] - metrics[name1]["length"],
+                "word_count_diff": metrics[name2]["word_count"] - metrics[name1]["word_count"],
+                "identical": prompt1 == prompt2
+            }
+        }
@@ -3,15 +3,25 @@ SynthLang API endpoints.
 
 This module defines the FastAPI endpoints for SynthLang functionality.
 """
+import asyncio
+import hashlib
 import logging
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import uuid
+from typing import List, Dict, Any, AsyncIterator, FrozenSet, NamedTuple, Optional, Tuple, Type, TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException, Header
-from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_404_NOT_FOUND
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Header, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.status import (
+    HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
+)
 
 from src.app import auth
+from src.app.config import SYNTHLANG_MAX_CONCURRENCY
 from src.app.synthlang.api import synthlang_api
 from src.app.synthlang.models import (
     TranslateRequest, TranslateResponse,
@@ -23,11 +33,13 @@ from src.app.synthlang.models import (
     LoadPromptRequest, LoadPromptResponse,
     ListPromptsResponse,
     DeletePromptRequest, DeletePromptResponse,
-    ComparePromptsRequest, ComparePromptsResponse
+    ComparePromptsRequest, ComparePromptsResponse,
+    AbortResponse
 )
 from src.app.synthlang.utils import (
     get_dspy_lm,
-    format_synthlang_response
+    format_synthlang_response,
+    now_iso
 )
 
 # Configure logging
@@ -36,26 +48,221 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/v1/synthlang", tags=["synthlang"])
 
+# API version reported in every response
+VERSION = "1.0"
+
+# Bound the number of in-flight language model operations so bursts of
+# optimize/evolve requests queue here instead of overloading the provider
+_lm_sem = asyncio.Semaphore(SYNTHLANG_MAX_CONCURRENCY)
+
+# Snapshots of the saved prompts per user: user ID -> (monotonic time taken, prompts)
+_prompts_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Cache key for the unfiltered list served to admins
+ADMIN_PROMPTS_KEY = "__admin__"
+
+# Seconds a prompts snapshot is served before the store is queried again
+PROMPTS_CACHE_TTL = 5.0
+
+# Type of a msgspec request body
+T = TypeVar("T", bound=msgspec.Struct)
+
+
+class AuthContext(NamedTuple):
+    """Credentials resolved from an Authorization header."""
+    api_key: str
+    user_id: str
+    roles: FrozenSet[str]
 
-def get_timestamp() -> str:
-    """Get current timestamp in ISO format."""
-    return datetime.now().isoformat()
 
+# Resolved credentials keyed by hashed Authorization header: digest -> (expiry, credentials)
+_auth_cache: Dict[bytes, Tuple[float, AuthContext]] = {}
 
-def get_version() -> str:
-    """Get API version."""
-    return "1.0"
+# Seconds resolved credentials are reused before the key and roles are looked up again
+AUTH_CACHE_TTL = 30.0
 
+# Maximum number of cached credentials; the oldest entry is evicted first
+AUTH_CACHE_MAX_ITEMS = 10000
 
-def verify_auth(authorization: Optional[str] = Header(None)) -> str:
+
+def _stamp(response: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Verify authorization header and return API key.
+    Add version and timestamp to a response dict in place.
+    
+    Args:
+        response: The response dict to stamp
+        
+    Returns:
+        The same dict, stamped
+    """
+    response["version"] = VERSION
+    response["timestamp"] = now_iso()
+    return response
+
+
+def _body_schema(body_type: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """
+    Build the OpenAPI request body for a route that decodes a msgspec struct.
+    
+    Args:
+        body_type: The msgspec struct the route decodes
+        
+    Returns:
+        The openapi_extra dict describing the request body
+    """
+    _, components = msgspec.json.schema_components([body_type])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[body_type.__name__]}}
+        }
+    }
+
+
+async def _decode(request: Request, body_type: Type[T]) -> T:
+    """
+    Decode and validate a JSON request body with msgspec.
+    
+    Errors are raised as RequestValidationError so they get the same 422
+    response as FastAPI's own validation errors.
+    
+    Args:
+        request: The incoming request
+        body_type: The msgspec struct to decode into
+        
+    Returns:
+        The decoded request body
+        
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not match the struct
+    """
+    try:
+        return msgspec.json.decode(await request.body(), type=body_type)
+    except msgspec.DecodeError as e:
+        # msgspec reports the failing field as a "- at `$.field`" suffix
+        message, _, path = str(e).partition(" - at `$")
+        loc = ["body", *filter(None, path.rstrip("`").split("."))]
+        error_type = "value_error" if isinstance(e, msgspec.ValidationError) else "json_invalid"
+        raise RequestValidationError([{"loc": loc, "msg": message, "type": error_type}])
+
+
+def _error(status_code: int, message: str, error_type: str) -> ORJSONResponse:
+    """
+    Build an error response in the API's error format.
+    
+    Handlers return this directly rather than raising HTTPException, which
+    skips the exception handler round trip on expected errors such as
+    missing prompts.
+    
+    Args:
+        status_code: The HTTP status code
+        message: The error message
+        error_type: The error type
+        
+    Returns:
+        The error response
+    """
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "error": {
+                "message": message,
+                "type": error_type,
+                "code": status_code
+            },
+            "version": VERSION,
+            "timestamp": now_iso()
+        }
+    )
+
+
+def _invalidate_prompts(*user_ids: Optional[str]) -> None:
+    """
+    Drop the cached prompt lists of the given users and of admins.
+    
+    Args:
+        user_ids: Users whose prompts changed
+    """
+    _prompts_cache.pop(ADMIN_PROMPTS_KEY, None)
+    for user_id in user_ids:
+        _prompts_cache.pop(user_id, None)
+
+
+async def _sse(steps: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Format progress events as server-sent events.
+    
+    Events are encoded straight to bytes. orjson only calls the str()
+    fallback for values it cannot serialize natively, so JSON-safe events
+    are never walked or copied.
+    
+    Args:
+        steps: The progress events to send
+        
+    Yields:
+        SSE "data:" frames, terminated by [DONE]
+    """
+    async for step in steps:
+        yield b"data: " + orjson.dumps(step, default=str) + b"\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+async def _gated(steps: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """Hold a language model slot for the lifetime of a progress stream."""
+    async with _lm_sem:
+        async for step in steps:
+            yield step
+
+
+async def ensure_language_model() -> None:
+    """
+    Attach the shared DSPy language model to the SynthLang API on first use.
+    
+    This runs on the event loop, so concurrent first requests cannot race
+    to construct more than one model.
+    """
+    if not synthlang_api.lm:
+        lm = get_dspy_lm()
+        if lm:
+            synthlang_api.set_language_model(lm)
+
+
+def invalidate_auth_cache(user_id: Optional[str] = None) -> None:
+    """
+    Drop cached credentials so they are resolved again on next use.
+    
+    Registered with auth.on_roles_changed, so role changes made through
+    the auth package apply to the next request.
+    
+    Args:
+        user_id: User whose credentials to drop; all are dropped if None
+    """
+    if user_id is None:
+        _auth_cache.clear()
+        return
+    
+    for digest in [d for d, (_, creds) in _auth_cache.items() if creds.user_id == user_id]:
+        del _auth_cache[digest]
+
+
+auth.on_roles_changed(invalidate_auth_cache)
+
+
+def verify_auth(authorization: Optional[str] = Header(None)) -> AuthContext:
+    """
+    Verify authorization header and resolve the caller's credentials.
+    
+    Resolved credentials are cached for AUTH_CACHE_TTL seconds. Keys
+    removed from auth.API_KEYS stop working immediately, and role changes
+    made through the auth package drop the affected entries. Changes made
+    any other way, such as in another worker process or directly in the
+    database, take effect once the entry expires.
     
     Args:
         authorization: Authorization header
         
     Returns:
-        API key
+        The API key, user ID and roles of the caller
         
     Raises:
         HTTPException: If API key is missing or invalid
@@ -69,495 +276,580 @@ def verify_auth(authorization: Optional[str] = Header(None)) -> str:
                     "type": "auth_error",
                     "code": HTTP_401_UNAUTHORIZED
                 },
-                "version": get_version(),
-                "timestamp": get_timestamp()
+                "version": VERSION,
+                "timestamp": now_iso()
             }
         )
     
-    return auth.verify_api_key(authorization)
+    # Serve hot keys from the cache
+    digest = hashlib.blake2b(authorization.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    cached = _auth_cache.get(digest)
+    if cached and cached[0] > now and cached[1].api_key in auth.API_KEYS:
+        return cached[1]
+    
+    # Resolve the key, user and roles
+    api_key = auth.verify_api_key(authorization)
+    user_id = auth.get_user_id(api_key)
+    credentials = AuthContext(api_key, user_id, frozenset(auth.get_user_roles(user_id)))
+    
+    # Evict the oldest entry when the cache is full
+    _auth_cache.pop(digest, None)
+    if len(_auth_cache) >= AUTH_CACHE_MAX_ITEMS:
+        _auth_cache.pop(next(iter(_auth_cache)))
+    _auth_cache[digest] = (now + AUTH_CACHE_TTL, credentials)
+    
+    return credentials
+
+
+def _authorize(role: str):
+    """
+    Create a dependency that authorizes a request for a role.
+    
+    The dependency checks the caller's credentials, rate limit and role in
+    one step, so handlers receive an already-authorized caller.
+    
+    Args:
+        role: The role the endpoint requires
+        
+    Returns:
+        The dependency function
+    """
+    def dependency(
+        request: Request,
+        credentials: AuthContext = Depends(verify_auth)
+    ) -> AuthContext:
+        # Check rate limit
+        auth.check_rate_limit(request, credentials.api_key, credentials.user_id)
+        
+        # Check if user has required role
+        if role not in credentials.roles:
+            raise HTTPException(
+                status_code=HTTP_403_FORBIDDEN,
+                detail={
+                    "error": {
+                        "message": f"This endpoint requires the '{role}' role",
+                        "type": "permission_denied",
+                        "code": HTTP_403_FORBIDDEN
+                    },
+                    "version": VERSION,
+                    "timestamp": now_iso()
+                }
+            )
+        
+        return credentials
+    
+    return dependency
+
 
+# Dependencies for endpoints open to all users and to premium users
+authorize_basic = _authorize("basic")
+authorize_premium = _authorize("premium")
 
-@router.post("/translate", response_model=TranslateResponse)
+
+@router.post(
+    "/translate",
+    responses={200: {"model": TranslateResponse}},
+    dependencies=[Depends(ensure_language_model)],
+    openapi_extra=_body_schema(TranslateRequest)
+)
 async def translate(
-    request: TranslateRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Translate natural language to SynthLang format.
     
     Args:
-        request: The translation request
-        api_key: The API key
+        http_request: The HTTP request carrying a TranslateRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The translation response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, TranslateRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Translation request from user {user_id}")
+    logger.info("Translation request from user %s", user_id)
     
     # Call SynthLang API
-    result = synthlang_api.translate(request.text, request.instructions)
-    
-    # Format response
-    return {
-        "source": result.get("source", request.text),
-        "target": result.get("target", ""),
-        "explanation": result.get("explanation", ""),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    async with _lm_sem:
+        result = await run_in_threadpool(synthlang_api.translate, request.text, request.instructions)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "source": request.text,
+        "target": "",
+        "explanation": "",
+        **result
+    }))
 
 
-@router.post("/generate", response_model=GenerateResponse)
+@router.post(
+    "/generate",
+    responses={200: {"model": GenerateResponse}},
+    dependencies=[Depends(ensure_language_model)],
+    openapi_extra=_body_schema(GenerateRequest)
+)
 async def generate(
-    request: GenerateRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Generate a system prompt from task description.
     
     Args:
-        request: The generation request
-        api_key: The API key
+        http_request: The HTTP request carrying a GenerateRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The generation response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, GenerateRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Generation request from user {user_id}")
+    logger.info("Generation request from user %s", user_id)
     
     # Call SynthLang API
-    result = synthlang_api.generate(request.task_description)
-    
-    # Format response
-    return {
-        "prompt": result.get("prompt", ""),
-        "rationale": result.get("rationale", ""),
-        "metadata": result.get("metadata", {}),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    async with _lm_sem:
+        result = await run_in_threadpool(synthlang_api.generate, request.task_description)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "prompt": "",
+        "rationale": "",
+        "metadata": {},
+        **result
+    }))
 
 
-@router.post("/optimize", response_model=OptimizeResponse)
+@router.post(
+    "/optimize",
+    responses={200: {"model": OptimizeResponse}},
+    dependencies=[Depends(ensure_language_model)],
+    openapi_extra=_body_schema(OptimizeRequest)
+)
 async def optimize(
-    request: OptimizeRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_premium)
 ):
     """
     Optimize a prompt for clarity, specificity, and efficiency.
     
     Args:
-        request: The optimization request
-        api_key: The API key
+        http_request: The HTTP request carrying an OptimizeRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The optimization response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, OptimizeRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "premium")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Optimization request from user {user_id}")
+    logger.info("Optimization request from user %s", user_id)
     
-    # Call SynthLang API
-    result = synthlang_api.optimize(request.prompt, request.max_iterations)
+    # Stream per-iteration progress if requested
+    if request.stream:
+        request_id = f"synthlang-{uuid.uuid4().hex}"
+        steps = synthlang_api.optimize_stream(request_id, request.prompt, request.max_iterations, user_id)
+        return StreamingResponse(_sse(_gated(steps)), media_type="text/event-stream")
     
-    # Format response
-    return {
-        "optimized": result.get("optimized", request.prompt),
-        "improvements": result.get("improvements", []),
-        "metrics": result.get("metrics", {}),
-        "original": result.get("original", request.prompt),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    # Call SynthLang API
+    async with _lm_sem:
+        result = await run_in_threadpool(synthlang_api.optimize, request.prompt, request.max_iterations)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "optimized": request.prompt,
+        "improvements": [],
+        "metrics": {},
+        "original": request.prompt,
+        **result
+    }))
 
 
-@router.post("/evolve", response_model=EvolveResponse)
+@router.post(
+    "/evolve",
+    responses={200: {"model": EvolveResponse}},
+    dependencies=[Depends(ensure_language_model)],
+    openapi_extra=_body_schema(EvolveRequest)
+)
 async def evolve(
-    request: EvolveRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_premium)
 ):
     """
     Evolve a prompt using genetic algorithms.
     
     Args:
-        request: The evolution request
-        api_key: The API key
+        http_request: The HTTP request carrying an EvolveRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The evolution response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, EvolveRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "premium")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Evolution request from user {user_id}")
+    logger.info("Evolution request from user %s", user_id)
     
-    # Call SynthLang API
-    result = synthlang_api.evolve(request.seed_prompt, request.n_generations)
+    # Stream per-generation progress if requested
+    if request.stream:
+        request_id = f"synthlang-{uuid.uuid4().hex}"
+        steps = synthlang_api.evolve_stream(
+            request_id, request.seed_prompt, request.n_generations, _lm_sem, user_id
+        )
+        return StreamingResponse(_sse(steps), media_type="text/event-stream")
     
-    # Format response
-    return {
-        "best_prompt": result.get("best_prompt", request.seed_prompt),
-        "fitness": result.get("fitness", {}),
-        "generations": result.get("generations", 0),
-        "total_variants": result.get("total_variants", 0),
-        "successful_mutations": result.get("successful_mutations", 0),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    # Call SynthLang API
+    # Variants are scored concurrently, each scoring call taking an LM slot
+    result = await synthlang_api.evolve_async(request.seed_prompt, request.n_generations, _lm_sem)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "best_prompt": request.seed_prompt,
+        "fitness": {},
+        "generations": 0,
+        "total_variants": 0,
+        "successful_mutations": 0,
+        **result
+    }))
 
 
-@router.post("/classify", response_model=ClassifyResponse)
+@router.post(
+    "/classify",
+    responses={200: {"model": ClassifyResponse}},
+    dependencies=[Depends(ensure_language_model)],
+    openapi_extra=_body_schema(ClassifyRequest)
+)
 async def classify(
-    request: ClassifyRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Classify a prompt into categories.
     
     Args:
-        request: The classification request
-        api_key: The API key
+        http_request: The HTTP request carrying a ClassifyRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The classification response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, ClassifyRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Classification request from user {user_id}")
+    logger.info("Classification request from user %s", user_id)
     
     # Call SynthLang API
-    result = synthlang_api.classify(request.text, request.labels)
+    async with _lm_sem:
+        result = await run_in_threadpool(synthlang_api.classify, request.text, request.labels)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "input": request.text,
+        "label": "",
+        "explanation": "",
+        **result
+    }))
+
+
+@router.post("/abort/{request_id}", responses={200: {"model": AbortResponse}})
+async def abort(
+    request_id: str,
+    credentials: AuthContext = Depends(authorize_basic)
+):
+    """
+    Stop a streaming optimize or evolve operation after its current step.
     
-    # Format response
-    return {
-        "input": result.get("input", request.text),
-        "label": result.get("label", ""),
-        "explanation": result.get("explanation", ""),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    Only the user who started the stream can abort it. Streams are tracked
+    per worker process, so when the server runs several workers the abort
+    reports success only if it reaches the worker serving the stream;
+    closing the stream's connection stops it on any worker.
+    
+    Args:
+        request_id: ID reported in the operation's progress events
+        credentials: The caller's API key, user ID and roles
+        
+    Returns:
+        The abort response
+    """
+    # Log the request
+    logger.info("Abort request for %s from user %s", request_id, credentials.user_id)
+    
+    return ORJSONResponse(_stamp({
+        "success": synthlang_api.abort(request_id, credentials.user_id),
+        "request_id": request_id
+    }))
+
+
+@router.get("/stats")
+async def stats(
+    credentials: AuthContext = Depends(verify_auth)
+):
+    """
+    Report SynthLang language model concurrency usage.
+    
+    Args:
+        credentials: The caller's API key, user ID and roles
+        
+    Returns:
+        The configured concurrency limit and the number of free slots
+    """
+    return ORJSONResponse(_stamp({
+        "max_concurrency": SYNTHLANG_MAX_CONCURRENCY,
+        "available_slots": _lm_sem._value
+    }))
 
 
 # Prompt Management Endpoints
-@router.post("/prompts/save", response_model=SavePromptResponse)
+@router.post(
+    "/prompts/save",
+    responses={200: {"model": SavePromptResponse}},
+    openapi_extra=_body_schema(SavePromptRequest)
+)
 async def save_prompt(
-    request: SavePromptRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Save a prompt for later use.
     
     Args:
-        request: The save prompt request
-        api_key: The API key
+        http_request: The HTTP request carrying a SavePromptRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The save prompt response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, SavePromptRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Save prompt request from user {user_id}")
+    logger.info("Save prompt request from user %s", user_id)
     
     # Add user ID to metadata
     metadata = request.metadata or {}
     metadata["user_id"] = user_id
     
-    # Call SynthLang API
-    synthlang_api.save_prompt(request.name, request.prompt, metadata)
+    # Save the prompt, refusing to replace another user's prompt unless admin
+    owner = None if "admin" in credentials.roles else user_id
+    try:
+        await synthlang_api.save_prompt_async(request.name, request.prompt, metadata, owner)
+    except PermissionError:
+        return _error(HTTP_403_FORBIDDEN, f"Prompt '{request.name}' belongs to another user", "permission_denied")
+    
+    # Invalidate the cached prompt lists; an admin may have replaced any
+    # user's prompt, so their save drops every list
+    if owner is None:
+        _prompts_cache.clear()
+    else:
+        _invalidate_prompts(user_id)
     
     # Format response
-    return {
+    return ORJSONResponse(_stamp({
         "success": True,
-        "name": request.name,
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+        "name": request.name
+    }))
 
 
-@router.post("/prompts/load", response_model=LoadPromptResponse)
+@router.post(
+    "/prompts/load",
+    responses={200: {"model": LoadPromptResponse}},
+    openapi_extra=_body_schema(LoadPromptRequest)
+)
 async def load_prompt(
-    request: LoadPromptRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Load a saved prompt.
     
     Args:
-        request: The load prompt request
-        api_key: The API key
+        http_request: The HTTP request carrying a LoadPromptRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The load prompt response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
+    # Decode the request body
+    request = await _decode(http_request, LoadPromptRequest)
     
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Load prompt request from user {user_id}")
+    logger.info("Load prompt request from user %s", user_id)
     
     # Call SynthLang API
-    result = synthlang_api.load_prompt(request.name)
+    result = await synthlang_api.load_prompt_async(request.name)
     
     # Check if prompt exists
     if not result.get("prompt"):
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail={
-                "error": {
-                    "message": f"Prompt '{request.name}' not found",
-                    "type": "not_found",
-                    "code": HTTP_404_NOT_FOUND
-                },
-                "version": get_version(),
-                "timestamp": get_timestamp()
-            }
-        )
+        return _error(HTTP_404_NOT_FOUND, f"Prompt '{request.name}' not found", "not_found")
     
-    # Format response
-    return {
-        "name": result.get("name", request.name),
-        "prompt": result.get("prompt", ""),
-        "metadata": result.get("metadata", {}),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "name": request.name,
+        "prompt": "",
+        "metadata": {},
+        **result
+    }))
 
 
-@router.get("/prompts/list", response_model=ListPromptsResponse)
+@router.get("/prompts/list", responses={200: {"model": ListPromptsResponse}})
 async def list_prompts(
-    api_key: str = Depends(verify_auth)
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     List all saved prompts.
     
     Args:
-        api_key: The API key
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The list prompts response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(None, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"List prompts request from user {user_id}")
+    logger.info("List prompts request from user %s", user_id)
     
-    # Call SynthLang API
-    prompts = synthlang_api.list_prompts()
+    # Admins see every prompt; other users only their own
+    owner = None if "admin" in credentials.roles else user_id
+    cache_key = owner or ADMIN_PROMPTS_KEY
     
-    # Filter prompts by user ID for non-admin users
-    if not auth.has_role(user_id, "admin"):
-        prompts = [p for p in prompts if p.get("metadata", {}).get("user_id") == user_id]
+    # Serve from the cached snapshot while it is fresh
+    now = time.monotonic()
+    cached = _prompts_cache.get(cache_key)
+    if cached and now - cached[0] < PROMPTS_CACHE_TTL:
+        prompts = cached[1]
+    else:
+        prompts = await synthlang_api.list_prompts_async(owner)
+        _prompts_cache[cache_key] = (now, prompts)
     
     # Format response
-    return {
+    return ORJSONResponse(_stamp({
         "prompts": prompts,
-        "count": len(prompts),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+        "count": len(prompts)
+    }))
 
 
-@router.post("/prompts/delete", response_model=DeletePromptResponse)
+@router.post(
+    "/prompts/delete",
+    responses={200: {"model": DeletePromptResponse}},
+    openapi_extra=_body_schema(DeletePromptRequest)
+)
 async def delete_prompt(
-    request: DeletePromptRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_basic)
 ):
     """
     Delete a saved prompt.
     
     Args:
-        request: The delete prompt request
-        api_key: The API key
+        http_request: The HTTP request carrying a DeletePromptRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The delete prompt response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
-    
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
+    # Decode the request body
+    request = await _decode(http_request, DeletePromptRequest)
     
-    # Check if user has required role
-    auth.require_role(user_id, "basic")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Delete prompt request from user {user_id}")
+    logger.info("Delete prompt request from user %s", user_id)
     
-    # Check if prompt exists and belongs to user
-    prompt_data = synthlang_api.load_prompt(request.name)
-    if not prompt_data.get("prompt"):
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail={
-                "error": {
-                    "message": f"Prompt '{request.name}' not found",
-                    "type": "not_found",
-                    "code": HTTP_404_NOT_FOUND
-                },
-                "version": get_version(),
-                "timestamp": get_timestamp()
-            }
-        )
+    # Delete the prompt, checking ownership in the same statement unless admin
+    owner = None if "admin" in credentials.roles else user_id
+    try:
+        deleted = await synthlang_api.delete_prompt_async(request.name, owner)
+    except PermissionError:
+        return _error(HTTP_401_UNAUTHORIZED, "You don't have permission to delete this prompt", "permission_denied")
     
-    # Check if user owns the prompt or is an admin
-    prompt_user_id = prompt_data.get("metadata", {}).get("user_id")
-    if prompt_user_id != user_id and not auth.has_role(user_id, "admin"):
-        raise HTTPException(
-            status_code=HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": {
-                    "message": "You don't have permission to delete this prompt",
-                    "type": "permission_denied",
-                    "code": HTTP_401_UNAUTHORIZED
-                },
-                "version": get_version(),
-                "timestamp": get_timestamp()
-            }
-        )
+    if deleted is None:
+        return _error(HTTP_404_NOT_FOUND, f"Prompt '{request.name}' not found", "not_found")
     
-    # Call SynthLang API
-    success = synthlang_api.delete_prompt(request.name)
+    # Invalidate the cached prompt lists
+    _invalidate_prompts(user_id, deleted.get("user_id"))
     
     # Format response
-    return {
-        "success": success,
-        "name": request.name,
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
+    return ORJSONResponse(_stamp({
+        "success": True,
+        "name": request.name
+    }))
 
 
-@router.post("/prompts/compare", response_model=ComparePromptsResponse)
+@router.post(
+    "/prompts/compare",
+    responses={200: {"model": ComparePromptsResponse}},
+    openapi_extra=_body_schema(ComparePromptsRequest)
+)
 async def compare_prompts(
-    request: ComparePromptsRequest,
-    api_key: str = Depends(verify_auth)
+    http_request: Request,
+    credentials: AuthContext = Depends(authorize_premium)
 ):
     """
     Compare two saved prompts.
     
     Args:
-        request: The compare prompts request
-        api_key: The API key
+        http_request: The HTTP request carrying a ComparePromptsRequest body
+        credentials: The caller's API key, user ID and roles
         
     Returns:
         The compare prompts response
     """
-    # Get user ID from API key
-    user_id = auth.get_user_id(api_key)
+    # Decode the request body
+    request = await _decode(http_request, ComparePromptsRequest)
     
-    # Check rate limit
-    auth.check_rate_limit(request, api_key)
-    
-    # Check if user has required role
-    auth.require_role(user_id, "premium")
+    # Get user ID from the authorized credentials
+    user_id = credentials.user_id
     
     # Log the request
-    logger.info(f"Compare prompts request from user {user_id}")
-    
-    # Check if prompts exist
-    prompt1 = synthlang_api.load_prompt(request.name1)
-    prompt2 = synthlang_api.load_prompt(request.name2)
-    
-    if not prompt1.get("prompt"):
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail={
-                "error": {
-                    "message": f"Prompt '{request.name1}' not found",
-                    "type": "not_found",
-                    "code": HTTP_404_NOT_FOUND
-                },
-                "version": get_version(),
-                "timestamp": get_timestamp()
-            }
-        )
-    
-    if not prompt2.get("prompt"):
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail={
-                "error": {
-                    "message": f"Prompt '{request.name2}' not found",
-                    "type": "not_found",
-                    "code": HTTP_404_NOT_FOUND
-                },
-                "version": get_version(),
-                "timestamp": get_timestamp()
-            }
-        )
+    logger.info("Compare prompts request from user %s", user_id)
     
-    # Call SynthLang API
-    result = synthlang_api.compare_prompts(request.name1, request.name2)
+    # Load both prompts with a single query
+    loaded = await synthlang_api.load_prompts_async([request.name1, request.name2])
     
-    # Format response
-    return {
-        "prompts": result.get("prompts", {}),
-        "metrics": result.get("metrics", {}),
-        "differences": result.get("differences", {}),
-        "version": get_version(),
-        "timestamp": get_timestamp()
-    }
\ No newline at end of file
+    # Check if prompts exist
+    for name in (request.name1, request.name2):
+        if name not in loaded:
+            return _error(HTTP_404_NOT_FOUND, f"Prompt '{name}' not found", "not_found")
+    
+    # Call SynthLang API with the already loaded prompts
+    result = await synthlang_api.compare_prompts_async(request.name1, request.name2, loaded)
+    
+    # Format response, letting the result override the defaults
+    return ORJSONResponse(_stamp({
+        "prompts": {},
+        "metrics": {},
+        "differences": {},
+        **result
+    }))
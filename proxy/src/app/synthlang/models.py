@@ -1,19 +1,33 @@
 """
 SynthLang API models.
 
-This module defines the Pydantic models for SynthLang API endpoints.
+This module defines the models for SynthLang API endpoints. Request
+bodies are msgspec structs, which decode considerably faster than
+Pydantic models; responses are Pydantic models used for documentation.
 """
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional, Any, Union
 
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
-class TranslateRequest(BaseModel):
+from .core.module import MAX_GENERATIONS, MAX_ITERATIONS
+
+
+class SynthLangResponse(BaseModel):
+    """Base model for SynthLang API responses."""
+    # Responses are built from trusted dicts; skip extra validation work
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
+
+class TranslateRequest(msgspec.Struct):
     """Request model for translation endpoint."""
-    text: str = Field(..., description="Text to translate to SynthLang format")
-    instructions: Optional[str] = Field(None, description="Optional custom translation instructions")
+    # Text to translate to SynthLang format
+    text: str
+    # Optional custom translation instructions
+    instructions: Optional[str] = None
 
 
-class TranslateResponse(BaseModel):
+class TranslateResponse(SynthLangResponse):
     """Response model for translation endpoint."""
     source: str = Field(..., description="Original text")
     target: str = Field(..., description="Translated text in SynthLang format")
@@ -22,12 +36,13 @@ class TranslateResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class GenerateRequest(BaseModel):
+class GenerateRequest(msgspec.Struct):
     """Request model for generation endpoint."""
-    task_description: str = Field(..., description="Description of the task")
+    # Description of the task
+    task_description: str
 
 
-class GenerateResponse(BaseModel):
+class GenerateResponse(SynthLangResponse):
     """Response model for generation endpoint."""
     prompt: str = Field(..., description="Generated system prompt")
     rationale: str = Field(..., description="Design rationale")
@@ -36,13 +51,17 @@ class GenerateResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class OptimizeRequest(BaseModel):
+class OptimizeRequest(msgspec.Struct):
     """Request model for optimization endpoint."""
-    prompt: str = Field(..., description="Prompt to optimize")
-    max_iterations: Optional[int] = Field(5, description="Maximum optimization iterations")
+    # Prompt to optimize
+    prompt: str
+    # Maximum optimization iterations
+    max_iterations: Annotated[int, msgspec.Meta(ge=1, le=MAX_ITERATIONS)] = 5
+    # Stream per-iteration progress as server-sent events
+    stream: Optional[bool] = False
 
 
-class OptimizeResponse(BaseModel):
+class OptimizeResponse(SynthLangResponse):
     """Response model for optimization endpoint."""
     optimized: str = Field(..., description="Optimized prompt")
     improvements: List[str] = Field(..., description="List of improvements made")
@@ -52,13 +71,17 @@ class OptimizeResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class EvolveRequest(BaseModel):
+class EvolveRequest(msgspec.Struct):
     """Request model for evolution endpoint."""
-    seed_prompt: str = Field(..., description="Initial prompt to evolve from")
-    n_generations: Optional[int] = Field(10, description="Number of generations to evolve")
+    # Initial prompt to evolve from
+    seed_prompt: str
+    # Number of generations to evolve
+    n_generations: Annotated[int, msgspec.Meta(ge=1, le=MAX_GENERATIONS)] = 10
+    # Stream per-generation progress as server-sent events
+    stream: Optional[bool] = False
 
 
-class EvolveResponse(BaseModel):
+class EvolveResponse(SynthLangResponse):
     """Response model for evolution endpoint."""
     best_prompt: str = Field(..., description="Best evolved prompt")
     fitness: Dict[str, Any] = Field(..., description="Fitness scores")
@@ -69,13 +92,15 @@ class EvolveResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class ClassifyRequest(BaseModel):
+class ClassifyRequest(msgspec.Struct):
     """Request model for classification endpoint."""
-    text: str = Field(..., description="Text to classify")
-    labels: List[str] = Field(..., description="List of possible classification labels")
+    # Text to classify
+    text: str
+    # List of possible classification labels
+    labels: List[str]
 
 
-class ClassifyResponse(BaseModel):
+class ClassifyResponse(SynthLangResponse):
     """Response model for classification endpoint."""
     input: str = Field(..., description="Input text")
     label: str = Field(..., description="Classification label")
@@ -84,14 +109,17 @@ class ClassifyResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class SavePromptRequest(BaseModel):
+class SavePromptRequest(msgspec.Struct):
     """Request model for save prompt endpoint."""
-    name: str = Field(..., description="Name to save prompt under")
-    prompt: str = Field(..., description="The prompt content")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata about the prompt")
+    # Name to save prompt under
+    name: str
+    # The prompt content
+    prompt: str
+    # Optional metadata about the prompt
+    metadata: Optional[Dict[str, Any]] = None
 
 
-class SavePromptResponse(BaseModel):
+class SavePromptResponse(SynthLangResponse):
     """Response model for save prompt endpoint."""
     success: bool = Field(..., description="Whether the prompt was saved successfully")
     name: str = Field(..., description="Name of the saved prompt")
@@ -99,12 +127,13 @@ class SavePromptResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class LoadPromptRequest(BaseModel):
+class LoadPromptRequest(msgspec.Struct):
     """Request model for load prompt endpoint."""
-    name: str = Field(..., description="Name of prompt to load")
+    # Name of prompt to load
+    name: str
 
 
-class LoadPromptResponse(BaseModel):
+class LoadPromptResponse(SynthLangResponse):
     """Response model for load prompt endpoint."""
     name: str = Field(..., description="Name of the prompt")
     prompt: str = Field(..., description="The prompt content")
@@ -113,7 +142,7 @@ class LoadPromptResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class ListPromptsResponse(BaseModel):
+class ListPromptsResponse(SynthLangResponse):
     """Response model for list prompts endpoint."""
     prompts: List[Dict[str, Any]] = Field(..., description="List of prompt data dictionaries")
     count: int = Field(..., description="Number of prompts")
@@ -121,12 +150,13 @@ class ListPromptsResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class DeletePromptRequest(BaseModel):
+class DeletePromptRequest(msgspec.Struct):
     """Request model for delete prompt endpoint."""
-    name: str = Field(..., description="Name of prompt to delete")
+    # Name of prompt to delete
+    name: str
 
 
-class DeletePromptResponse(BaseModel):
+class DeletePromptResponse(SynthLangResponse):
     """Response model for delete prompt endpoint."""
     success: bool = Field(..., description="Whether the prompt was deleted successfully")
     name: str = Field(..., description="Name of the deleted prompt")
@@ -134,13 +164,15 @@ class DeletePromptResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
-class ComparePromptsRequest(BaseModel):
+class ComparePromptsRequest(msgspec.Struct):
     """Request model for compare prompts endpoint."""
-    name1: str = Field(..., description="First prompt name")
-    name2: str = Field(..., description="Second prompt name")
+    # First prompt name
+    name1: str
+    # Second prompt name
+    name2: str
 
 
-class ComparePromptsResponse(BaseModel):
+class ComparePromptsResponse(SynthLangResponse):
     """Response model for compare prompts endpoint."""
     prompts: Dict[str, str] = Field(..., description="Prompts being compared")
     metrics: Dict[str, Dict[str, Any]] = Field(..., description="Metrics for each prompt")
@@ -149,6 +181,14 @@ class ComparePromptsResponse(BaseModel):
     timestamp: str = Field(..., description="Timestamp of the response")
 
 
+class AbortResponse(SynthLangResponse):
+    """Response model for abort endpoint."""
+    success: bool = Field(..., description="Whether a running operation of the caller's on this worker was asked to stop")
+    request_id: str = Field(..., description="ID of the streaming operation")
+    version: str = Field(..., description="API version")
+    timestamp: str = Field(..., description="Timestamp of the response")
+
+
 class SynthLangError(BaseModel):
     """Error model for SynthLang API endpoints."""
     error: Dict[str, Any] = Field(..., description="Error details")
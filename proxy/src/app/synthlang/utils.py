@@ -5,19 +5,63 @@ This module provides utility functions for the SynthLang API.
 """
 import logging
 import time
+from datetime import datetime
 from typing import Dict, Any, Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Import the SynthLang API once rather than on every availability check
+try:
+    from src.app.synthlang.api import synthlang_api
+except ImportError:
+    logger.warning("SynthLang API not available")
+    synthlang_api = None
 
-def get_dspy_lm() -> Optional[Any]:
+# Last whole second formatted by now_iso and its ISO string
+_ts_sec = 0
+_ts_str = ""
+
+# DSPy language models created so far, by model name; failures are not
+# stored so a later call can retry
+_lms: Dict[str, Any] = {}
+
+
+def now_iso() -> str:
+    """
+    Get the current time as an ISO timestamp with second resolution.
+    
+    The formatted string is reused until the wall-clock second changes.
+    
+    Returns:
+        Current timestamp in ISO format
+    """
+    global _ts_sec, _ts_str
+    sec = int(time.time())
+    if sec != _ts_sec:
+        _ts_str = datetime.fromtimestamp(sec).isoformat()
+        _ts_sec = sec
+    return _ts_str
+
+
+def get_dspy_lm(model_name: str = "gpt-4") -> Optional[Any]:
     """
-    Get a DSPy language model instance.
+    Get the shared DSPy language model instance for a model.
     
+    One instance is created per model per process and reused, so the
+    underlying client and its connection pool are shared. If creating the
+    model fails, the next call tries again.
+    
+    Args:
+        model_name: The OpenAI model to use
+        
     Returns:
         DSPy language model instance or None if not available
     """
+    lm = _lms.get(model_name)
+    if lm is not None:
+        return lm
+    
     try:
         # Import DSPy
         import dspy
@@ -31,8 +75,9 @@ def get_dspy_lm() -> Optional[Any]:
             return None
         
         # Create OpenAI LM
-        lm = dspy.OpenAI(api_key=OPENAI_API_KEY, model="gpt-4")
-        logger.info("Created DSPy language model")
+        lm = dspy.OpenAI(api_key=OPENAI_API_KEY, model=model_name)
+        logger.info(f"Created DSPy language model for {model_name}")
+        _lms[model_name] = lm
         
         return lm
     except ImportError:
@@ -57,7 +102,7 @@ def format_synthlang_response(result: Dict[str, Any], version: str = "1.0") -> D
     # Add version and timestamp
     response = result.copy()
     response["version"] = version
-    response["timestamp"] = time.time()
+    response["timestamp"] = now_iso()
     
     return response
 
@@ -69,15 +114,12 @@ def is_synthlang_available() -> bool:
     Returns:
         True if SynthLang is available, False otherwise
     """
+    if synthlang_api is None:
+        return False
+    
     try:
-        # Import SynthLang API
-        from src.app.synthlang.api import synthlang_api
-        
         # Check if API is enabled
         return synthlang_api.is_enabled()
-    except ImportError:
-        logger.warning("SynthLang API not available")
-        return False
     except Exception as e:
         logger.error(f"Error checking SynthLang availability: {e}")
         return False
\ No newline at end of file
@@ -10,10 +10,11 @@ import sys
 import argparse
 import logging
 import secrets
-import json
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+import orjson
+
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "")))
 
@@ -29,23 +30,36 @@ logger = logging.getLogger("api-keys-cli")
 # Path to store API keys
 API_KEYS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".api_keys.json")
 
+# Parsed API keys file, keyed by its modification time
+_CACHE: Dict[str, Any] = {"mtime": None, "data": None}
+
 def load_api_keys() -> Dict[str, Any]:
     """
     Load API keys from file.
     
+    The parsed file is cached and only re-read when its modification
+    time changes.
+    
     Returns:
         Dictionary containing API keys and rate limits
     """
-    if not os.path.exists(API_KEYS_FILE):
+    try:
+        mtime = os.stat(API_KEYS_FILE).st_mtime_ns
+    except FileNotFoundError:
         return {"api_keys": {}, "rate_limits": {}}
     
+    if _CACHE["mtime"] == mtime:
+        return _CACHE["data"]
+    
     try:
-        with open(API_KEYS_FILE, "r") as f:
-            data = json.load(f)
-        return data
+        with open(API_KEYS_FILE, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Error loading API keys: {e}")
         return {"api_keys": {}, "rate_limits": {}}
+    
+    _CACHE["mtime"], _CACHE["data"] = mtime, data
+    return data
 
 def save_api_keys(data: Dict[str, Any]) -> bool:
     """
@@ -57,13 +71,24 @@ def save_api_keys(data: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # Write a temporary file and move it into place, so a crash never
+    # leaves a truncated keys file behind
+    tmp_file = API_KEYS_FILE + ".tmp"
     try:
-        with open(API_KEYS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-        return True
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, API_KEYS_FILE)
     except Exception as e:
         logger.error(f"Error saving API keys: {e}")
+        _CACHE["mtime"] = None
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         return False
+    
+    _CACHE["mtime"], _CACHE["data"] = os.stat(API_KEYS_FILE).st_mtime_ns, data
+    return True
 
 def generate_api_key(prefix: str = "sk_") -> str:
     """
@@ -79,7 +104,7 @@ def generate_api_key(prefix: str = "sk_") -> str:
     token = secrets.token_hex(16)
     return f"{prefix}{token}"
 
-def list_keys(args):
+def list_keys() -> None:
     """List all API keys."""
     data = load_api_keys()
     api_keys = data.get("api_keys", {})
@@ -99,21 +124,29 @@ def list_keys(args):
         print(f"Rate Limit: {rate_limit} requests per minute")
         print("-" * 80)
 
-def create_key(args):
-    """Create a new API key."""
+def create_key(user_id: str, rate_limit: Optional[int] = None, prefix: str = "sk_", save_env: bool = False) -> None:
+    """
+    Create a new API key.
+    
+    Args:
+        user_id: User ID the key belongs to
+        rate_limit: Optional rate limit in requests per minute
+        prefix: Prefix for the API key
+        save_env: Whether to save the key to the .env file
+    """
     data = load_api_keys()
     api_keys = data.get("api_keys", {})
     rate_limits = data.get("rate_limits", {})
     
     # Generate a new API key
-    api_key = generate_api_key(args.prefix)
+    api_key = generate_api_key(prefix)
     
     # Add to API keys
-    api_keys[api_key] = args.user_id
+    api_keys[api_key] = user_id
     
     # Set rate limit if specified
-    if args.rate_limit is not None:
-        rate_limits[args.user_id] = args.rate_limit
+    if rate_limit is not None:
+        rate_limits[user_id] = rate_limit
     
     # Update data
     data["api_keys"] = api_keys
@@ -124,26 +157,29 @@ def create_key(args):
         print(f"API key created successfully: {api_key}")
         
         # Save to .env file if requested
-        if args.save_env:
+        if save_env:
             env_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".env")
             
             # Read existing .env file
-            env_vars = {}
-            if os.path.exists(env_file):
-                with open(env_file, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            key, value = line.split("=", 1)
-                            env_vars[key] = value
+            env_path = Path(env_file)
+            lines = env_path.read_text().splitlines() if env_path.exists() else []
             
-            # Add API key
-            env_vars["API_KEY"] = api_key
+            # Replace the API key line, keeping comments and other lines as they are
+            rendered, replaced = [], False
+            for line in lines:
+                key, sep, _ = line.strip().partition("=")
+                if sep and key == "API_KEY" and not replaced:
+                    rendered.append(f"API_KEY={api_key}")
+                    replaced = True
+                elif not (sep and key == "API_KEY"):
+                    rendered.append(line)
+            
+            # Add API key if the file did not set one yet
+            if not replaced:
+                rendered.append(f"API_KEY={api_key}")
             
             # Write back to .env file
-            with open(env_file, "w") as f:
-                for key, value in env_vars.items():
-                    f.write(f"{key}={value}\n")
+            env_path.write_text("\n".join(rendered) + "\n")
             
             print(f"API key saved to .env file as API_KEY={api_key}")
             
@@ -153,49 +189,91 @@ def create_key(args):
     else:
         print("Failed to create API key.")
 
-def delete_key(args):
-    """Delete an API key."""
+def delete_key(api_key: str) -> None:
+    """
+    Delete an API key.
+    
+    Args:
+        api_key: API key to delete
+    """
     data = load_api_keys()
     api_keys = data.get("api_keys", {})
     
-    if args.api_key not in api_keys:
-        print(f"API key '{args.api_key}' not found.")
+    if api_key not in api_keys:
+        print(f"API key '{api_key}' not found.")
         return
     
     # Remove API key
-    user_id = api_keys.pop(args.api_key)
+    user_id = api_keys.pop(api_key)
     
     # Update data
     data["api_keys"] = api_keys
     
     # Save to file
     if save_api_keys(data):
-        print(f"API key '{args.api_key}' deleted successfully.")
+        print(f"API key '{api_key}' deleted successfully.")
     else:
-        print(f"Failed to delete API key '{args.api_key}'.")
+        print(f"Failed to delete API key '{api_key}'.")
 
-def main():
-    """Main entry point for the CLI."""
+def list_keys_command(args):
+    """Run the list command."""
+    list_keys()
+
+def create_key_command(args):
+    """Run the create command."""
+    create_key(args.user_id, args.rate_limit, args.prefix, args.save_env)
+
+def delete_key_command(args):
+    """Run the delete command."""
+    delete_key(args.api_key)
+
+def add_create_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the create command."""
+    parser.add_argument("--user-id", "-u", required=True, help="User ID")
+    parser.add_argument("--rate-limit", "-r", type=int, help="Rate limit in requests per minute")
+    parser.add_argument("--prefix", "-p", default="sk_", help="API key prefix")
+    parser.add_argument("--save-env", "-s", action="store_true", help="Save API key to .env file")
+
+def add_delete_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the delete command."""
+    parser.add_argument("api_key", help="API key to delete")
+
+# Commands: name -> (help, function adding the command's arguments, handler)
+COMMANDS = {
+    "list": ("List all API keys", None, list_keys_command),
+    "create": ("Create a new API key", add_create_arguments, create_key_command),
+    "delete": ("Delete an API key", add_delete_arguments, delete_key_command),
+}
+
+def build_parser(commands: List[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser with subparsers for the given commands.
+    
+    Args:
+        commands: Names of the commands to add subparsers for
+        
+    Returns:
+        The argument parser
+    """
     parser = argparse.ArgumentParser(description="Manage API keys")
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
-    # List API keys
-    list_parser = subparsers.add_parser("list", help="List all API keys")
-    list_parser.set_defaults(func=list_keys)
-    
-    # Create API key
-    create_parser = subparsers.add_parser("create", help="Create a new API key")
-    create_parser.add_argument("--user-id", "-u", required=True, help="User ID")
-    create_parser.add_argument("--rate-limit", "-r", type=int, help="Rate limit in requests per minute")
-    create_parser.add_argument("--prefix", "-p", default="sk_", help="API key prefix")
-    create_parser.add_argument("--save-env", "-s", action="store_true", help="Save API key to .env file")
-    create_parser.set_defaults(func=create_key)
-    
-    # Delete API key
-    delete_parser = subparsers.add_parser("delete", help="Delete an API key")
-    delete_parser.add_argument("api_key", help="API key to delete")
-    delete_parser.set_defaults(func=delete_key)
+    for name in commands:
+        help_text, add_arguments, func = COMMANDS[name]
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_arguments is not None:
+            add_arguments(command_parser)
+        command_parser.set_defaults(func=func)
+    
+    return parser
+
+def main():
+    """Main entry point for the CLI."""
+    # Only build the subparser of the requested command; help and unknown
+    # commands get the full parser
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = build_parser([command] if command in COMMANDS else list(COMMANDS))
     
     args = parser.parse_args()
     
@@ -9,7 +9,7 @@ import os
 import sys
 import argparse
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import tomli
 import tomli_w
 from pathlib import Path
@@ -36,9 +36,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger("keywords-cli")
 
+# Parsed configuration files, keyed by absolute path, with their modification times
+_CFG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+def _load_config(config_file: str) -> Dict[str, Any]:
+    """
+    Load a keyword configuration, reusing the parsed file while it is unchanged.
+    
+    Args:
+        config_file: Path to the configuration file
+        
+    Returns:
+        The configuration as a dictionary
+    """
+    path = os.path.abspath(config_file)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return load_keyword_config(config_file)
+    
+    cached = _CFG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    config = load_keyword_config(config_file)
+    if config:
+        _CFG_CACHE[path] = (mtime, config)
+    return config
+
+def _save_config(config: Dict[str, Any], config_file: str) -> bool:
+    """
+    Save a keyword configuration and refresh its cache entry.
+    
+    Args:
+        config: The configuration to save
+        config_file: Path to the configuration file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    path = os.path.abspath(config_file)
+    if not save_keyword_config(config, config_file):
+        _CFG_CACHE.pop(path, None)
+        return False
+    
+    _CFG_CACHE[path] = (os.stat(path).st_mtime_ns, config)
+    return True
+
 def list_patterns(args):
     """List all patterns in the configuration."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "patterns" not in config:
         print("No patterns found in configuration.")
@@ -69,7 +116,7 @@ def list_patterns(args):
 
 def show_pattern(args):
     """Show details for a specific pattern."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "patterns" not in config:
         print("No patterns found in configuration.")
@@ -96,7 +143,7 @@ def show_pattern(args):
 
 def add_pattern(args):
     """Add a new pattern to the configuration."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config:
         config = {"settings": {}, "patterns": {}}
@@ -125,14 +172,14 @@ def add_pattern(args):
     config["patterns"][args.name] = pattern_data
     
     # Save configuration
-    if save_keyword_config(config, args.config):
+    if _save_config(config, args.config):
         print(f"Pattern '{args.name}' added successfully.")
     else:
         print(f"Failed to add pattern '{args.name}'.")
 
 def edit_pattern(args):
     """Edit an existing pattern in the configuration."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "patterns" not in config:
         print("No patterns found in configuration.")
@@ -145,41 +192,41 @@ def edit_pattern(args):
     # Get existing pattern
     pattern_data = config["patterns"][args.name]
     
-    # Update pattern data
-    if args.pattern is not None:
-        pattern_data["pattern"] = args.pattern
-    
-    if args.tool is not None:
-        pattern_data["tool"] = args.tool
-    
-    if args.description is not None:
-        pattern_data["description"] = args.description
-    
-    if args.priority is not None:
-        pattern_data["priority"] = args.priority
-    
-    if args.required_role is not None:
-        if args.required_role == "":
-            # Remove required_role if empty
-            pattern_data.pop("required_role", None)
-        else:
-            pattern_data["required_role"] = args.required_role
+    # Collect the fields given on the command line
+    updates = {
+        key: value
+        for key, value in (
+            ("pattern", args.pattern),
+            ("tool", args.tool),
+            ("description", args.description),
+            ("priority", args.priority),
+            ("required_role", args.required_role or None)
+        )
+        if value is not None
+    }
     
     if args.enable:
-        pattern_data["enabled"] = True
+        updates["enabled"] = True
     
     if args.disable:
-        pattern_data["enabled"] = False
+        updates["enabled"] = False
+    
+    # Remove required_role if empty
+    if args.required_role == "":
+        pattern_data.pop("required_role", None)
+    
+    # Update pattern data
+    pattern_data.update(updates)
     
     # Save configuration
-    if save_keyword_config(config, args.config):
+    if _save_config(config, args.config):
         print(f"Pattern '{args.name}' updated successfully.")
     else:
         print(f"Failed to update pattern '{args.name}'.")
 
 def delete_pattern(args):
     """Delete a pattern from the configuration."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "patterns" not in config:
         print("No patterns found in configuration.")
@@ -193,21 +240,21 @@ def delete_pattern(args):
     del config["patterns"][args.name]
     
     # Save configuration
-    if save_keyword_config(config, args.config):
+    if _save_config(config, args.config):
         print(f"Pattern '{args.name}' deleted successfully.")
     else:
         print(f"Failed to delete pattern '{args.name}'.")
 
 def import_config(args):
     """Import patterns from another configuration file."""
-    source_config = load_keyword_config(args.source)
+    source_config = _load_config(args.source)
     
     if not source_config:
         print(f"Source configuration file '{args.source}' not found or is empty.")
         return
     
     # Load target configuration
-    target_config = load_keyword_config(args.config)
+    target_config = _load_config(args.config)
     
     if not target_config:
         target_config = {"settings": {}, "patterns": {}}
@@ -216,28 +263,32 @@ def import_config(args):
         target_config["patterns"] = {}
     
     # Import patterns
-    imported = 0
-    for name, data in source_config.get("patterns", {}).items():
-        if args.overwrite or name not in target_config["patterns"]:
-            target_config["patterns"][name] = data
-            imported += 1
+    source_patterns = source_config.get("patterns", {})
+    if args.overwrite:
+        target_config["patterns"].update(source_patterns)
+        imported = len(source_patterns)
+    else:
+        existing = target_config["patterns"].keys()
+        new_patterns = {name: data for name, data in source_patterns.items() if name not in existing}
+        target_config["patterns"].update(new_patterns)
+        imported = len(new_patterns)
     
     # Save configuration
-    if save_keyword_config(target_config, args.config):
+    if _save_config(target_config, args.config):
         print(f"Imported {imported} patterns successfully.")
     else:
         print("Failed to import patterns.")
 
 def export_config(args):
     """Export patterns to another configuration file."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "patterns" not in config:
         print("No patterns found in configuration.")
         return
     
     # Save to target file
-    if save_keyword_config(config, args.target):
+    if _save_config(config, args.target):
         print(f"Exported {len(config.get('patterns', {}))} patterns to '{args.target}'.")
     else:
         print(f"Failed to export patterns to '{args.target}'.")
@@ -247,14 +298,14 @@ def create_default(args):
     config = create_default_config()
     
     # Save configuration
-    if save_keyword_config(config, args.config):
+    if _save_config(config, args.config):
         print(f"Created default configuration with {len(config.get('patterns', {}))} patterns.")
     else:
         print("Failed to create default configuration.")
 
 def show_settings(args):
     """Show current settings."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config or "settings" not in config:
         print("No settings found in configuration.")
@@ -270,7 +321,7 @@ def show_settings(args):
 
 def update_settings(args):
     """Update settings in the configuration."""
-    config = load_keyword_config(args.config)
+    config = _load_config(args.config)
     
     if not config:
         config = {"settings": {}, "patterns": {}}
@@ -289,80 +340,104 @@ def update_settings(args):
         config["settings"]["default_role"] = args.default_role
     
     # Save configuration
-    if save_keyword_config(config, args.config):
+    if _save_config(config, args.config):
         print("Settings updated successfully.")
     else:
         print("Failed to update settings.")
 
-def main():
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(description="Manage keyword detection configurations")
+def add_name_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the pattern name argument of the show and delete commands."""
+    parser.add_argument("name", help="Name of the pattern")
+
+def add_add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the add command."""
+    parser.add_argument("name", help="Name of the pattern")
+    parser.add_argument("--pattern", "-p", required=True, help="Regex pattern")
+    parser.add_argument("--tool", "-t", required=True, help="Tool to invoke")
+    parser.add_argument("--description", "-d", required=True, help="Description")
+    parser.add_argument("--priority", "-r", type=int, default=0, help="Priority (default: 0)")
+    parser.add_argument("--required-role", "-o", help="Required role")
+    parser.add_argument("--disabled", action="store_true", help="Disable the pattern")
+
+def add_edit_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the edit command."""
+    parser.add_argument("name", help="Name of the pattern")
+    parser.add_argument("--pattern", "-p", help="Regex pattern")
+    parser.add_argument("--tool", "-t", help="Tool to invoke")
+    parser.add_argument("--description", "-d", help="Description")
+    parser.add_argument("--priority", "-r", type=int, help="Priority")
+    parser.add_argument("--required-role", "-o", help="Required role")
+    parser.add_argument("--enable", action="store_true", help="Enable the pattern")
+    parser.add_argument("--disable", action="store_true", help="Disable the pattern")
+
+def add_import_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the import command."""
+    parser.add_argument("source", help="Source configuration file")
+    parser.add_argument("--overwrite", "-o", action="store_true", help="Overwrite existing patterns")
+
+def add_export_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the export command."""
+    parser.add_argument("target", help="Target configuration file")
+
+def add_update_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the update-settings command."""
+    parser.add_argument("--enable-detection", "-e", type=bool, help="Enable or disable keyword detection")
+    parser.add_argument("--detection-threshold", "-t", type=float, help="Detection threshold (0.0 to 1.0)")
+    parser.add_argument("--default-role", "-r", help="Default role")
+
+# Commands: name -> (help, function adding the command's arguments, handler)
+COMMANDS = {
+    "list": ("List all patterns", None, list_patterns),
+    "show": ("Show details for a specific pattern", add_name_argument, show_pattern),
+    "add": ("Add a new pattern", add_add_arguments, add_pattern),
+    "edit": ("Edit an existing pattern", add_edit_arguments, edit_pattern),
+    "delete": ("Delete a pattern", add_name_argument, delete_pattern),
+    "import": ("Import patterns from another configuration file", add_import_arguments, import_config),
+    "export": ("Export patterns to another configuration file", add_export_arguments, export_config),
+    "create-default": ("Create a default configuration", None, create_default),
+    "settings": ("Show current settings", None, show_settings),
+    "update-settings": ("Update settings", add_update_settings_arguments, update_settings),
+}
+
+def add_config_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the global configuration file option."""
     parser.add_argument("--config", "-c", help="Path to configuration file", default=get_config_file_path())
+
+def build_parser(commands: List[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser with subparsers for the given commands.
+    
+    Args:
+        commands: Names of the commands to add subparsers for
+        
+    Returns:
+        The argument parser
+    """
+    parser = argparse.ArgumentParser(description="Manage keyword detection configurations")
+    add_config_argument(parser)
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
-    # List patterns
-    list_parser = subparsers.add_parser("list", help="List all patterns")
-    list_parser.set_defaults(func=list_patterns)
-    
-    # Show pattern
-    show_parser = subparsers.add_parser("show", help="Show details for a specific pattern")
-    show_parser.add_argument("name", help="Name of the pattern")
-    show_parser.set_defaults(func=show_pattern)
-    
-    # Add pattern
-    add_parser = subparsers.add_parser("add", help="Add a new pattern")
-    add_parser.add_argument("name", help="Name of the pattern")
-    add_parser.add_argument("--pattern", "-p", required=True, help="Regex pattern")
-    add_parser.add_argument("--tool", "-t", required=True, help="Tool to invoke")
-    add_parser.add_argument("--description", "-d", required=True, help="Description")
-    add_parser.add_argument("--priority", "-r", type=int, default=0, help="Priority (default: 0)")
-    add_parser.add_argument("--required-role", "-o", help="Required role")
-    add_parser.add_argument("--disabled", action="store_true", help="Disable the pattern")
-    add_parser.set_defaults(func=add_pattern)
-    
-    # Edit pattern
-    edit_parser = subparsers.add_parser("edit", help="Edit an existing pattern")
-    edit_parser.add_argument("name", help="Name of the pattern")
-    edit_parser.add_argument("--pattern", "-p", help="Regex pattern")
-    edit_parser.add_argument("--tool", "-t", help="Tool to invoke")
-    edit_parser.add_argument("--description", "-d", help="Description")
-    edit_parser.add_argument("--priority", "-r", type=int, help="Priority")
-    edit_parser.add_argument("--required-role", "-o", help="Required role")
-    edit_parser.add_argument("--enable", action="store_true", help="Enable the pattern")
-    edit_parser.add_argument("--disable", action="store_true", help="Disable the pattern")
-    edit_parser.set_defaults(func=edit_pattern)
-    
-    # Delete pattern
-    delete_parser = subparsers.add_parser("delete", help="Delete a pattern")
-    delete_parser.add_argument("name", help="Name of the pattern")
-    delete_parser.set_defaults(func=delete_pattern)
-    
-    # Import configuration
-    import_parser = subparsers.add_parser("import", help="Import patterns from another configuration file")
-    import_parser.add_argument("source", help="Source configuration file")
-    import_parser.add_argument("--overwrite", "-o", action="store_true", help="Overwrite existing patterns")
-    import_parser.set_defaults(func=import_config)
-    
-    # Export configuration
-    export_parser = subparsers.add_parser("export", help="Export patterns to another configuration file")
-    export_parser.add_argument("target", help="Target configuration file")
-    export_parser.set_defaults(func=export_config)
-    
-    # Create default configuration
-    default_parser = subparsers.add_parser("create-default", help="Create a default configuration")
-    default_parser.set_defaults(func=create_default)
-    
-    # Show settings
-    settings_parser = subparsers.add_parser("settings", help="Show current settings")
-    settings_parser.set_defaults(func=show_settings)
+    for name in commands:
+        help_text, add_arguments, func = COMMANDS[name]
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_arguments is not None:
+            add_arguments(command_parser)
+        command_parser.set_defaults(func=func)
     
-    # Update settings
-    update_parser = subparsers.add_parser("update-settings", help="Update settings")
-    update_parser.add_argument("--enable-detection", "-e", type=bool, help="Enable or disable keyword detection")
-    update_parser.add_argument("--detection-threshold", "-t", type=float, help="Detection threshold (0.0 to 1.0)")
-    update_parser.add_argument("--default-role", "-r", help="Default role")
-    update_parser.set_defaults(func=update_settings)
+    return parser
+
+def main():
+    """Main entry point for the CLI."""
+    # Find the requested command after the global options
+    probe = argparse.ArgumentParser(add_help=False)
+    add_config_argument(probe)
+    _, remaining = probe.parse_known_args()
+    command = remaining[0] if remaining else None
+    
+    # Only build the subparser of the requested command; help and unknown
+    # commands get the full parser
+    parser = build_parser([command] if command in COMMANDS else list(COMMANDS))
     
     args = parser.parse_args()
     
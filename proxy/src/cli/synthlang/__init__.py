@@ -1,19 +1,17 @@
 """SynthLang CLI package."""
-from synthlang.config import Config, ConfigManager
-from synthlang.core import (
-    SynthLangModule,
-    FrameworkTranslator,
-    SystemPromptGenerator
-)
+import importlib
 
 __version__ = "0.2.0"
 
-# Import proxy module to make it available
-try:
-    from synthlang import proxy
-except ImportError:
-    # Proxy module might not be available in some environments
-    proxy = None
+# Public names and the modules that define them; these are imported on
+# first access so that importing the package (e.g. for __version__) stays cheap
+_LAZY_ATTRS = {
+    "Config": "synthlang.config",
+    "ConfigManager": "synthlang.config",
+    "SynthLangModule": "synthlang.core",
+    "FrameworkTranslator": "synthlang.core",
+    "SystemPromptGenerator": "synthlang.core",
+}
 
 __all__ = [
     "Config",
@@ -24,3 +22,20 @@ __all__ = [
     "proxy",
     "__version__"
 ]
+
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the package."""
+    if name == "proxy":
+        try:
+            value = importlib.import_module("synthlang.proxy")
+        except ImportError:
+            # Proxy module might not be available in some environments
+            value = None
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    globals()[name] = value
+    return value
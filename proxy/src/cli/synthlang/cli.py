@@ -1,29 +1,29 @@
 """Command-line interface for SynthLang."""
-import json
+import functools
+import mmap
 import os
-import sys
-from datetime import datetime
+import re
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import click
-import dspy
+import orjson
 
 from synthlang import __version__
 from synthlang.config import Config, ConfigManager
-from synthlang.core import (
-    FrameworkTranslator, 
-    SystemPromptGenerator, 
-    PromptOptimizer,
-    PromptEvolver,
-    PromptManager,
-    PromptClassifier
-)
 from synthlang.cli_proxy import register_proxy_commands
 
+# dspy and synthlang.core are slow to import, so the commands that need
+# them import them locally; --help, config and proxy commands never pay for it
 
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment."""
+    """Load configuration from environment.
+    
+    The configuration is loaded once per process; call
+    load_config.cache_clear() after changing it. Failures are not cached.
+    """
     try:
         config_manager = ConfigManager()
         return config_manager.load()
@@ -31,6 +31,26 @@ def load_config() -> Config:
         raise click.ClickException(f"Error loading configuration: {str(e)}")
 
 
+# OPENAI_API_KEY assignment in a .env file
+_API_KEY_RE = re.compile(rb"^OPENAI_API_KEY=(.*)$", re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_api_key(path: str, mtime: float) -> Optional[str]:
+    """Read OPENAI_API_KEY from a .env file; cached until the file's modification time changes.
+    
+    The file is memory-mapped and searched with a single regex instead of
+    being decoded and split line by line.
+    """
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _API_KEY_RE.search(mm)
+            return match.group(1).decode().strip() if match else None
+
+
 def get_api_key() -> str:
     """Get OpenAI API key from environment variable or root .env file."""
     # First check environment variable
@@ -41,21 +61,115 @@ def get_api_key() -> str:
     # Then check root .env file
     root_env = Path("/workspaces/SynthLang/.env")
     if root_env.exists():
-        with open(root_env) as f:
-            for line in f:
-                if line.startswith("OPENAI_API_KEY="):
-                    return line.strip().split("=", 1)[1]
+        api_key = _read_env_api_key(str(root_env), root_env.stat().st_mtime)
+        if api_key:
+            return api_key
                     
     raise click.ClickException(
         "OPENAI_API_KEY not found in environment or .env file"
     )
 
 
+# Language model configured as the DSPy default
+_configured_lm = None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_lm(model: str, api_key: str):
+    """Create a DSPy language model; cached per model and API key."""
+    import dspy
+    return dspy.LM(model=model, api_key=api_key, cache=True)
+
+
+def get_lm(model: str, api_key: str):
+    """Get the language model for a model and API key and make it the DSPy default."""
+    global _configured_lm
+    lm = _get_lm(model, api_key)
+    if lm is not _configured_lm:
+        import dspy
+        dspy.configure(lm=lm)
+        _configured_lm = lm
+    return lm
+
+
+# tiktoken encodings by model name; loading the BPE ranks takes milliseconds
+_encodings: Dict[str, Any] = {}
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count the tokens of a text for a model.
+    
+    Uses tiktoken when it is installed and falls back to a whitespace
+    word count otherwise.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return len(text.split())
+    
+    encoding = _encodings.get(model)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        _encodings[model] = encoding
+    return len(encoding.encode(text))
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="SynthLang CLI")
-def main():
+@click.pass_context
+def main(ctx: click.Context):
     """SynthLang CLI - Framework translation, prompt engineering, and proxy integration."""
-    pass
+    ctx.ensure_object(dict)
+    
+    # Keep DSPy's on-disk LM response cache in a stable per-user location so
+    # repeated translations and optimizations are served without an API call.
+    # DSPy reads this when it is first imported, which every command does
+    # after this callback; setting it here leaves importers of this module alone.
+    os.environ.setdefault("DSPY_CACHEDIR", os.path.expanduser("~/.cache/synthlang/dspy"))
+
+
+def get_settings(ctx: click.Context) -> Tuple[Config, str]:
+    """Get the configuration and API key shared by all commands of one invocation.
+    
+    Args:
+        ctx: Click context of the running command
+        
+    Returns:
+        Tuple of the configuration and the OpenAI API key
+    """
+    obj = ctx.ensure_object(dict)
+    if "config" not in obj:
+        obj["config"] = load_config()
+        obj["api_key"] = get_api_key()
+    return obj["config"], obj["api_key"]
+
+
+# Instructions for translating prompts to SynthLang format. They are sent
+# with every translation request, so they are kept terse: the symbols and
+# examples carry the format, the rules only state the constraints.
+_TRANSLATE_INSTRUCTIONS = """SYNTHLANG FORMAT RULES:
+- Symbols ONLY: ↹ input, ⊕ process, Σ output
+- • joins items, => transforms, math ops + > < ^
+- No quotes, arrows (->) or descriptions
+- Max 30 chars/line; one step per line; be extremely concise
+
+GOOD:
+↹ data•source
+⊕ condition>5 => action
+Σ result + log
+
+↹ news•feed•google
+⊕ sentiment>0 => pos
+⊕ sentiment<0 => neg
+Σ trend + factors
+
+BAD (verbose):
+↹ data:"source" -> Parse input
+
+Convert input to SynthLang."""
 
 
 @main.command()
@@ -63,7 +177,8 @@ def main():
 @click.option("--framework", required=True, help="Target framework for translation (use 'synthlang' for SynthLang format)")
 @click.option("--show-metrics", is_flag=True, help="Show token and cost metrics")
 @click.option("--use-proxy", is_flag=True, help="Use proxy service if available")
-def translate(source: str, framework: str, show_metrics: bool, use_proxy: bool):
+@click.pass_context
+def translate(ctx: click.Context, source: str, framework: str, show_metrics: bool, use_proxy: bool):
     """Translate natural language prompts to SynthLang format.
     
     Example:
@@ -80,27 +195,29 @@ def translate(source: str, framework: str, show_metrics: bool, use_proxy: bool):
     # Try to use proxy if requested
     if use_proxy:
         try:
-            from synthlang.proxy.api import ProxyClient
+            from synthlang.proxy.api import get_client
             from synthlang.proxy.auth import get_credentials
             
             creds = get_credentials()
             if "api_key" in creds:
                 endpoint = creds.get("endpoint", "https://api.synthlang.org")
-                client = ProxyClient(endpoint, creds["api_key"])
+                client = get_client(endpoint, creds["api_key"])
                 
                 click.echo("Using proxy service for translation...")
                 response = client.translate(source, framework)
                 
-                click.echo("Translation complete")
-                click.echo("\nSource prompt:")
-                click.echo(source)
-                click.echo("\nTranslated prompt:")
-                click.echo(response["target"])
+                lines = [
+                    "Translation complete",
+                    "\nSource prompt:",
+                    source,
+                    "\nTranslated prompt:",
+                    response["target"],
+                ]
                 
                 if "explanation" in response:
-                    click.echo("\nExplanation:")
-                    click.echo(response["explanation"])
+                    lines += ["\nExplanation:", response["explanation"]]
                 
+                click.echo("\n".join(lines))
                 return
             else:
                 click.echo("No API key found for proxy service. Falling back to local translation.")
@@ -108,59 +225,21 @@ def translate(source: str, framework: str, show_metrics: bool, use_proxy: bool):
             click.echo(f"Error using proxy service: {str(e)}. Falling back to local translation.")
     
     # Local implementation
-    config_data = load_config()
-    api_key = get_api_key()
+    from synthlang.core import FrameworkTranslator
+    
+    config_data, api_key = get_settings(ctx)
+    
+    # Get the shared language model
+    lm = get_lm(config_data.model, api_key)
     
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
-
-    # Set up translation instructions
-    instructions = """SYNTHLANG TRANSLATION FORMAT:
-
-RULES:
-1. Use ONLY these symbols: ↹ (input), ⊕ (process), Σ (output)
-2. NO quotes, arrows, or descriptions
-3. Use • to join related items
-4. Use => for transformations
-5. Maximum 30 characters per line
-6. Use mathematical operators (+, >, <, ^)
-7. Break complex tasks into steps
-
-IMPORTANT: Keep translations extremely concise!
-
-GOOD EXAMPLES:
-↹ data•source
-⊕ condition>5 => action
-Σ result + log
-
-↹ input•stream, params
-⊕ transform => output
-⊕ Σ final^2 + cache
-
-↹ news•feed•google
-⊕ sentiment>0 => pos
-⊕ sentiment<0 => neg
-Σ trend + factors
-
-BAD EXAMPLES (TOO VERBOSE):
-↹ data:"source" -> Parse input
-⊕ process:"condition" -> Check value
-
-Convert input to concise SynthLang format using minimal symbols."""
-
     translator = FrameworkTranslator(lm=lm)
     try:
-        result = translator.translate(source, instructions)
+        result = translator.translate(source, _TRANSLATE_INSTRUCTIONS)
         
         # Calculate metrics if requested
         if show_metrics:
-            # Simple token estimation (can be improved)
-            def calculate_tokens(text: str) -> int:
-                return len(text.split())
-            
-            original_tokens = calculate_tokens(source)
-            translated_tokens = calculate_tokens(result["target"])
+            original_tokens = count_tokens(source, config_data.model)
+            translated_tokens = count_tokens(result["target"], config_data.model)
             
             # Estimate cost using standard rate
             cost_per_1k = 0.0025  # $2.50 per million tokens
@@ -169,20 +248,20 @@ Convert input to concise SynthLang format using minimal symbols."""
             savings = max(0, original_cost - translated_cost)
             reduction = ((original_tokens - translated_tokens) / original_tokens * 100)
             
-            click.echo("\nMetrics:")
-            click.echo(f"Original Tokens: {original_tokens}")
-            click.echo(f"Translated Tokens: {translated_tokens}")
-            click.echo(f"Cost Savings: ${savings:.4f}")
-            click.echo(f"Token Reduction: {reduction:.0f}%")
-            click.echo("")
+            click.echo(
+                f"\nMetrics:\n"
+                f"Original Tokens: {original_tokens}\n"
+                f"Translated Tokens: {translated_tokens}\n"
+                f"Cost Savings: ${savings:.4f}\n"
+                f"Token Reduction: {reduction:.0f}%\n"
+            )
         
-        click.echo("Translation complete")
-        click.echo("\nSource prompt:")
-        click.echo(source)
-        click.echo("\nTranslated prompt:")
-        click.echo(result["target"])
-        click.echo("\nExplanation:")
-        click.echo(result["explanation"])
+        click.echo(
+            f"Translation complete\n"
+            f"\nSource prompt:\n{source}\n"
+            f"\nTranslated prompt:\n{result['target']}\n"
+            f"\nExplanation:\n{result['explanation']}"
+        )
         
     except Exception as e:
         raise click.ClickException(f"Translation failed: {str(e)}")
@@ -190,26 +269,26 @@ Convert input to concise SynthLang format using minimal symbols."""
 
 @main.command()
 @click.option("--task", required=True, help="Task description")
-def generate(task: str):
+@click.pass_context
+def generate(ctx: click.Context, task: str):
     """Generate system prompts."""
-    config_data = load_config()
-    api_key = get_api_key()
+    from synthlang.core import SystemPromptGenerator
+    
+    config_data, api_key = get_settings(ctx)
     
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
+    # Get the shared language model
+    lm = get_lm(config_data.model, api_key)
     
     # Initialize generator with language model
     generator = SystemPromptGenerator(lm=lm)
     try:
         result = generator.generate(task)
-        click.echo("System prompt generated")
-        click.echo("\nPrompt:")
-        click.echo(result["prompt"])
-        click.echo("\nRationale:")
-        click.echo(result["rationale"])
-        click.echo("\nMetadata:")
-        click.echo(json.dumps(result["metadata"], indent=2))
+        click.echo(
+            f"System prompt generated\n"
+            f"\nPrompt:\n{result['prompt']}\n"
+            f"\nRationale:\n{result['rationale']}\n"
+            f"\nMetadata:\n{orjson.dumps(result['metadata'], option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}"
+        )
     except Exception as e:
         raise click.ClickException(f"Generation failed: {str(e)}")
 
@@ -217,33 +296,36 @@ def generate(task: str):
 @main.command()
 @click.option("--prompt", required=True, help="Prompt to optimize")
 @click.option("--use-proxy", is_flag=True, help="Use proxy service if available")
-def optimize(prompt: str, use_proxy: bool):
+@click.pass_context
+def optimize(ctx: click.Context, prompt: str, use_proxy: bool):
     """Optimize prompts using DSPy techniques."""
     # Try to use proxy if requested
     if use_proxy:
         try:
-            from synthlang.proxy.api import ProxyClient
+            from synthlang.proxy.api import get_client
             from synthlang.proxy.auth import get_credentials
             
             creds = get_credentials()
             if "api_key" in creds:
                 endpoint = creds.get("endpoint", "https://api.synthlang.org")
-                client = ProxyClient(endpoint, creds["api_key"])
+                client = get_client(endpoint, creds["api_key"])
                 
                 click.echo("Using proxy service for optimization...")
                 response = client.optimize(prompt)
                 
-                click.echo("Prompt optimized")
-                click.echo("\nOriginal prompt:")
-                click.echo(response.get("original", prompt))
-                click.echo("\nOptimized prompt:")
-                click.echo(response.get("optimized", "No optimization available"))
+                lines = [
+                    "Prompt optimized",
+                    "\nOriginal prompt:",
+                    response.get("original", prompt),
+                    "\nOptimized prompt:",
+                    response.get("optimized", "No optimization available"),
+                ]
                 
                 if "improvements" in response:
-                    click.echo("\nImprovements made:")
-                    for improvement in response["improvements"]:
-                        click.echo(f"- {improvement}")
+                    lines.append("\nImprovements made:")
+                    lines.extend(f"- {improvement}" for improvement in response["improvements"])
                 
+                click.echo("\n".join(lines))
                 return
             else:
                 click.echo("No API key found for proxy service. Falling back to local optimization.")
@@ -251,29 +333,29 @@ def optimize(prompt: str, use_proxy: bool):
             click.echo(f"Error using proxy service: {str(e)}. Falling back to local optimization.")
     
     # Local implementation
-    config_data = load_config()
-    api_key = get_api_key()
+    from synthlang.core import PromptOptimizer
+    
+    config_data, api_key = get_settings(ctx)
     
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
+    # Get the shared language model
+    lm = get_lm(config_data.model, api_key)
     
     # Initialize optimizer with language model
     optimizer = PromptOptimizer(lm=lm)
     try:
         result = optimizer.optimize(prompt)
-        click.echo("Prompt optimized")
-        click.echo("\nOriginal prompt:")
-        click.echo(result["original"])
-        click.echo("\nOptimized prompt:")
-        click.echo(result["optimized"])
-        click.echo("\nImprovements made:")
-        for improvement in result["improvements"]:
-            click.echo(f"- {improvement}")
-        click.echo("\nMetrics:")
-        click.echo(f"- Clarity: {float(result['metrics']['clarity_score']):.2f}")
-        click.echo(f"- Specificity: {float(result['metrics']['specificity_score']):.2f}")
-        click.echo(f"- Consistency: {float(result['metrics']['consistency_score']):.2f}")
+        metrics = result["metrics"]
+        improvements = "".join(f"- {improvement}\n" for improvement in result["improvements"])
+        click.echo(
+            f"Prompt optimized\n"
+            f"\nOriginal prompt:\n{result['original']}\n"
+            f"\nOptimized prompt:\n{result['optimized']}\n"
+            f"\nImprovements made:\n{improvements}"
+            f"\nMetrics:\n"
+            f"- Clarity: {float(metrics['clarity_score']):.2f}\n"
+            f"- Specificity: {float(metrics['specificity_score']):.2f}\n"
+            f"- Consistency: {float(metrics['consistency_score']):.2f}"
+        )
     except Exception as e:
         raise click.ClickException(f"Optimization failed: {str(e)}")
 
@@ -290,9 +372,11 @@ def prompt():
 @click.option("--metadata", help="Optional JSON metadata")
 def save(name: str, prompt: str, metadata: Optional[str] = None):
     """Save a prompt with metadata."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
-        meta_dict = json.loads(metadata) if metadata else None
+        meta_dict = orjson.loads(metadata) if metadata else None
         manager.save(name, prompt, meta_dict)
         click.echo(f"Prompt saved as: {name}")
     except Exception as e:
@@ -310,12 +394,13 @@ def show():
     """Show current configuration."""
     try:
         config_data = load_config()
-        click.echo("\nCurrent configuration:")
+        lines = ["\nCurrent configuration:"]
         for key, value in config_data.dict().items():
             # Mask API key
             if key == "openai_api_key" and value:
                 value = value[:4] + "..." + value[-4:]
-            click.echo(f"{key}: {value}")
+            lines.append(f"{key}: {value}")
+        click.echo("\n".join(lines))
     except Exception as e:
         raise click.ClickException(f"Failed to show configuration: {str(e)}")
 
@@ -323,11 +408,14 @@ def show():
 @config.command()
 @click.argument("key")
 @click.argument("value")
-def set(key: str, value: str):
+@click.pass_context
+def set(ctx: click.Context, key: str, value: str):
     """Set a configuration value."""
     try:
         config_manager = ConfigManager()
         config_manager.update({key: value})
+        load_config.cache_clear()
+        ctx.ensure_object(dict).pop("config", None)
         click.echo(f"Updated {key} = {value}")
     except Exception as e:
         raise click.ClickException(f"Failed to update configuration: {str(e)}")
@@ -0,0 +1,5 @@
+"""Proxy subcommands for SynthLang CLI.
+
+Each module defines one subcommand of ``synthlang proxy`` as ``cmd``; the
+modules are only imported when their subcommand is used.
+"""
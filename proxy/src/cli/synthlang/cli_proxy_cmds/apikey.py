@@ -0,0 +1,80 @@
+"""Proxy apikey command for SynthLang CLI."""
+import os
+import sys
+from typing import Optional
+
+import click
+
+# Root of the proxy project, which contains the src.cli.api_keys module
+_PROXY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+
+
+@click.group()
+def apikey():
+    """Manage API keys for the proxy server."""
+    pass
+
+
+@apikey.command()
+def list():
+    """List all API keys.
+    
+    Example:
+        synthlang proxy apikey list
+    """
+    try:
+        # Make the proxy's api_keys module importable
+        if _PROXY_ROOT not in sys.path:
+            sys.path.insert(0, _PROXY_ROOT)
+        
+        from src.cli.api_keys import list_keys
+        
+        list_keys()
+    except Exception as e:
+        raise click.ClickException(f"Failed to list API keys: {str(e)}")
+
+
+@apikey.command()
+@click.option("--user-id", "-u", required=True, help="User ID")
+@click.option("--rate-limit", "-r", type=int, help="Rate limit in requests per minute")
+@click.option("--prefix", "-p", default="sk_", help="API key prefix")
+@click.option("--save-env", "-s", is_flag=True, help="Save API key to .env file")
+def create(user_id: str, rate_limit: Optional[int], prefix: str, save_env: bool):
+    """Create a new API key.
+    
+    Example:
+        synthlang proxy apikey create --user-id "test_user" --rate-limit 100 --save-env
+    """
+    try:
+        # Make the proxy's api_keys module importable
+        if _PROXY_ROOT not in sys.path:
+            sys.path.insert(0, _PROXY_ROOT)
+        
+        from src.cli.api_keys import create_key
+        
+        create_key(user_id, rate_limit, prefix, save_env)
+    except Exception as e:
+        raise click.ClickException(f"Failed to create API key: {str(e)}")
+
+
+@apikey.command()
+@click.argument("api_key")
+def delete(api_key: str):
+    """Delete an API key.
+    
+    Example:
+        synthlang proxy apikey delete "sk_1234567890abcdef"
+    """
+    try:
+        # Make the proxy's api_keys module importable
+        if _PROXY_ROOT not in sys.path:
+            sys.path.insert(0, _PROXY_ROOT)
+        
+        from src.cli.api_keys import delete_key
+        
+        delete_key(api_key)
+    except Exception as e:
+        raise click.ClickException(f"Failed to delete API key: {str(e)}")
+
+
+cmd = apikey
@@ -0,0 +1,30 @@
+"""Proxy cache-stats command for SynthLang CLI."""
+import click
+
+
+@click.command()
+def cache_stats():
+    """Show semantic cache statistics.
+    
+    Example:
+        synthlang proxy cache-stats
+    """
+    try:
+        from synthlang.proxy.cache import get_semantic_cache
+        
+        cache = get_semantic_cache()
+        stats = cache.get_stats()
+        
+        click.echo("\n".join([
+            "\nCache Statistics:",
+            f"Total entries: {stats['total_entries']}",
+            f"Total size: {stats['total_size_bytes'] / 1024:.1f} KB",
+            f"Expired entries: {stats['expired_entries']}",
+            f"Cache directory: {stats['cache_dir']}",
+            f"Default TTL: {stats['default_ttl']} seconds",
+        ]))
+    except Exception as e:
+        raise click.ClickException(f"Failed to get cache stats: {str(e)}")
+
+
+cmd = cache_stats
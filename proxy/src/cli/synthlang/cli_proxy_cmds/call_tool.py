@@ -0,0 +1,24 @@
+"""Proxy call-tool command for SynthLang CLI."""
+import click
+import orjson
+
+
+@click.command()
+@click.option("--tool", required=True, help="Tool name")
+@click.option("--args", required=True, help="JSON-encoded arguments")
+def call_tool(tool: str, args: str):
+    """Call an agent tool with arguments.
+    
+    Example:
+        synthlang proxy call-tool --tool "calculate" --args '{"expression": "2 + 2"}'
+    """
+    try:
+        from synthlang.proxy.agents.registry import call_tool_with_json
+        
+        result = call_tool_with_json(tool, args)
+        click.echo(f"Result: {orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}")
+    except Exception as e:
+        raise click.ClickException(f"Tool call failed: {str(e)}")
+
+
+cmd = call_tool
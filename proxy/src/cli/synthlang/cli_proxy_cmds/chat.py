@@ -0,0 +1,66 @@
+"""Proxy chat command for SynthLang CLI."""
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option("--model", help="Model to use")
+@click.option("--system", help="System message")
+@click.option("--temperature", type=float, default=0.7, help="Temperature for sampling")
+@click.option("--max-tokens", type=int, help="Maximum tokens to generate")
+@click.argument("prompt")
+def chat(model: Optional[str], system: Optional[str], temperature: float, 
+         max_tokens: Optional[int], prompt: str):
+    """Send a chat request to the proxy.
+    
+    Example:
+        synthlang proxy chat --model "gpt-4o" "What is the capital of France?"
+    """
+    try:
+        from synthlang.proxy.api import get_client
+        from synthlang.proxy.auth import get_credentials
+        from synthlang.proxy.config import get_proxy_config
+        
+        config = get_proxy_config()
+        creds = get_credentials()
+        
+        if "api_key" not in creds:
+            raise click.ClickException(
+                "No API key found. Run 'synthlang proxy login' first."
+            )
+        
+        endpoint = creds.get("endpoint", config.endpoint)
+        client = get_client(endpoint, creds["api_key"])
+        
+        # Build messages
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        
+        # Set up parameters
+        params = {
+            "temperature": temperature
+        }
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+        
+        # Send request
+        response = client.chat_completion(
+            messages, 
+            model=model or config.default_model,
+            **params
+        )
+        
+        # Extract and print response
+        if "choices" in response and len(response["choices"]) > 0:
+            content = response["choices"][0]["message"]["content"]
+            click.echo(content)
+        else:
+            click.echo("No response received")
+    except Exception as e:
+        raise click.ClickException(f"Chat failed: {str(e)}")
+
+
+cmd = chat
@@ -0,0 +1,22 @@
+"""Proxy clear-cache command for SynthLang CLI."""
+import click
+
+
+@click.command()
+def clear_cache():
+    """Clear the semantic cache.
+    
+    Example:
+        synthlang proxy clear-cache
+    """
+    try:
+        from synthlang.proxy.cache import get_semantic_cache
+        
+        cache = get_semantic_cache()
+        count = cache.clear()
+        click.echo(f"Cleared {count} cache entries")
+    except Exception as e:
+        raise click.ClickException(f"Failed to clear cache: {str(e)}")
+
+
+cmd = clear_cache
@@ -0,0 +1,37 @@
+"""Proxy compress command for SynthLang CLI."""
+import click
+
+
+@click.command()
+@click.option("--use-gzip", is_flag=True, help="Use gzip compression")
+@click.argument("prompt")
+def compress(use_gzip: bool, prompt: str):
+    """Compress a prompt using SynthLang compression.
+    
+    Example:
+        synthlang proxy compress --use-gzip "Your prompt here"
+    """
+    try:
+        from synthlang.proxy.compression import compress_prompt, get_compression_stats
+        
+        # Compress the prompt
+        compressed = compress_prompt(prompt, use_gzip)
+        
+        # Get stats
+        stats = get_compression_stats(prompt, compressed)
+        
+        # Print results
+        click.echo("\n".join([
+            f"Original ({stats['original_length']} chars):",
+            prompt,
+            f"\nCompressed ({stats['compressed_length']} chars):",
+            compressed,
+            f"\nCompression ratio: {stats['compression_ratio']:.2f}x",
+            f"Space saving: {stats['space_savings_percent']:.1f}%",
+            f"Method: {'gzip+synthlang' if use_gzip else 'synthlang'}",
+        ]))
+    except Exception as e:
+        raise click.ClickException(f"Compression failed: {str(e)}")
+
+
+cmd = compress
@@ -0,0 +1,30 @@
+"""Proxy decompress command for SynthLang CLI."""
+import click
+
+
+@click.command()
+@click.argument("compressed")
+def decompress(compressed: str):
+    """Decompress a SynthLang-compressed prompt.
+    
+    Example:
+        synthlang proxy decompress "↹ compressed•text"
+    """
+    try:
+        from synthlang.proxy.compression import decompress_prompt
+        
+        # Decompress the prompt
+        decompressed = decompress_prompt(compressed)
+        
+        # Print results
+        click.echo("\n".join([
+            f"Compressed ({len(compressed)} chars):",
+            compressed,
+            f"\nDecompressed ({len(decompressed)} chars):",
+            decompressed,
+        ]))
+    except Exception as e:
+        raise click.ClickException(f"Decompression failed: {str(e)}")
+
+
+cmd = decompress
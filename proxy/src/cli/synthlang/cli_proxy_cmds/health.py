@@ -0,0 +1,38 @@
+"""Proxy health command for SynthLang CLI."""
+import click
+
+
+@click.command()
+def health():
+    """Check the health of the proxy service.
+    
+    Example:
+        synthlang proxy health
+    """
+    try:
+        from synthlang.proxy.api import get_client
+        from synthlang.proxy.auth import get_credentials
+        from synthlang.proxy.config import get_proxy_config
+        
+        config = get_proxy_config()
+        creds = get_credentials()
+        
+        if "api_key" not in creds:
+            raise click.ClickException(
+                "No API key found. Run 'synthlang proxy login' first."
+            )
+        
+        endpoint = creds.get("endpoint", config.endpoint)
+        client = get_client(endpoint, creds["api_key"])
+        
+        response = client.health_check()
+        click.echo("\n".join([
+            "Proxy service is healthy",
+            f"Status: {response.get('status', 'unknown')}",
+            f"Version: {response.get('version', 'unknown')}",
+        ]))
+    except Exception as e:
+        raise click.ClickException(f"Health check failed: {str(e)}")
+
+
+cmd = health
@@ -0,0 +1,27 @@
+"""Proxy login command for SynthLang CLI."""
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option("--api-key", required=True, help="API key for proxy service")
+@click.option("--endpoint", help="Proxy endpoint URL")
+def login(api_key: str, endpoint: Optional[str]):
+    """Save credentials for proxy service.
+    
+    Example:
+        synthlang proxy login --api-key "your-key" --endpoint "https://api.example.com"
+    """
+    try:
+        from synthlang.proxy.auth import save_credentials
+        
+        save_credentials(api_key, endpoint)
+        click.echo(f"Credentials saved successfully")
+        if endpoint:
+            click.echo(f"Endpoint: {endpoint}")
+    except Exception as e:
+        raise click.ClickException(f"Failed to save credentials: {str(e)}")
+
+
+cmd = login
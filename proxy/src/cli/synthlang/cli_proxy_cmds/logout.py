@@ -0,0 +1,21 @@
+"""Proxy logout command for SynthLang CLI."""
+import click
+
+
+@click.command()
+def logout():
+    """Clear saved proxy credentials.
+    
+    Example:
+        synthlang proxy logout
+    """
+    try:
+        from synthlang.proxy.auth import clear_credentials
+        
+        clear_credentials()
+        click.echo("Credentials cleared successfully")
+    except Exception as e:
+        raise click.ClickException(f"Failed to clear credentials: {str(e)}")
+
+
+cmd = logout
@@ -0,0 +1,27 @@
+"""Proxy serve command for SynthLang CLI."""
+from typing import Optional
+
+import click
+
+
+@click.command()
+@click.option("--host", help="Host to bind to")
+@click.option("--port", type=int, help="Port to bind to")
+@click.option("--log-level", default="info", help="Logging level")
+@click.option("--reload", is_flag=True, help="Enable auto-reload")
+def serve(host: Optional[str], port: Optional[int], log_level: str, reload: bool):
+    """Start a local proxy server.
+    
+    Example:
+        synthlang proxy serve --port 8000
+    """
+    try:
+        from synthlang.proxy.server import start_server
+        
+        click.echo(f"Starting proxy server...")
+        start_server(host=host, port=port, log_level=log_level, reload=reload)
+    except Exception as e:
+        raise click.ClickException(f"Failed to start server: {str(e)}")
+
+
+cmd = serve
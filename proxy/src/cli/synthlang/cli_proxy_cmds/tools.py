@@ -0,0 +1,47 @@
+"""Proxy tools command for SynthLang CLI."""
+import io
+
+import click
+
+
+@click.command()
+def tools():
+    """List available agent tools.
+    
+    Example:
+        synthlang proxy tools
+    """
+    try:
+        from synthlang.proxy.agents.registry import list_tools, get_tool_schema
+        
+        tool_names = list_tools()
+        
+        if not tool_names:
+            click.echo("No tools registered")
+            return
+        
+        # Collect the listing and write it in one go
+        out = io.StringIO()
+        out.write(f"\nAvailable Tools ({len(tool_names)}):\n")
+        for name in sorted(tool_names):
+            try:
+                schema = get_tool_schema(name)
+                out.write(f"\n{name}:\n")
+                out.write(f"  Description: {schema.get('description', 'No description')}\n")
+                
+                # Show parameters
+                params = schema.get("parameters")
+                if params:
+                    out.write("  Parameters:\n")
+                    for param_name, param_info in params.items():
+                        required = "required" if param_info.get("required", False) else "optional"
+                        out.write(f"    {param_name} ({param_info.get('type', 'any')}, {required})\n")
+            except Exception as e:
+                out.write(f"{name}: Error getting schema - {str(e)}\n")
+        
+        click.echo(out.getvalue(), nl=False)
+    except Exception as e:
+        raise click.ClickException(f"Failed to list tools: {str(e)}")
+
+
+cmd = tools
@@ -13,4 +13,7 @@ class SynthLangModule(dspy.Module):
         """
         super().__init__()
         self.lm = lm
-        dspy.configure(lm=self.lm)
+        # Reconfigure DSPy only when the default LM changes; the CLI
+        # usually configured this LM already in get_lm
+        if dspy.settings.lm is not lm:
+            dspy.configure(lm=self.lm)
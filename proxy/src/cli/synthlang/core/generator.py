@@ -5,7 +5,7 @@ from typing import Any
 
 from .base import SynthLangModule
 from .signatures import GenerateSignature
-from .types import GenerationResult, SynthLangSymbols
+from .types import GenerationResult, SynthLangSymbols, CORE_SYMBOLS_RE
 
 class SystemPromptGenerator(SynthLangModule):
     """Generates system prompts from task descriptions."""
@@ -63,7 +63,7 @@ class SystemPromptGenerator(SynthLangModule):
             line = line.replace('"', '').replace("'", '')
             
             # Ensure proper symbol usage
-            if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
+            if not CORE_SYMBOLS_RE.search(line):
                 continue
                 
             # Enforce line length limit
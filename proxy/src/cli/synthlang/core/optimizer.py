@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from .base import SynthLangModule
 from .signatures import OptimizeSignature
-from .types import SynthLangSymbols
+from .types import SynthLangSymbols, CORE_SYMBOLS_RE
 
 class PromptOptimizer(SynthLangModule):
     """Optimizes prompts using DSPy techniques."""
@@ -65,7 +65,7 @@ class PromptOptimizer(SynthLangModule):
             line = line.replace('"', '').replace("'", '')
             
             # Ensure proper symbol usage
-            if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
+            if not CORE_SYMBOLS_RE.search(line):
                 continue
                 
             # Enforce line length limit
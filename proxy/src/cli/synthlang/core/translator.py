@@ -5,7 +5,7 @@ import dspy
 
 from .base import SynthLangModule
 from .signatures import TranslateSignature
-from .types import TranslationResult, SynthLangSymbols
+from .types import TranslationResult, SynthLangSymbols, CORE_SYMBOLS_RE
 
 class FrameworkTranslator(SynthLangModule):
     """Translates natural language prompts to SynthLang format."""
@@ -70,7 +70,7 @@ class FrameworkTranslator(SynthLangModule):
                 line = line.replace('"', '').replace("'", '')
                 
                 # Ensure proper symbol usage
-                if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
+                if not CORE_SYMBOLS_RE.search(line):
                     continue
                     
                 # Enforce line length limit
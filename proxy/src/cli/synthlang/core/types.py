@@ -1,4 +1,5 @@
 """Type definitions for SynthLang modules."""
+import re
 from typing import Dict, List, TypedDict
 
 class TranslationResult(TypedDict):
@@ -28,6 +29,11 @@ class SynthLangSymbols:
     JOIN = "•"
     TRANSFORM = "=>"
 
+# Matches any of the input, process and output symbols in a single scan
+CORE_SYMBOLS_RE = re.compile(
+    f"[{SynthLangSymbols.INPUT}{SynthLangSymbols.PROCESS}{SynthLangSymbols.OUTPUT}]"
+)
+
 class FormatRules:
     """SynthLang formatting rules."""
     MAX_LINE_LENGTH = 30
@@ -9,27 +9,35 @@ This module provides proxy functionality for SynthLang, including:
 - Agent SDK and tool registry
 """
 
-from synthlang.proxy.api import ProxyClient
-from synthlang.proxy.auth import (
-    get_credentials,
-    save_credentials,
-    clear_credentials,
-    validate_api_key
-)
-from synthlang.proxy.cache import SemanticCache, get_semantic_cache
-from synthlang.proxy.compression import (
-    compress_prompt,
-    decompress_prompt,
-    compress_with_gzip,
-    decompress_with_gzip,
-    get_compression_stats
-)
-from synthlang.proxy.config import ProxyConfig, get_proxy_config
-from synthlang.proxy.server import create_app, start_server
+import importlib
+
+# Public names and the modules that define them; these are imported on
+# first access so that importing the package does not pull in the server
+# (FastAPI, uvicorn) or the cache unless they are used
+_LAZY_ATTRS = {
+    "ProxyClient": "synthlang.proxy.api",
+    "get_client": "synthlang.proxy.api",
+    "get_credentials": "synthlang.proxy.auth",
+    "save_credentials": "synthlang.proxy.auth",
+    "clear_credentials": "synthlang.proxy.auth",
+    "validate_api_key": "synthlang.proxy.auth",
+    "SemanticCache": "synthlang.proxy.cache",
+    "get_semantic_cache": "synthlang.proxy.cache",
+    "compress_prompt": "synthlang.proxy.compression",
+    "decompress_prompt": "synthlang.proxy.compression",
+    "compress_with_gzip": "synthlang.proxy.compression",
+    "decompress_with_gzip": "synthlang.proxy.compression",
+    "get_compression_stats": "synthlang.proxy.compression",
+    "ProxyConfig": "synthlang.proxy.config",
+    "get_proxy_config": "synthlang.proxy.config",
+    "create_app": "synthlang.proxy.server",
+    "start_server": "synthlang.proxy.server",
+}
 
 __all__ = [
     # API client
     "ProxyClient",
+    "get_client",
     
     # Authentication
     "get_credentials",
@@ -58,4 +66,14 @@ __all__ = [
 ]
 
 # Version of the proxy module
-__version__ = "0.2.0"
\ No newline at end of file
+__version__ = "0.2.0"
+
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the package."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,18 @@
 """Agent SDK for SynthLang Proxy."""
-
-from synthlang.proxy.agents.registry import register_tool, get_tool, list_tools
+import importlib
 
 __all__ = [
     "register_tool",
     "get_tool",
     "list_tools"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the registry functions on first access and cache them on the package."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module("synthlang.proxy.agents.registry"), name)
+    globals()[name] = value
+    return value
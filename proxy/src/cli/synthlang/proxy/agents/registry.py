@@ -1,14 +1,25 @@
 """Tool registry for SynthLang agents."""
+import ast
+import asyncio
+import functools
 import inspect
-import json
+import operator
+import re
+import sys
 from typing import Dict, Callable, Any, List, Optional, Union, get_type_hints
 
+import orjson
+
 from synthlang.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Global registry of tools
 _TOOLS: Dict[str, Callable] = {}
+_TOOL_DESCRIPTIONS: Dict[str, Optional[str]] = {}
+
+# Tool schemas, built from the function signatures on first request so that
+# registering tools at import time stays cheap
 _TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {}
 
 
@@ -27,45 +38,15 @@ def register_tool(name: Optional[str] = None, description: Optional[str] = None)
     def decorator(func: Callable) -> Callable:
         nonlocal name, description
         
-        # Use function name if no name provided
-        tool_name = name or func.__name__
-        
-        # Use docstring if no description provided
-        tool_description = description or inspect.getdoc(func) or ""
-        
-        # Get function signature
-        sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
-        
-        # Build schema for the tool
-        parameters = {}
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-                
-            param_type = type_hints.get(param_name, Any).__name__
-            param_default = None if param.default is inspect.Parameter.empty else param.default
-            param_required = param.default is inspect.Parameter.empty
-            
-            parameters[param_name] = {
-                "type": param_type,
-                "required": param_required
-            }
-            
-            if param_default is not None:
-                parameters[param_name]["default"] = param_default
-        
-        # Store tool schema
-        _TOOL_SCHEMAS[tool_name] = {
-            "name": tool_name,
-            "description": tool_description,
-            "parameters": parameters,
-            "return_type": type_hints.get("return", Any).__name__
-        }
+        # Use function name if no name provided; interned so that lookups
+        # with the same name object match on identity
+        tool_name = sys.intern(name or func.__name__)
         
-        # Register the tool
+        # Register the tool; its schema is built on first request
         _TOOLS[tool_name] = func
-        logger.debug(f"Registered tool: {tool_name}")
+        _TOOL_DESCRIPTIONS[tool_name] = description
+        _TOOL_SCHEMAS.pop(tool_name, None)
+        logger.debug("Registered tool: %s", tool_name)
         
         return func
     
@@ -77,6 +58,53 @@ def register_tool(name: Optional[str] = None, description: Optional[str] = None)
     return decorator
 
 
+def _build_schema(tool_name: str) -> Dict[str, Any]:
+    """Build the schema of a registered tool from its signature.
+    
+    Args:
+        tool_name: Name of the tool
+        
+    Returns:
+        Tool schema
+    """
+    func = _TOOLS[tool_name]
+    
+    # Use docstring if no description provided
+    tool_description = _TOOL_DESCRIPTIONS[tool_name] or inspect.getdoc(func) or ""
+    
+    # Get function signature; the annotations only need resolving with
+    # get_type_hints when some of them are forward-reference strings
+    sig = inspect.signature(func)
+    type_hints = func.__annotations__
+    if any(isinstance(hint, str) for hint in type_hints.values()):
+        type_hints = get_type_hints(func)
+    
+    # Build schema for the tool
+    parameters = {}
+    for param_name, param in sig.parameters.items():
+        if param_name == 'self':
+            continue
+            
+        param_type = getattr(type_hints.get(param_name, Any), "__name__", "Any")
+        param_default = None if param.default is inspect.Parameter.empty else param.default
+        param_required = param.default is inspect.Parameter.empty
+        
+        parameters[param_name] = {
+            "type": param_type,
+            "required": param_required
+        }
+        
+        if param_default is not None:
+            parameters[param_name]["default"] = param_default
+    
+    return {
+        "name": tool_name,
+        "description": tool_description,
+        "parameters": parameters,
+        "return_type": getattr(type_hints.get("return", Any), "__name__", "Any")
+    }
+
+
 def get_tool(name: str) -> Callable:
     """Get a tool from the registry.
     
@@ -89,9 +117,10 @@ def get_tool(name: str) -> Callable:
     Raises:
         ValueError: If tool not found
     """
-    if name not in _TOOLS:
+    tool = _TOOLS.get(name)
+    if tool is None:
         raise ValueError(f"Tool '{name}' not found in registry")
-    return _TOOLS[name]
+    return tool
 
 
 def get_tool_schema(name: str) -> Dict[str, Any]:
@@ -106,9 +135,12 @@ def get_tool_schema(name: str) -> Dict[str, Any]:
     Raises:
         ValueError: If tool not found
     """
-    if name not in _TOOL_SCHEMAS:
-        raise ValueError(f"Tool schema for '{name}' not found in registry")
-    return _TOOL_SCHEMAS[name]
+    schema = _TOOL_SCHEMAS.get(name)
+    if schema is None:
+        if name not in _TOOLS:
+            raise ValueError(f"Tool schema for '{name}' not found in registry")
+        schema = _TOOL_SCHEMAS[name] = _build_schema(name)
+    return schema
 
 
 def list_tools() -> List[str]:
@@ -126,30 +158,70 @@ def get_all_tool_schemas() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary of tool schemas
     """
+    for name in _TOOLS:
+        if name not in _TOOL_SCHEMAS:
+            _TOOL_SCHEMAS[name] = _build_schema(name)
     return _TOOL_SCHEMAS
 
 
-def call_tool(name: str, **kwargs) -> Any:
-    """Call a tool by name with arguments.
+def _invoke(name: str, kwargs: Dict[str, Any]) -> Any:
+    """Call a tool by name with a dictionary of arguments.
+    
+    The tool is looked up with a single dictionary access and the argument
+    dictionary is passed through as-is, so callers that already hold one
+    (such as call_tool_with_json) do not rebuild it.
+    
+    Async tools are run to completion when no event loop is running; callers
+    inside an event loop get the coroutine back and must await it.
     
     Args:
         name: Name of the tool
-        **kwargs: Arguments to pass to the tool
+        kwargs: Arguments to pass to the tool
         
     Returns:
-        Tool result
+        Tool result, or a coroutine for async tools called from an event loop
         
     Raises:
         ValueError: If tool not found
     """
-    tool = get_tool(name)
+    tool = _TOOLS.get(name)
+    if tool is None:
+        raise ValueError(f"Tool '{name}' not found in registry")
     try:
-        return tool(**kwargs)
+        result = tool(**kwargs)
+        if inspect.iscoroutine(result) and not _in_event_loop():
+            return asyncio.run(result)
+        return result
     except Exception as e:
-        logger.error(f"Error calling tool '{name}': {str(e)}")
+        logger.error("Error calling tool '%s': %s", name, e)
         raise
 
 
+def _in_event_loop() -> bool:
+    """Check whether the current thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def call_tool(name: str, **kwargs) -> Any:
+    """Call a tool by name with arguments.
+    
+    Args:
+        name: Name of the tool
+        **kwargs: Arguments to pass to the tool
+        
+    Returns:
+        Tool result, or a coroutine for async tools called from an event loop
+        
+    Raises:
+        ValueError: If tool not found
+    """
+    return _invoke(name, kwargs)
+
+
 def call_tool_with_json(name: str, json_args: str) -> Any:
     """Call a tool by name with JSON-encoded arguments.
     
@@ -164,11 +236,101 @@ def call_tool_with_json(name: str, json_args: str) -> Any:
         ValueError: If tool not found or JSON is invalid
     """
     try:
-        kwargs = json.loads(json_args)
-        return call_tool(name, **kwargs)
-    except json.JSONDecodeError:
-        logger.error(f"Invalid JSON arguments: {json_args}")
+        kwargs = orjson.loads(json_args)
+    except orjson.JSONDecodeError:
+        logger.error("Invalid JSON arguments: %s", json_args)
         raise ValueError(f"Invalid JSON arguments: {json_args}")
+    
+    # Dispatch directly instead of unpacking into call_tool and repacking
+    return _invoke(name, kwargs)
+
+
+# Allowlist of safe characters in a math expression (digits, operators, parens, dot, spaces)
+_SAFE_EXPR_RE = re.compile(r'^[0-9+\-*/().% e\t]+$')
+
+# Arithmetic operators an expression may use, by AST node type
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _eval_node(node: ast.AST) -> float:
+    """Evaluate an arithmetic expression tree.
+
+    Only numeric constants and the operators in _BINARY_OPS and _UNARY_OPS
+    are accepted; names, calls, attributes and every other node are rejected.
+    Numbers are evaluated as floats, so huge powers overflow instead of
+    building huge integers.
+    """
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.left), _eval_node(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.operand))
+    elif isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return float(node.value)
+    raise ValueError(f"Disallowed AST node '{type(node).__name__}' in expression")
+
+
+@functools.lru_cache(maxsize=1024)
+def _evaluate(expression: str) -> float:
+    """Evaluate a validated expression; cached because agents repeat expressions.
+
+    Failed evaluations raise and are therefore not cached.
+    """
+    result = _eval_node(ast.parse(expression, mode='eval').body)
+    if not isinstance(result, float):
+        # e.g. a fractional power of a negative number
+        raise ValueError("Expression does not evaluate to a real number")
+    return result
+
+
+def safe_eval_expression(expression: str) -> float:
+    """Safely evaluate a mathematical expression.
+
+    eval() is not used. The expression is first validated against a strict
+    character allowlist, then parsed with ast and evaluated by walking the
+    tree, which only knows numbers and arithmetic operators. Results are
+    cached per expression.
+
+    Args:
+        expression: Mathematical expression to evaluate
+
+    Returns:
+        Numeric result as a float
+
+    Raises:
+        ValueError: If the expression contains disallowed characters or cannot
+            be evaluated.
+    """
+    if not expression or not isinstance(expression, str):
+        raise ValueError("Expression must be a non-empty string")
+
+    # Strip and validate against safe-character allowlist before any parsing
+    stripped = expression.strip()
+    if not _SAFE_EXPR_RE.match(stripped):
+        raise ValueError(
+            "Expression contains disallowed characters. "
+            "Only digits, +, -, *, /, (, ), ., % and whitespace are permitted."
+        )
+
+    try:
+        return _evaluate(stripped)
+    except Exception as e:
+        raise ValueError(f"Cannot evaluate expression: {e}") from e
 
 
 # Register some built-in tools
@@ -196,34 +358,4 @@ def calculate(expression: str) -> float:
     Raises:
         ValueError: If expression is invalid
     """
-    import re as _re
-    # Validate against safe-character allowlist before parsing; eval() is not used.
-    if not expression or not isinstance(expression, str):
-        raise ValueError("Expression must be a non-empty string")
-    stripped = expression.strip()
-    if not _re.match(r'^[0-9+\-*/().% e\t]+$', stripped):
-        raise ValueError(
-            "Expression contains disallowed characters. "
-            "Only digits, +, -, *, /, (, ), ., % and whitespace are permitted."
-        )
-    try:
-        import sympy
-        result = sympy.sympify(stripped).evalf()
-        return float(result)
-    except ImportError:
-        import ast as _ast
-        tree = _ast.parse(stripped, mode='eval')
-        _ALLOWED_AST = (
-            _ast.Expression, _ast.BinOp, _ast.UnaryOp,
-            _ast.Constant, _ast.Num,
-            _ast.Add, _ast.Sub, _ast.Mult, _ast.Div,
-            _ast.Mod, _ast.Pow, _ast.UAdd, _ast.USub,
-        )
-        for node in _ast.walk(tree):
-            if not isinstance(node, _ALLOWED_AST):
-                raise ValueError(
-                    f"Disallowed AST node '{type(node).__name__}' in expression"
-                )
-        return float(_ast.literal_eval(stripped))
-    except Exception as e:
-        raise ValueError(f"Invalid expression: {str(e)}")
\ No newline at end of file
+    return safe_eval_expression(expression)
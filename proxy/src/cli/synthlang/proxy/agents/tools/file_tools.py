@@ -1,9 +1,12 @@
 """File manipulation tools for SynthLang agents."""
 import os
 import json
+import stat
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 
+import orjson
+
 from synthlang.proxy.agents.registry import register_tool
 from synthlang.utils.logger import get_logger
 
@@ -11,26 +14,35 @@ logger = get_logger(__name__)
 
 
 @register_tool(description="Read the contents of a file")
-def read_file(path: str) -> str:
+def read_file(path: str, binary: bool = False) -> Union[str, bytes]:
     """Read the contents of a file.
     
     Args:
         path: Path to the file
+        binary: Whether to return the raw bytes instead of decoded text
         
     Returns:
-        File contents as a string
+        File contents as a string, or as bytes if binary is set
         
     Raises:
         FileNotFoundError: If file does not exist
         PermissionError: If permission denied
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        logger.debug(f"Read file: {path}")
+        # Read the whole file in one call and decode it at most once
+        data = Path(path).read_bytes()
+        logger.debug("Read file: %s", path)
+        if binary:
+            return data
+        
+        content = data.decode('utf-8')
+        
+        # Translate line endings as text-mode open() did
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         return content
     except UnicodeDecodeError:
-        logger.warning(f"File is not text: {path}")
+        logger.warning("File is not text: %s", path)
         raise ValueError(f"File is not a text file: {path}")
 
 
@@ -53,10 +65,10 @@ def write_file(path: str, content: str, append: bool = False) -> bool:
     try:
         with open(path, mode, encoding='utf-8') as f:
             f.write(content)
-        logger.debug(f"Wrote to file: {path}")
+        logger.debug("Wrote to file: %s", path)
         return True
     except Exception as e:
-        logger.error(f"Error writing to file {path}: {str(e)}")
+        logger.error("Error writing to file %s: %s", path, e)
         raise
 
 
@@ -77,19 +89,15 @@ def list_files(directory: str, pattern: Optional[str] = None) -> List[str]:
     """
     try:
         path = Path(directory)
-        if pattern:
-            files = list(path.glob(pattern))
-        else:
-            files = list(path.iterdir())
+        files = path.glob(pattern) if pattern else path.iterdir()
         
-        # Convert to strings and sort
-        file_paths = [str(f) for f in files]
-        file_paths.sort()
+        # Convert to strings and sort in one pass over the iterator
+        file_paths = sorted(os.fspath(f) for f in files)
         
-        logger.debug(f"Listed {len(file_paths)} files in {directory}")
+        logger.debug("Listed %s files in %s", len(file_paths), directory)
         return file_paths
     except Exception as e:
-        logger.error(f"Error listing files in {directory}: {str(e)}")
+        logger.error("Error listing files in %s: %s", directory, e)
         raise
 
 
@@ -121,21 +129,22 @@ def file_info(path: str) -> Dict[str, Any]:
         PermissionError: If permission denied
     """
     try:
-        stat = os.stat(path)
+        # One stat call answers everything, including whether it is a directory
+        file_stat = os.stat(path)
         file_path = Path(path)
         
         return {
             "name": file_path.name,
             "path": str(file_path.absolute()),
-            "size": stat.st_size,
-            "created": stat.st_ctime,
-            "modified": stat.st_mtime,
-            "accessed": stat.st_atime,
-            "is_directory": os.path.isdir(path),
+            "size": file_stat.st_size,
+            "created": file_stat.st_ctime,
+            "modified": file_stat.st_mtime,
+            "accessed": file_stat.st_atime,
+            "is_directory": stat.S_ISDIR(file_stat.st_mode),
             "extension": file_path.suffix,
         }
     except Exception as e:
-        logger.error(f"Error getting file info for {path}: {str(e)}")
+        logger.error("Error getting file info for %s: %s", path, e)
         raise
 
 
@@ -154,18 +163,63 @@ def read_json(path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If JSON is invalid
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.debug(f"Read JSON from file: {path}")
+        # orjson parses the raw bytes without a separate UTF-8 decode pass
+        data = orjson.loads(Path(path).read_bytes())
+        logger.debug("Read JSON from file: %s", path)
         return data
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in file {path}: {str(e)}")
+        logger.error("Invalid JSON in file %s: %s", path, e)
         raise
     except Exception as e:
-        logger.error(f"Error reading JSON from {path}: {str(e)}")
+        logger.error("Error reading JSON from %s: %s", path, e)
         raise
 
 
+@register_tool(description="Stream the values at a path from a large JSON file")
+def read_json_path(path: str, pointer: str) -> List[Any]:
+    """Read the values at a path from a JSON file without loading all of it.
+    
+    The file is parsed incrementally with ijson, so memory use does not grow
+    with the file size. The pointer uses JSON Pointer syntax, where the
+    segment "item" matches every element of an array; for example
+    "/results/item/name" returns the name of each result.
+    
+    Args:
+        path: Path to the JSON file
+        pointer: Path of the values to read, such as "/results/item"
+        
+    Returns:
+        List of the values found at the pointer, in file order
+        
+    Raises:
+        FileNotFoundError: If file does not exist
+        ValueError: If ijson is not installed, the pointer does not start
+            with "/", or the JSON is invalid
+    """
+    try:
+        import ijson  # optional; only needed for streaming reads
+    except ImportError:
+        raise ValueError("read_json_path requires the ijson package")
+    
+    if pointer and not pointer.startswith("/"):
+        raise ValueError(f"JSON Pointer must be empty or start with '/': {pointer}")
+    
+    # Convert the JSON Pointer to an ijson prefix: "/a/item/b" -> "a.item.b"
+    prefix = ".".join(
+        segment.replace("~1", "/").replace("~0", "~")
+        for segment in pointer.split("/")[1:]
+    )
+    
+    try:
+        with open(path, 'rb') as f:
+            values = list(ijson.items(f, prefix, use_float=True))
+        logger.debug("Read %s JSON values at %s from file: %s", len(values), pointer, path)
+        return values
+    except ijson.JSONError as e:
+        logger.error("Invalid JSON in file %s: %s", path, e)
+        raise ValueError(f"Invalid JSON in file {path}: {str(e)}")
+
+
 @register_tool(description="Write JSON to a file")
 def write_json(path: str, data: Union[Dict[str, Any], List[Any]], indent: int = 2) -> bool:
     """Write JSON to a file.
@@ -183,13 +237,20 @@ def write_json(path: str, data: Union[Dict[str, Any], List[Any]], indent: int =
         TypeError: If data is not JSON serializable
     """
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent)
-        logger.debug(f"Wrote JSON to file: {path}")
+        if indent == 2:
+            # orjson builds the whole document in one go and writes UTF-8
+            # bytes in a single call; it only supports 2-space indentation
+            Path(path).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=indent)
+        logger.debug("Wrote JSON to file: %s", path)
         return True
     except TypeError as e:
-        logger.error(f"Data is not JSON serializable: {str(e)}")
+        logger.error("Data is not JSON serializable: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Error writing JSON to {path}: {str(e)}")
+        logger.error("Error writing JSON to %s: %s", path, e)
         raise
\ No newline at end of file
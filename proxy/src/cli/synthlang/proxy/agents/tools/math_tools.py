@@ -1,85 +1,14 @@
 """Math tools for SynthLang agents."""
+import functools
 import math
 import random
-import re
-import statistics
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Tuple, Union, Optional
 
-from synthlang.proxy.agents.registry import register_tool
+from synthlang.proxy.agents.registry import register_tool, safe_eval_expression
 from synthlang.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Allowlist of safe characters in a math expression (digits, operators, parens, dot, spaces)
-_SAFE_EXPR_RE = re.compile(r'^[0-9+\-*/().% e\t]+$')
-# Allowlist of safe function names that may appear in expressions
-_ALLOWED_MATH_NAMES = {
-    k: v for k, v in math.__dict__.items()
-    if not k.startswith('__') and callable(v)
-}
-_ALLOWED_MATH_NAMES.update({
-    'abs': abs,
-    'round': round,
-    'min': min,
-    'max': max,
-})
-
-
-def _safe_eval_expression(expression: str) -> float:
-    """Safely evaluate a mathematical expression using sympy.
-
-    eval() is not used.  The expression is first validated against a strict
-    character allowlist, then parsed by sympy which does not execute arbitrary
-    Python code.
-
-    Args:
-        expression: Mathematical expression to evaluate
-
-    Returns:
-        Numeric result as a float
-
-    Raises:
-        ValueError: If the expression contains disallowed characters or cannot
-            be evaluated.
-    """
-    if not expression or not isinstance(expression, str):
-        raise ValueError("Expression must be a non-empty string")
-
-    # Strip and validate against safe-character allowlist before any parsing
-    stripped = expression.strip()
-    if not _SAFE_EXPR_RE.match(stripped):
-        raise ValueError(
-            "Expression contains disallowed characters. "
-            "Only digits, +, -, *, /, (, ), ., % and whitespace are permitted."
-        )
-
-    try:
-        import sympy  # optional but preferred; avoids eval entirely
-        result = sympy.sympify(stripped).evalf()
-        return float(result)
-    except ImportError:
-        # sympy not available — fall back to ast.literal_eval-based approach.
-        # We never call eval() here; the expression has already been validated
-        # against the character allowlist so only numeric literals and the four
-        # arithmetic operators can appear.
-        import ast
-        tree = ast.parse(stripped, mode='eval')
-        # Reject any node that is not a safe arithmetic construct
-        _ALLOWED_AST = (
-            ast.Expression, ast.BinOp, ast.UnaryOp,
-            ast.Constant, ast.Num,  # Num is pre-3.8 compat
-            ast.Add, ast.Sub, ast.Mult, ast.Div,
-            ast.Mod, ast.Pow, ast.UAdd, ast.USub,
-        )
-        for node in ast.walk(tree):
-            if not isinstance(node, _ALLOWED_AST):
-                raise ValueError(
-                    f"Disallowed AST node '{type(node).__name__}' in expression"
-                )
-        return float(ast.literal_eval(stripped))
-    except Exception as e:
-        raise ValueError(f"Cannot evaluate expression: {e}") from e
-
 
 @register_tool(description="Evaluate a mathematical expression")
 def evaluate_expression(expression: str) -> float:
@@ -95,9 +24,9 @@ def evaluate_expression(expression: str) -> float:
         ValueError: If expression is invalid
     """
     try:
-        return _safe_eval_expression(expression)
+        return safe_eval_expression(expression)
     except Exception as e:
-        logger.error(f"Error evaluating expression '{expression}': {str(e)}")
+        logger.error("Error evaluating expression '%s': %s", expression, e)
         raise ValueError(f"Invalid expression: {str(e)}")
 
 
@@ -120,30 +49,105 @@ def calculate_statistics(
         raise ValueError("Input list is empty")
     
     try:
-        # Convert all values to float
-        float_numbers = [float(n) for n in numbers]
+        try:
+            import numpy as np  # optional; reduces in C instead of Python loops
+        except ImportError:
+            return _single_pass_statistics(numbers)
+        
+        values = np.asarray(numbers, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("Input must be a flat list of numbers")
         
+        minimum = float(values.min())
+        maximum = float(values.max())
         result = {
-            "count": len(float_numbers),
-            "min": min(float_numbers),
-            "max": max(float_numbers),
-            "sum": sum(float_numbers),
-            "mean": statistics.mean(float_numbers),
-            "median": statistics.median(float_numbers),
-            "range": max(float_numbers) - min(float_numbers)
+            "count": int(values.size),
+            "min": minimum,
+            "max": maximum,
+            "sum": float(values.sum()),
+            "mean": float(values.mean()),
+            "median": float(np.median(values)),
+            "range": maximum - minimum
         }
         
         # Add standard deviation and variance if there's more than one number
-        if len(float_numbers) > 1:
-            result["std_dev"] = statistics.stdev(float_numbers)
-            result["variance"] = statistics.variance(float_numbers)
+        if values.size > 1:
+            variance = float(values.var(ddof=1))
+            result["std_dev"] = math.sqrt(variance)
+            result["variance"] = variance
         
         return result
     except Exception as e:
-        logger.error(f"Error calculating statistics: {str(e)}")
+        logger.error("Error calculating statistics: %s", e)
         raise ValueError(f"Error calculating statistics: {str(e)}")
 
 
+def _single_pass_statistics(numbers: List[float]) -> Dict[str, float]:
+    """Calculate the statistics of calculate_statistics without NumPy.
+    
+    Count, extremes, sum, mean and variance are accumulated in one pass
+    using Welford's algorithm; only the median needs the sorted values.
+    
+    Args:
+        numbers: Non-empty list of numbers
+        
+    Returns:
+        Dictionary with statistics
+    """
+    values = [float(n) for n in numbers]
+    minimum = maximum = values[0]
+    total = mean = m2 = 0.0
+    for count, x in enumerate(values, 1):
+        if x < minimum:
+            minimum = x
+        elif x > maximum:
+            maximum = x
+        total += x
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+    
+    # Median of the sorted values
+    n = len(values)
+    values.sort()
+    mid = n // 2
+    median = values[mid] if n % 2 else (values[mid - 1] + values[mid]) / 2
+    
+    result = {
+        "count": n,
+        "min": minimum,
+        "max": maximum,
+        "sum": total,
+        "mean": mean,
+        "median": median,
+        "range": maximum - minimum
+    }
+    
+    # Add standard deviation and variance if there's more than one number
+    if n > 1:
+        variance = m2 / (n - 1)
+        result["std_dev"] = math.sqrt(variance)
+        result["variance"] = variance
+    
+    return result
+
+
+# NumPy random generator, created on first use; False if NumPy is missing
+_rng = None
+
+
+def _get_rng():
+    """Get the shared NumPy random generator, or None if NumPy is not installed."""
+    global _rng
+    if _rng is None:
+        try:
+            import numpy as np
+            _rng = np.random.default_rng()
+        except ImportError:
+            _rng = False
+    return _rng or None
+
+
 @register_tool(description="Generate random numbers")
 def generate_random_numbers(
     count: int = 1,
@@ -172,15 +176,68 @@ def generate_random_numbers(
         raise ValueError("min_value must be less than max_value")
     
     try:
+        rng = _get_rng()
+        if rng is None:
+            if integer_only:
+                return [random.randint(int(min_value), int(max_value)) for _ in range(count)]
+            return [random.uniform(min_value, max_value) for _ in range(count)]
+        
+        # Draw all numbers in one vectorized call; integers() excludes the
+        # upper bound, so add one to match randint
         if integer_only:
-            return [random.randint(int(min_value), int(max_value)) for _ in range(count)]
+            values = rng.integers(int(min_value), int(max_value) + 1, size=count)
         else:
-            return [random.uniform(min_value, max_value) for _ in range(count)]
+            values = rng.uniform(min_value, max_value, size=count)
+        return values.tolist()
     except Exception as e:
-        logger.error(f"Error generating random numbers: {str(e)}")
+        logger.error("Error generating random numbers: %s", e)
         raise ValueError(f"Error generating random numbers: {str(e)}")
 
 
+# Define conversion factors to SI units
+_LENGTH_UNITS = {
+    "mm": 0.001, "cm": 0.01, "m": 1, "km": 1000,
+    "in": 0.0254, "ft": 0.3048, "yd": 0.9144, "mi": 1609.344
+}
+
+_WEIGHT_UNITS = {
+    "mg": 0.000001, "g": 0.001, "kg": 1,
+    "oz": 0.028349523125, "lb": 0.45359237, "ton": 907.18474
+}
+
+_AREA_UNITS = {
+    "mm2": 0.000001, "cm2": 0.0001, "m2": 1, "km2": 1000000,
+    "in2": 0.00064516, "ft2": 0.09290304, "yd2": 0.83612736, "mi2": 2589988.110336,
+    "ha": 10000, "acre": 4046.8564224
+}
+
+_VOLUME_UNITS = {
+    "ml": 0.000001, "l": 0.001, "m3": 1,
+    "gal": 0.003785411784, "qt": 0.000946352946, "pt": 0.000473176473,
+    "cup": 0.000236588236, "oz_fl": 0.0000295735295625
+}
+
+_TIME_UNITS = {
+    "s": 1, "min": 60, "h": 3600, "day": 86400
+}
+
+# Group units by type
+_UNIT_GROUPS = {
+    "length": _LENGTH_UNITS,
+    "weight": _WEIGHT_UNITS,
+    "area": _AREA_UNITS,
+    "volume": _VOLUME_UNITS,
+    "time": _TIME_UNITS
+}
+
+# Unit -> (unit type, factor to SI), flattened so a conversion needs two lookups
+_UNIT_TO_SI: Dict[str, Tuple[str, float]] = {
+    unit: (group, factor)
+    for group, units in _UNIT_GROUPS.items()
+    for unit, factor in units.items()
+}
+
+
 @register_tool(description="Convert between units")
 def convert_units(
     value: float,
@@ -208,42 +265,6 @@ def convert_units(
     Raises:
         ValueError: If conversion is not supported
     """
-    # Define conversion factors to SI units
-    length_units = {
-        "mm": 0.001, "cm": 0.01, "m": 1, "km": 1000,
-        "in": 0.0254, "ft": 0.3048, "yd": 0.9144, "mi": 1609.344
-    }
-    
-    weight_units = {
-        "mg": 0.000001, "g": 0.001, "kg": 1,
-        "oz": 0.028349523125, "lb": 0.45359237, "ton": 907.18474
-    }
-    
-    area_units = {
-        "mm2": 0.000001, "cm2": 0.0001, "m2": 1, "km2": 1000000,
-        "in2": 0.00064516, "ft2": 0.09290304, "yd2": 0.83612736, "mi2": 2589988.110336,
-        "ha": 10000, "acre": 4046.8564224
-    }
-    
-    volume_units = {
-        "ml": 0.000001, "l": 0.001, "m3": 1,
-        "gal": 0.003785411784, "qt": 0.000946352946, "pt": 0.000473176473,
-        "cup": 0.000236588236, "oz_fl": 0.0000295735295625
-    }
-    
-    time_units = {
-        "s": 1, "min": 60, "h": 3600, "day": 86400
-    }
-    
-    # Group units by type
-    unit_groups = {
-        "length": length_units,
-        "weight": weight_units,
-        "area": area_units,
-        "volume": volume_units,
-        "time": time_units
-    }
-    
     # Special case for temperature
     if from_unit in ["C", "F", "K"] and to_unit in ["C", "F", "K"]:
         # Convert to Kelvin first
@@ -262,22 +283,14 @@ def convert_units(
         else:  # K
             return kelvin
     
-    # Find which group the units belong to
-    group_name = None
-    for name, units in unit_groups.items():
-        if from_unit in units and to_unit in units:
-            group_name = name
-            break
-    
-    if group_name is None:
+    # Look up both units; they must be of the same type
+    from_group, from_factor = _UNIT_TO_SI.get(from_unit, (None, None))
+    to_group, to_factor = _UNIT_TO_SI.get(to_unit, (None, None))
+    if from_group is None or from_group != to_group:
         raise ValueError(f"Cannot convert from {from_unit} to {to_unit}")
     
-    # Get the conversion factors
-    units = unit_groups[group_name]
-    
     # Convert to SI then to target unit
-    si_value = value * units[from_unit]
-    return si_value / units[to_unit]
+    return value * from_factor / to_factor
 
 
 @register_tool(description="Solve a linear equation")
@@ -295,20 +308,37 @@ def solve_linear_equation(equation: str, variable: str = "x") -> float:
         ValueError: If equation is invalid or not linear
     """
     try:
-        import sympy
-        
-        # Parse the equation
-        eq = sympy.sympify("Eq(" + equation.replace("=", ",") + ")")
-        
-        # Solve for the variable
-        var = sympy.Symbol(variable)
-        solution = sympy.solve(eq, var)[0]
-        
-        # Convert to float if possible
-        try:
-            return float(solution)
-        except TypeError:
-            return solution
+        return _solve(equation, variable)
     except Exception as e:
-        logger.error(f"Error solving equation '{equation}': {str(e)}")
-        raise ValueError(f"Error solving equation: {str(e)}")
\ No newline at end of file
+        logger.error("Error solving equation '%s': %s", equation, e)
+        raise ValueError(f"Error solving equation: {str(e)}")
+
+
+@functools.lru_cache(maxsize=256)
+def _solve(equation: str, variable: str) -> Union[float, Any]:
+    """Solve a linear equation with sympy; cached per equation and variable.
+    
+    Agents often solve the same templated equation repeatedly, and parsing
+    and solving with sympy takes milliseconds. Failures are not cached.
+    
+    Args:
+        equation: Linear equation to solve
+        variable: Variable to solve for
+        
+    Returns:
+        Solution as a float, or as a sympy expression if it is not numeric
+    """
+    import sympy
+    
+    # Parse the equation
+    eq = sympy.sympify("Eq(" + equation.replace("=", ",") + ")")
+    
+    # Solve for the variable
+    var = sympy.Symbol(variable)
+    solution = sympy.solve(eq, var)[0]
+    
+    # Convert to float if possible
+    try:
+        return float(solution)
+    except TypeError:
+        return solution
@@ -1,5 +1,9 @@
 """Web tools for SynthLang agents."""
+import asyncio
+import atexit
 import json
+import re
+import threading
 from typing import Dict, Any, Optional, List, Union
 from urllib.parse import urlparse
 
@@ -10,6 +14,106 @@ from synthlang.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# User-Agent sent with every fetch
+USER_AGENT = "SynthLang/0.2.0 Agent"
+
+# Most requests fetch_url_batch keeps in flight at once
+BATCH_MAX_CONCURRENCY = 8
+
+# HTTP client shared by all fetches, created on first use
+_CLIENT: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use.
+    
+    Reusing one client keeps connections alive between fetches, so repeated
+    requests to the same host skip the TCP and TLS handshakes.
+    
+    Returns:
+        Shared HTTP client
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=128)
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+# Runs of HTML tags and whitespace, collapsed to one space in a single pass
+_TAGS_AND_SPACE_RE = re.compile(r'(?:<[^>]+>|\s)+')
+
+# Largest part of a page downloaded by extract_content
+EXTRACT_MAX_BYTES = 256_000
+
+# Page title
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+def _validate_url(url: str) -> None:
+    """Check that a URL is an absolute http or https URL.
+    
+    Args:
+        url: URL to check
+        
+    Raises:
+        ValueError: If the URL is invalid or uses another scheme
+    """
+    # Validate URL
+    parsed_url = urlparse(url)
+    if not parsed_url.scheme or not parsed_url.netloc:
+        raise ValueError(f"Invalid URL: {url}")
+    
+    # Only allow http and https schemes
+    if parsed_url.scheme not in ["http", "https"]:
+        raise ValueError(f"Unsupported URL scheme: {parsed_url.scheme}")
+
+
+def _response_data(
+    response: httpx.Response, body: Optional[bytes] = None, truncated: bool = False
+) -> Dict[str, Any]:
+    """Convert an HTTP response to the dictionary returned by the fetch tools.
+    
+    Args:
+        response: HTTP response
+        body: Partial body read from a streamed response; the response's own
+            content is used if not given
+        truncated: Whether the body was cut off before the end of the response
+        
+    Returns:
+        Dictionary with response data
+    """
+    # Try to parse as JSON
+    content_type = response.headers.get("content-type", "")
+    if "application/json" in content_type:
+        try:
+            json_data = response.json() if body is None else json.loads(body)
+            return {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "content_type": content_type,
+                "json": json_data,
+                "text": None,
+                "truncated": truncated
+            }
+        except json.JSONDecodeError:
+            pass
+    
+    # Return as text
+    return {
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "content_type": content_type,
+        "json": None,
+        "text": response.text if body is None else body.decode(response.encoding or "utf-8", errors="replace"),
+        "truncated": truncated
+    }
+
 
 @register_tool(description="Fetch content from a URL")
 def fetch_url(
@@ -18,7 +122,8 @@ def fetch_url(
     headers: Optional[Dict[str, str]] = None,
     params: Optional[Dict[str, str]] = None,
     data: Optional[Union[Dict[str, Any], str]] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    max_bytes: Optional[int] = None
 ) -> Dict[str, Any]:
     """Fetch content from a URL.
     
@@ -29,77 +134,68 @@ def fetch_url(
         params: Optional query parameters
         data: Optional request data (for POST, PUT, etc.)
         timeout: Request timeout in seconds
+        max_bytes: Optional limit on the response body size; the download
+            stops once this many bytes have arrived and the rest is ignored
         
     Returns:
-        Dictionary with response data
+        Dictionary with response data; "truncated" is True if the body was
+        cut off at max_bytes
         
     Raises:
         httpx.HTTPError: If request fails
     """
-    # Validate URL
-    parsed_url = urlparse(url)
-    if not parsed_url.scheme or not parsed_url.netloc:
-        raise ValueError(f"Invalid URL: {url}")
-    
-    # Only allow http and https schemes
-    if parsed_url.scheme not in ["http", "https"]:
-        raise ValueError(f"Unsupported URL scheme: {parsed_url.scheme}")
+    _validate_url(url)
     
     # Set default headers
     request_headers = {
-        "User-Agent": "SynthLang/0.2.0 Agent"
+        "User-Agent": USER_AGENT
     }
     if headers:
         request_headers.update(headers)
     
     try:
-        with httpx.Client(timeout=timeout) as client:
-            # Prepare request data
-            request_data = None
-            if data:
-                if isinstance(data, dict):
-                    request_data = data
-                else:
-                    request_data = data
-            
-            # Make request
-            response = client.request(
-                method=method.upper(),
-                url=url,
-                headers=request_headers,
-                params=params,
-                json=request_data if isinstance(request_data, dict) else None,
-                content=request_data if isinstance(request_data, str) else None
-            )
+        # Share pooled connections across calls; the timeout applies per request
+        client = _get_client()
+        
+        # Prepare request data
+        request_data = None
+        if data:
+            if isinstance(data, dict):
+                request_data = data
+            else:
+                request_data = data
+        
+        # Make request, streaming the body so it can be cut off at max_bytes
+        body = None
+        truncated = False
+        with client.stream(
+            method=method.upper(),
+            url=url,
+            headers=request_headers,
+            params=params,
+            json=request_data if isinstance(request_data, dict) else None,
+            content=request_data if isinstance(request_data, str) else None,
+            timeout=timeout
+        ) as response:
+            if max_bytes is None or response.is_error:
+                response.read()
+            else:
+                # Read one byte past the limit to tell whether the body
+                # was cut off
+                buffer = bytearray()
+                for chunk in response.iter_bytes():
+                    buffer.extend(chunk)
+                    if len(buffer) > max_bytes:
+                        break
+                truncated = len(buffer) > max_bytes
+                body = bytes(buffer[:max_bytes])
             
             # Raise for status
             response.raise_for_status()
-            
-            # Try to parse as JSON
-            content_type = response.headers.get("content-type", "")
-            if "application/json" in content_type:
-                try:
-                    json_data = response.json()
-                    return {
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "content_type": content_type,
-                        "json": json_data,
-                        "text": None
-                    }
-                except json.JSONDecodeError:
-                    pass
-            
-            # Return as text
-            return {
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content_type": content_type,
-                "json": None,
-                "text": response.text
-            }
+        
+        return _response_data(response, body, truncated)
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error fetching {url}: {str(e)}")
+        logger.error("HTTP error fetching %s: %s", url, e)
         
         # Include error response if available
         error_response = None
@@ -116,6 +212,101 @@ def fetch_url(
         raise ValueError(f"HTTP error: {str(e)}", error_response)
 
 
+async def _fetch_limited(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, max_bytes: Optional[int]
+) -> Dict[str, Any]:
+    """Fetch one URL of a batch, holding a concurrency slot while it runs.
+    
+    Args:
+        client: Async client of the batch
+        semaphore: Semaphore bounding the requests in flight
+        url: URL to fetch with GET
+        max_bytes: Optional limit on the response body size
+        
+    Returns:
+        Dictionary with response data, as returned by fetch_url
+        
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    async with semaphore:
+        body = None
+        truncated = False
+        async with client.stream("GET", url) as response:
+            if max_bytes is None or response.is_error:
+                await response.aread()
+            else:
+                # Read one byte past the limit to tell whether the body
+                # was cut off
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer.extend(chunk)
+                    if len(buffer) > max_bytes:
+                        break
+                truncated = len(buffer) > max_bytes
+                body = bytes(buffer[:max_bytes])
+            
+            # Raise for status
+            response.raise_for_status()
+    
+    return _response_data(response, body, truncated)
+
+
+@register_tool(description="Fetch content from several URLs concurrently")
+async def fetch_url_batch(
+    urls: List[str], timeout: int = 30, max_bytes: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Fetch content from several URLs concurrently.
+    
+    At most BATCH_MAX_CONCURRENCY requests are in flight at once, over one
+    async client per batch; an async client is bound to the event loop it
+    runs on, and synchronous callers get a new loop for every call.
+    
+    Args:
+        urls: URLs to fetch with GET
+        timeout: Request timeout in seconds
+        max_bytes: Optional limit on each response body size, as in fetch_url
+        
+    Returns:
+        List with one dictionary per URL, in the order given. Successful
+        fetches have the same fields as fetch_url; failed ones have the URL
+        and an error message instead.
+        
+    Raises:
+        ValueError: If any URL is invalid
+    """
+    for url in urls:
+        _validate_url(url)
+    
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=BATCH_MAX_CONCURRENCY)
+    ) as client:
+        responses = await asyncio.gather(
+            *(_fetch_limited(client, semaphore, url, max_bytes) for url in urls),
+            return_exceptions=True
+        )
+    
+    results = []
+    for url, response in zip(urls, responses):
+        if isinstance(response, httpx.HTTPStatusError):
+            status_code = response.response.status_code
+            logger.error("HTTP error fetching %s: status %s", url, status_code)
+            results.append({
+                "url": url,
+                "error": f"HTTP status {status_code}",
+                "status_code": status_code
+            })
+        elif isinstance(response, Exception):
+            logger.error("HTTP error fetching %s: %s", url, response)
+            results.append({"url": url, "error": str(response)})
+        else:
+            results.append(response)
+    return results
+
+
 @register_tool(description="Search the web for information")
 def web_search(
     query: str,
@@ -160,14 +351,18 @@ def extract_content(url: str) -> Dict[str, Any]:
         url: URL of the webpage
         
     Returns:
-        Dictionary with extracted content
+        Dictionary with extracted content. Only the first EXTRACT_MAX_BYTES
+        of the page are downloaded; "content_length" is the length of the
+        content extracted from them and "truncated" is True if the page was
+        longer.
         
     Raises:
         ValueError: If extraction fails
     """
     try:
-        # Fetch the webpage
-        response = fetch_url(url)
+        # Fetch the webpage; only the start of the page is returned, so
+        # there is no need to download all of a very large one
+        response = fetch_url(url, max_bytes=EXTRACT_MAX_BYTES)
         
         if response["text"] is None:
             raise ValueError("No text content found")
@@ -176,21 +371,21 @@ def extract_content(url: str) -> Dict[str, Any]:
         # readability, or trafilatura for better content extraction
         text = response["text"]
         
-        # Simple extraction - remove HTML tags (very naive approach)
-        import re
-        content = re.sub(r'<[^>]+>', ' ', text)
-        content = re.sub(r'\s+', ' ', content).strip()
+        # Simple extraction - replace HTML tags and whitespace runs with a
+        # single space (very naive approach)
+        content = _TAGS_AND_SPACE_RE.sub(' ', text).strip()
         
         # Get title (naive approach)
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', text, re.IGNORECASE | re.DOTALL)
+        title_match = _TITLE_RE.search(text)
         title = title_match.group(1).strip() if title_match else "Unknown Title"
         
         return {
             "url": url,
             "title": title,
             "content": content[:1000] + ("..." if len(content) > 1000 else ""),
-            "content_length": len(content)
+            "content_length": len(content),
+            "truncated": response["truncated"]
         }
     except Exception as e:
-        logger.error(f"Error extracting content from {url}: {str(e)}")
+        logger.error("Error extracting content from %s: %s", url, e)
         raise ValueError(f"Content extraction failed: {str(e)}")
\ No newline at end of file
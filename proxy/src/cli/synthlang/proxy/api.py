@@ -1,8 +1,9 @@
 """API client for SynthLang Proxy service."""
-import json
-from typing import Dict, List, Optional, Union, Any
+import functools
+from typing import AsyncIterator, Dict, List, Optional, Union, Any
 
 import httpx
+import orjson
 from httpx import Response
 
 from synthlang.proxy.config import get_proxy_config
@@ -10,6 +11,10 @@ from synthlang.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# HTTP methods the proxy API uses, and those that carry a JSON body
+_METHODS = {"GET", "POST", "PUT", "DELETE"}
+_BODY_METHODS = {"POST", "PUT"}
+
 
 class ProxyClient:
     """Client for interacting with SynthLang Proxy service."""
@@ -24,9 +29,37 @@ class ProxyClient:
         config = get_proxy_config()
         self.base_url = base_url or config.endpoint
         self.api_key = api_key or config.api_key
+        self.default_model = config.default_model
         self.headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        # One HTTP client per ProxyClient so requests reuse pooled connections
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+        # Async client for streaming, created on first use in an event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
         logger.debug(f"Initialized ProxyClient with endpoint: {self.base_url}")
     
+    def close(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        self._client.close()
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def __enter__(self) -> "ProxyClient":
+        """Use the client as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        """Close the client."""
+        self.close()
+    
     def _make_request(
         self, method: str, endpoint: str, data: Optional[Dict] = None, 
         params: Optional[Dict] = None, stream: bool = False
@@ -41,46 +74,41 @@ class ProxyClient:
             stream: Whether to stream the response
             
         Returns:
-            Response object or parsed JSON response
+            Parsed JSON response, or for streams the open response; the caller
+            reads it and must close it
             
         Raises:
             httpx.HTTPError: If the request fails
         """
-        url = f"{self.base_url}{endpoint}"
-        logger.debug(f"Making {method} request to {url}")
+        method = method.upper()
+        if method not in _METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        logger.debug(f"Making {method} request to {self.base_url}{endpoint}")
         
         try:
-            with httpx.Client(timeout=30.0) as client:
-                if method.upper() == "GET":
-                    response = client.get(
-                        url, params=params, headers=self.headers, stream=stream
-                    )
-                elif method.upper() == "POST":
-                    response = client.post(
-                        url, json=data, params=params, headers=self.headers, stream=stream
-                    )
-                elif method.upper() == "PUT":
-                    response = client.put(
-                        url, json=data, params=params, headers=self.headers, stream=stream
-                    )
-                elif method.upper() == "DELETE":
-                    response = client.delete(
-                        url, params=params, headers=self.headers, stream=stream
-                    )
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                response.raise_for_status()
-                
-                if stream:
-                    return response
-                return response.json()
+            # The client carries the base URL and auth headers; only POST and
+            # PUT send a body
+            request = self._client.build_request(
+                method,
+                endpoint,
+                json=data if method in _BODY_METHODS else None,
+                params=params
+            )
+            response = self._client.send(request, stream=stream)
+            
+            if stream and response.is_error:
+                response.read()
+            response.raise_for_status()
+            
+            if stream:
+                return response
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             logger.error(f"HTTP error: {str(e)}")
             if hasattr(e, "response") and e.response is not None:
                 try:
-                    error_data = e.response.json()
-                    logger.error(f"Error response: {json.dumps(error_data)}")
+                    error_data = orjson.loads(e.response.content)
+                    logger.error(f"Error response: {orjson.dumps(error_data).decode()}")
                 except Exception:
                     logger.error(f"Error response text: {e.response.text}")
             raise
@@ -100,11 +128,10 @@ class ProxyClient:
         Returns:
             Chat completion response
         """
-        config = get_proxy_config()
         endpoint = "/v1/chat/completions"
         
         payload = {
-            "model": model or config.default_model,
+            "model": model or self.default_model,
             "messages": messages,
             "stream": stream,
             **kwargs
@@ -112,6 +139,49 @@ class ProxyClient:
         
         return self._make_request("POST", endpoint, data=payload, stream=stream)
     
+    async def achat_completion(
+        self, messages: List[Dict], model: Optional[str] = None, **kwargs
+    ) -> AsyncIterator[bytes]:
+        """Stream a chat completion from the proxy.
+        
+        Uses an async HTTP client, so several completions can stream
+        concurrently on one event loop. The async client belongs to the
+        event loop it was first used on; call aclose() before that loop ends.
+        
+        Args:
+            messages: List of message objects
+            model: Model to use for completion
+            **kwargs: Additional parameters for the request
+            
+        Yields:
+            Raw chunks of the server-sent event stream
+            
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "stream": True,
+            **kwargs
+        }
+        
+        async with self._async_client.stream("POST", "/v1/chat/completions", json=payload) as response:
+            if response.is_error:
+                await response.aread()
+                logger.error(f"Error response text: {response.text}")
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                yield chunk
+    
     def translate(self, source: str, framework: str) -> Dict:
         """Translate text using the proxy service.
         
@@ -189,4 +259,20 @@ class ProxyClient:
             Health check result
         """
         endpoint = "/health"
-        return self._make_request("GET", endpoint)
\ No newline at end of file
+        return self._make_request("GET", endpoint)
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> ProxyClient:
+    """Get a shared client for an endpoint and API key.
+    
+    Clients are cached so repeated commands reuse their connection pool.
+    
+    Args:
+        base_url: Base URL for the proxy service
+        api_key: API key for authentication
+        
+    Returns:
+        The shared ProxyClient
+    """
+    return ProxyClient(base_url, api_key)
@@ -1,9 +1,11 @@
 """Authentication utilities for SynthLang Proxy."""
-import json
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+import orjson
+
 from synthlang.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,9 +35,8 @@ def save_credentials(api_key: str, endpoint: Optional[str] = None) -> None:
     # Load existing credentials if available
     if creds_path.exists():
         try:
-            with open(creds_path) as f:
-                creds = json.load(f)
-        except json.JSONDecodeError:
+            creds = orjson.loads(creds_path.read_bytes())
+        except orjson.JSONDecodeError:
             logger.warning(f"Invalid JSON in credentials file: {creds_path}")
             # Continue with empty credentials
     
@@ -46,16 +47,18 @@ def save_credentials(api_key: str, endpoint: Optional[str] = None) -> None:
     
     # Save credentials
     try:
-        with open(creds_path, "w") as f:
-            json.dump(creds, f, indent=2)
+        creds_path.write_bytes(orjson.dumps(creds, option=orjson.OPT_INDENT_2))
         logger.info(f"Credentials saved to {creds_path}")
     except Exception as e:
         logger.error(f"Error saving credentials: {str(e)}")
         raise
+    finally:
+        _read_credentials_file.cache_clear()
 
 
 def clear_credentials() -> None:
     """Clear saved credentials."""
+    _read_credentials_file.cache_clear()
     creds_path = get_credentials_path()
     if creds_path.exists():
         try:
@@ -68,23 +71,34 @@ def clear_credentials() -> None:
         logger.info("No credentials file found to clear")
 
 
-def get_credentials() -> Dict[str, Any]:
-    """Get credentials from file or environment.
+@functools.lru_cache(maxsize=1)
+def _read_credentials_file() -> Dict[str, Any]:
+    """Read the credentials file once per process.
+    
+    save_credentials and clear_credentials clear the cache.
     
     Returns:
-        Dictionary with credentials
+        Dictionary with the saved credentials
     """
-    creds = {}
-    
-    # Try to load from file
     creds_path = get_credentials_path()
     if creds_path.exists():
         try:
-            with open(creds_path) as f:
-                creds = json.load(f)
+            creds = orjson.loads(creds_path.read_bytes())
             logger.debug(f"Loaded credentials from {creds_path}")
-        except json.JSONDecodeError:
+            return creds
+        except orjson.JSONDecodeError:
             logger.warning(f"Invalid JSON in credentials file: {creds_path}")
+    return {}
+
+
+def get_credentials() -> Dict[str, Any]:
+    """Get credentials from file or environment.
+    
+    Returns:
+        Dictionary with credentials
+    """
+    # Load from file; copy so callers cannot change the cached credentials
+    creds = dict(_read_credentials_file())
     
     # Override with environment variables if present
     api_key = os.environ.get("SYNTHLANG_API_KEY")
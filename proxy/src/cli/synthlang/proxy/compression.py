@@ -5,7 +5,7 @@ import hashlib
 import json
 import re
 import time
-from typing import Dict, Optional, Tuple, Any, List
+from typing import Callable, Dict, Optional, Tuple, Any, List
 
 from synthlang.utils.logger import get_logger
 
@@ -59,6 +59,225 @@ def _is_base64(text: str) -> bool:
         return False
 
 
+# Common replacements for compression, as (phrase, symbol) pairs
+_COMPRESS_REPLACEMENTS = [
+    ("the ", "↹ "),
+    ("and ", "• "),
+    ("with ", "⊕ "),
+    ("for ", "∀ "),
+    ("to ", "→ "),
+    ("in ", "∈ "),
+    ("of ", "∋ "),
+    ("is ", "≡ "),
+    ("that ", "⊢ "),
+    ("this ", "⊣ "),
+    ("should ", "⊨ "),
+    ("would ", "⊩ "),
+    ("could ", "⊪ "),
+    ("will ", "⊫ "),
+    ("can ", "⊬ "),
+    ("may ", "⊭ "),
+    ("must ", "⊮ "),
+    ("shall ", "⊯ "),
+    ("not ", "¬ "),
+    ("all ", "∀ "),
+    ("some ", "∃ "),
+    ("no ", "∄ "),
+    ("every ", "∀ "),
+    ("any ", "∃ "),
+    ("each ", "∀ "),
+    ("many ", "∃ "),
+    ("few ", "∃ "),
+    ("most ", "∀ "),
+    ("several ", "∃ "),
+    ("various ", "∃ "),
+    ("different ", "≠ "),
+    ("similar ", "≈ "),
+    ("same ", "≡ "),
+    ("equal ", "= "),
+    ("equivalent ", "≡ "),
+    ("approximately ", "≈ "),
+    ("exactly ", "= "),
+    ("precisely ", "= "),
+    ("about ", "≈ "),
+    ("around ", "≈ "),
+    ("between ", "↔ "),
+    ("among ", "∈ "),
+    ("within ", "∈ "),
+    ("without ", "∉ "),
+    ("outside ", "∉ "),
+    ("inside ", "∈ "),
+    ("through ", "↝ "),
+    ("throughout ", "↝ "),
+    ("across ", "↝ "),
+    ("along ", "↝ "),
+    ("over ", "↑ "),
+    ("under ", "↓ "),
+    ("above ", "↑ "),
+    ("below ", "↓ "),
+    ("before ", "← "),
+    ("after ", "→ "),
+    ("during ", "⊂ "),
+    ("while ", "⊂ "),
+    ("when ", "⊂ "),
+    ("where ", "⊂ "),
+    ("why ", "? "),
+    ("how ", "? "),
+    ("what ", "? "),
+    ("which ", "? "),
+    ("who ", "? "),
+    ("whom ", "? "),
+    ("whose ", "? "),
+    ("whether ", "? "),
+    ("if ", "? "),
+    ("unless ", "? "),
+    ("until ", "? "),
+    ("since ", "? "),
+    ("because ", "∵ "),
+    ("therefore ", "∴ "),
+    ("thus ", "∴ "),
+    ("hence ", "∴ "),
+    ("so ", "∴ "),
+    ("consequently ", "∴ "),
+    ("accordingly ", "∴ "),
+    ("as a result ", "∴ "),
+    ("as such ", "∴ "),
+    ("in conclusion ", "∴ "),
+    ("in summary ", "∴ "),
+    ("in short ", "∴ "),
+    ("in brief ", "∴ "),
+    ("in essence ", "∴ "),
+    ("in other words ", "∴ "),
+    ("that is ", "∴ "),
+    ("namely ", "∴ "),
+    ("specifically ", "∴ "),
+    ("particularly ", "∴ "),
+    ("especially ", "∴ "),
+    ("notably ", "∴ "),
+    ("chiefly ", "∴ "),
+    ("mainly ", "∴ "),
+    ("mostly ", "∴ "),
+    ("largely ", "∴ "),
+    ("generally ", "∴ "),
+    ("usually ", "∴ "),
+    ("typically ", "∴ "),
+    ("often ", "∴ "),
+    ("frequently ", "∴ "),
+    ("occasionally ", "∴ "),
+    ("rarely ", "∴ "),
+    ("seldom ", "∴ "),
+    ("never ", "∴ "),
+    ("always ", "∴ "),
+    ("sometimes ", "∴ "),
+]
+
+# Common replacements for decompression (reverse of compression); where a
+# symbol is listed twice, the first expansion wins
+_DECOMPRESS_REPLACEMENTS = [
+    ("↹ ", "the "),
+    ("• ", "and "),
+    ("⊕ ", "with "),
+    ("∀ ", "for "),
+    ("→ ", "to "),
+    ("∈ ", "in "),
+    ("∋ ", "of "),
+    ("≡ ", "is "),
+    ("⊢ ", "that "),
+    ("⊣ ", "this "),
+    ("⊨ ", "should "),
+    ("⊩ ", "would "),
+    ("⊪ ", "could "),
+    ("⊫ ", "will "),
+    ("⊬ ", "can "),
+    ("⊭ ", "may "),
+    ("⊮ ", "must "),
+    ("⊯ ", "shall "),
+    ("¬ ", "not "),
+    ("∀ ", "all "),
+    ("∃ ", "some "),
+    ("∄ ", "no "),
+    ("≠ ", "different "),
+    ("≈ ", "similar "),
+    ("= ", "equal "),
+    ("↔ ", "between "),
+    ("∉ ", "without "),
+    ("↝ ", "through "),
+    ("↑ ", "over "),
+    ("↓ ", "under "),
+    ("← ", "before "),
+    ("⊂ ", "during "),
+    ("? ", "what "),
+    ("∵ ", "because "),
+    ("∴ ", "therefore "),
+]
+
+
+def _build_replacer(replacements: List[Tuple[str, str]]) -> Callable[[str], str]:
+    """Build a function applying a replacement table in one pass over the text.
+    
+    Matches are taken leftmost first and, at the same position, longest
+    first, so longer phrases win over phrases they contain (for example
+    "within " over "in "). Uses an Aho-Corasick automaton when pyahocorasick
+    is installed and falls back to one regular expression otherwise.
+    
+    Args:
+        replacements: (phrase, replacement) pairs; the first pair wins for
+            duplicate phrases
+        
+    Returns:
+        Function that applies the replacements to a text
+    """
+    table: Dict[str, str] = {}
+    for phrase, replacement in replacements:
+        table.setdefault(phrase, replacement)
+    
+    try:
+        import ahocorasick
+    except ImportError:
+        ahocorasick = None
+    
+    if ahocorasick is not None:
+        # Scan the text once with the automaton; each match carries its
+        # phrase length and replacement
+        automaton = ahocorasick.Automaton()
+        for phrase, replacement in table.items():
+            automaton.add_word(phrase, (len(phrase), replacement))
+        automaton.make_automaton()
+        
+        def replace(text: str) -> str:
+            # Order the matches by start position, longest first, and keep
+            # those that do not overlap an earlier one
+            matches = sorted(
+                (end - length + 1, -length, replacement)
+                for end, (length, replacement) in automaton.iter(text)
+            )
+            parts = []
+            position = 0
+            for start, negative_length, replacement in matches:
+                if start >= position:
+                    parts.append(text[position:start])
+                    parts.append(replacement)
+                    position = start - negative_length
+            parts.append(text[position:])
+            return "".join(parts)
+        
+        return replace
+    
+    pattern = re.compile("|".join(
+        re.escape(phrase) for phrase in sorted(table, key=len, reverse=True)
+    ))
+    lookup = table.__getitem__
+    
+    def replace(text: str) -> str:
+        return pattern.sub(lambda match: lookup(match.group(0)), text)
+    
+    return replace
+
+
+_compress_replacer = _build_replacer(_COMPRESS_REPLACEMENTS)
+_decompress_replacer = _build_replacer(_DECOMPRESS_REPLACEMENTS)
+
+
 def _synthlang_compress(text: str) -> str:
     """Compress text using SynthLang compression algorithm.
     
@@ -70,124 +289,7 @@ def _synthlang_compress(text: str) -> str:
     Returns:
         Compressed text
     """
-    # Common replacements for compression
-    replacements = [
-        ("the ", "↹ "),
-        ("and ", "• "),
-        ("with ", "⊕ "),
-        ("for ", "∀ "),
-        ("to ", "→ "),
-        ("in ", "∈ "),
-        ("of ", "∋ "),
-        ("is ", "≡ "),
-        ("that ", "⊢ "),
-        ("this ", "⊣ "),
-        ("should ", "⊨ "),
-        ("would ", "⊩ "),
-        ("could ", "⊪ "),
-        ("will ", "⊫ "),
-        ("can ", "⊬ "),
-        ("may ", "⊭ "),
-        ("must ", "⊮ "),
-        ("shall ", "⊯ "),
-        ("not ", "¬ "),
-        ("all ", "∀ "),
-        ("some ", "∃ "),
-        ("no ", "∄ "),
-        ("every ", "∀ "),
-        ("any ", "∃ "),
-        ("each ", "∀ "),
-        ("many ", "∃ "),
-        ("few ", "∃ "),
-        ("most ", "∀ "),
-        ("several ", "∃ "),
-        ("various ", "∃ "),
-        ("different ", "≠ "),
-        ("similar ", "≈ "),
-        ("same ", "≡ "),
-        ("equal ", "= "),
-        ("equivalent ", "≡ "),
-        ("approximately ", "≈ "),
-        ("exactly ", "= "),
-        ("precisely ", "= "),
-        ("about ", "≈ "),
-        ("around ", "≈ "),
-        ("between ", "↔ "),
-        ("among ", "∈ "),
-        ("within ", "∈ "),
-        ("without ", "∉ "),
-        ("outside ", "∉ "),
-        ("inside ", "∈ "),
-        ("through ", "↝ "),
-        ("throughout ", "↝ "),
-        ("across ", "↝ "),
-        ("along ", "↝ "),
-        ("over ", "↑ "),
-        ("under ", "↓ "),
-        ("above ", "↑ "),
-        ("below ", "↓ "),
-        ("before ", "← "),
-        ("after ", "→ "),
-        ("during ", "⊂ "),
-        ("while ", "⊂ "),
-        ("when ", "⊂ "),
-        ("where ", "⊂ "),
-        ("why ", "? "),
-        ("how ", "? "),
-        ("what ", "? "),
-        ("which ", "? "),
-        ("who ", "? "),
-        ("whom ", "? "),
-        ("whose ", "? "),
-        ("whether ", "? "),
-        ("if ", "? "),
-        ("unless ", "? "),
-        ("until ", "? "),
-        ("since ", "? "),
-        ("because ", "∵ "),
-        ("therefore ", "∴ "),
-        ("thus ", "∴ "),
-        ("hence ", "∴ "),
-        ("so ", "∴ "),
-        ("consequently ", "∴ "),
-        ("accordingly ", "∴ "),
-        ("as a result ", "∴ "),
-        ("as such ", "∴ "),
-        ("in conclusion ", "∴ "),
-        ("in summary ", "∴ "),
-        ("in short ", "∴ "),
-        ("in brief ", "∴ "),
-        ("in essence ", "∴ "),
-        ("in other words ", "∴ "),
-        ("that is ", "∴ "),
-        ("namely ", "∴ "),
-        ("specifically ", "∴ "),
-        ("particularly ", "∴ "),
-        ("especially ", "∴ "),
-        ("notably ", "∴ "),
-        ("chiefly ", "∴ "),
-        ("mainly ", "∴ "),
-        ("mostly ", "∴ "),
-        ("largely ", "∴ "),
-        ("generally ", "∴ "),
-        ("usually ", "∴ "),
-        ("typically ", "∴ "),
-        ("often ", "∴ "),
-        ("frequently ", "∴ "),
-        ("occasionally ", "∴ "),
-        ("rarely ", "∴ "),
-        ("seldom ", "∴ "),
-        ("never ", "∴ "),
-        ("always ", "∴ "),
-        ("sometimes ", "∴ "),
-    ]
-    
-    # Apply replacements
-    compressed = text
-    for pattern, replacement in replacements:
-        compressed = compressed.replace(pattern, replacement)
-    
-    return compressed
+    return _compress_replacer(text)
 
 
 def _synthlang_decompress(text: str) -> str:
@@ -199,51 +301,7 @@ def _synthlang_decompress(text: str) -> str:
     Returns:
         Decompressed text
     """
-    # Common replacements for decompression (reverse of compression)
-    replacements = [
-        ("↹ ", "the "),
-        ("• ", "and "),
-        ("⊕ ", "with "),
-        ("∀ ", "for "),
-        ("→ ", "to "),
-        ("∈ ", "in "),
-        ("∋ ", "of "),
-        ("≡ ", "is "),
-        ("⊢ ", "that "),
-        ("⊣ ", "this "),
-        ("⊨ ", "should "),
-        ("⊩ ", "would "),
-        ("⊪ ", "could "),
-        ("⊫ ", "will "),
-        ("⊬ ", "can "),
-        ("⊭ ", "may "),
-        ("⊮ ", "must "),
-        ("⊯ ", "shall "),
-        ("¬ ", "not "),
-        ("∀ ", "all "),
-        ("∃ ", "some "),
-        ("∄ ", "no "),
-        ("≠ ", "different "),
-        ("≈ ", "similar "),
-        ("= ", "equal "),
-        ("↔ ", "between "),
-        ("∉ ", "without "),
-        ("↝ ", "through "),
-        ("↑ ", "over "),
-        ("↓ ", "under "),
-        ("← ", "before "),
-        ("⊂ ", "during "),
-        ("? ", "what "),
-        ("∵ ", "because "),
-        ("∴ ", "therefore "),
-    ]
-    
-    # Apply replacements
-    decompressed = text
-    for pattern, replacement in replacements:
-        decompressed = decompressed.replace(pattern, replacement)
-    
-    return decompressed
+    return _decompress_replacer(text)
 
 
 def compress_prompt(prompt: str, use_gzip: bool = False) -> str:
@@ -1,9 +1,10 @@
 """Configuration utilities for SynthLang Proxy."""
-import json
+import functools
 import os
 from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from typing import Dict, Optional, Any, Tuple, Union
 
+import orjson
 from pydantic import BaseModel, Field
 
 from synthlang.utils.logger import get_logger
@@ -43,9 +44,31 @@ class ProxyConfig(BaseModel):
     log_file: Optional[str] = Field(None, description="Log file path")
 
 
+# Environment variables that override config keys
+_ENV_MAPPING = {
+    "SYNTHLANG_API_KEY": "api_key",
+    "SYNTHLANG_ENDPOINT": "endpoint",
+    "SYNTHLANG_DEFAULT_MODEL": "default_model",
+    "SYNTHLANG_HOST": "host",
+    "SYNTHLANG_PORT": "port",
+    "SYNTHLANG_CACHE_DIR": "cache_dir",
+    "SYNTHLANG_CACHE_TTL": "cache_ttl",
+    "SYNTHLANG_ENABLE_ENCRYPTION": "enable_encryption",
+    "SYNTHLANG_ENCRYPTION_KEY": "encryption_key",
+    "SYNTHLANG_RATE_LIMIT_ENABLED": "rate_limit_enabled",
+    "SYNTHLANG_RATE_LIMIT_REQUESTS": "rate_limit_requests",
+    "SYNTHLANG_STREAMING_ENABLED": "streaming_enabled",
+    "SYNTHLANG_LOG_LEVEL": "log_level",
+    "SYNTHLANG_LOG_FILE": "log_file"
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get path to config file.
     
+    The config directory is created on the first call only.
+    
     Returns:
         Path to config file
     """
@@ -66,10 +89,9 @@ def load_config() -> Dict[str, Any]:
     # Load from file if exists
     if config_path.exists():
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = orjson.loads(config_path.read_bytes())
             logger.debug(f"Loaded config from {config_path}")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"Invalid JSON in config file: {config_path}")
     
     return config
@@ -84,12 +106,13 @@ def save_config(config: Dict[str, Any]) -> None:
     config_path = get_config_path()
     
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         logger.debug(f"Saved config to {config_path}")
     except Exception as e:
         logger.error(f"Error saving config: {str(e)}")
         raise
+    finally:
+        _build_proxy_config.cache_clear()
 
 
 def update_config(updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -115,26 +138,8 @@ def get_env_config() -> Dict[str, Any]:
     """
     env_config = {}
     
-    # Map environment variables to config keys
-    env_mapping = {
-        "SYNTHLANG_API_KEY": "api_key",
-        "SYNTHLANG_ENDPOINT": "endpoint",
-        "SYNTHLANG_DEFAULT_MODEL": "default_model",
-        "SYNTHLANG_HOST": "host",
-        "SYNTHLANG_PORT": "port",
-        "SYNTHLANG_CACHE_DIR": "cache_dir",
-        "SYNTHLANG_CACHE_TTL": "cache_ttl",
-        "SYNTHLANG_ENABLE_ENCRYPTION": "enable_encryption",
-        "SYNTHLANG_ENCRYPTION_KEY": "encryption_key",
-        "SYNTHLANG_RATE_LIMIT_ENABLED": "rate_limit_enabled",
-        "SYNTHLANG_RATE_LIMIT_REQUESTS": "rate_limit_requests",
-        "SYNTHLANG_STREAMING_ENABLED": "streaming_enabled",
-        "SYNTHLANG_LOG_LEVEL": "log_level",
-        "SYNTHLANG_LOG_FILE": "log_file"
-    }
-    
     # Process environment variables
-    for env_var, config_key in env_mapping.items():
+    for env_var, config_key in _ENV_MAPPING.items():
         if env_var in os.environ:
             value = os.environ[env_var]
             
@@ -154,14 +159,19 @@ def get_env_config() -> Dict[str, Any]:
     return env_config
 
 
-def get_proxy_config() -> ProxyConfig:
-    """Get proxy configuration.
+@functools.lru_cache(maxsize=8)
+def _build_proxy_config(
+    mtime_ns: Optional[int], env: Tuple[Tuple[str, str], ...]
+) -> ProxyConfig:
+    """Build the proxy configuration for one config file and environment state.
     
-    This combines configuration from:
-    1. Default values
-    2. Configuration file
-    3. Environment variables (highest priority)
+    The arguments only key the cache; the configuration itself is read
+    from the file and the environment.
     
+    Args:
+        mtime_ns: Modification time of the config file, or None if missing
+        env: Relevant environment variables as (name, value) pairs
+        
     Returns:
         ProxyConfig object
     """
@@ -177,4 +187,29 @@ def get_proxy_config() -> ProxyConfig:
     config_dict.update(env_config)
     
     # Create and return config object
-    return ProxyConfig(**config_dict)
\ No newline at end of file
+    return ProxyConfig(**config_dict)
+
+
+def get_proxy_config() -> ProxyConfig:
+    """Get proxy configuration.
+    
+    This combines configuration from:
+    1. Default values
+    2. Configuration file
+    3. Environment variables (highest priority)
+    
+    The result is cached until the config file or one of the SYNTHLANG_*
+    environment variables changes, so callers must not modify it.
+    
+    Returns:
+        ProxyConfig object
+    """
+    try:
+        mtime_ns = get_config_path().stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    
+    env = tuple(
+        (env_var, os.environ[env_var]) for env_var in _ENV_MAPPING if env_var in os.environ
+    )
+    return _build_proxy_config(mtime_ns, env)
@@ -1,6 +1,8 @@
 """Tests for CLI interface."""
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import Dict
 
@@ -132,3 +134,26 @@ def test_cli_help(runner):
         result = runner.invoke(main, [cmd, "--help"])
         assert result.exit_code == 0
         assert "Usage:" in result.output
+
+def test_import_leaves_dspy_cache_dir_alone():
+    """Test that importing the CLI module does not change the environment."""
+    env = {k: v for k, v in os.environ.items() if k != "DSPY_CACHEDIR"}
+    result = subprocess.run(
+        [sys.executable, "-c", "import os, synthlang.cli; print(os.environ.get('DSPY_CACHEDIR'))"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "None"
+
+def test_cli_sets_default_dspy_cache_dir(runner, env_vars, monkeypatch):
+    """Test that running a command points DSPy at the SynthLang cache directory."""
+    monkeypatch.delenv("DSPY_CACHEDIR", raising=False)
+    result = runner.invoke(main, ["config", "show"])
+    assert result.exit_code == 0
+    assert os.environ["DSPY_CACHEDIR"] == os.path.expanduser("~/.cache/synthlang/dspy")
+
+def test_cli_keeps_user_dspy_cache_dir(runner, env_vars, monkeypatch, tmp_path):
+    """Test that a DSPY_CACHEDIR set by the user is kept."""
+    monkeypatch.setenv("DSPY_CACHEDIR", str(tmp_path))
+    result = runner.invoke(main, ["config", "show"])
+    assert result.exit_code == 0
+    assert os.environ["DSPY_CACHEDIR"] == str(tmp_path)
@@ -0,0 +1,95 @@
+"""Tests for the SynthLang compression replacement tables."""
+import random
+import sys
+import types
+
+import pytest
+
+from synthlang.proxy import compression
+
+
+class _NaiveAutomaton:
+    """Stand-in for ahocorasick.Automaton with the same iter() contract.
+
+    iter() yields (end_index, value) for every occurrence of every word,
+    overlapping ones included, which is what the real automaton reports.
+    """
+
+    def __init__(self):
+        self.words = {}
+
+    def add_word(self, word, value):
+        self.words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, text):
+        for start in range(len(text)):
+            for word, value in self.words.items():
+                if text.startswith(word, start):
+                    yield start + len(word) - 1, value
+
+
+def _automaton_module(kind):
+    """Get the real ahocorasick module or the stand-in."""
+    if kind == "pyahocorasick":
+        return pytest.importorskip("ahocorasick")
+    return types.SimpleNamespace(Automaton=_NaiveAutomaton)
+
+
+def _regex_replacer(monkeypatch, replacements):
+    """Build a replacer that is forced onto the regex path."""
+    monkeypatch.setitem(sys.modules, "ahocorasick", None)
+    return compression._build_replacer(replacements)
+
+
+def _automaton_replacer(monkeypatch, replacements, kind):
+    """Build a replacer that is forced onto the Aho-Corasick path."""
+    monkeypatch.setitem(sys.modules, "ahocorasick", _automaton_module(kind))
+    return compression._build_replacer(replacements)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("This is a test prompt that should be compressed",
+     "Th≡ ≡ a test prompt ⊢ ⊨ be compressed"),
+    ("the results within this study ", "↹ results ∈ ⊣ study "),
+    ("in conclusion the model is good ", "∴ ↹ model ≡ good "),
+    ("many users and some admins will not see that is ", "∃ users • ∃ admins ⊫ ¬ see ∴ "),
+    ("no match here", "∄ match here"),
+    ("nothing matches xyz", "nothing matches xyz"),
+])
+def test_compress_golden_output(text, expected):
+    """Test that compression picks the longest phrase at each position."""
+    assert compression._synthlang_compress(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("↹ results ∈ ⊣ study ", "the results in this study "),
+    ("∀ ↹ model ", "for the model "),
+    ("∴ ↹ model ≡ good ", "therefore the model is good "),
+])
+def test_decompress_golden_output(text, expected):
+    """Test decompression, including the duplicated symbol keeping its first expansion."""
+    assert compression._synthlang_decompress(text) == expected
+
+
+@pytest.mark.parametrize("kind", ["pyahocorasick", "stand-in"])
+@pytest.mark.parametrize("replacements", [
+    compression._COMPRESS_REPLACEMENTS,
+    compression._DECOMPRESS_REPLACEMENTS
+], ids=["compress", "decompress"])
+def test_automaton_path_matches_regex_path(monkeypatch, kind, replacements):
+    """Test that the Aho-Corasick and regex paths produce identical output."""
+    regex_replace = _regex_replacer(monkeypatch, replacements)
+    automaton_replace = _automaton_replacer(monkeypatch, replacements, kind)
+
+    # Random texts built from table phrases, their fragments and filler, so
+    # overlapping and adjacent matches are common
+    phrases = [phrase for phrase, _ in replacements]
+    pieces = phrases + [phrase[1:] for phrase in phrases] + [phrase[:-1] for phrase in phrases]
+    pieces += ["x", " ", "a", "s", "th"]
+    rng = random.Random(1234)
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+        assert automaton_replace(text) == regex_replace(text), text
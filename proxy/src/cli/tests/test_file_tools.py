@@ -0,0 +1,52 @@
+"""Tests for the SynthLang agent file tools."""
+import orjson
+import pytest
+
+from synthlang.proxy.agents.tools import file_tools
+
+pytest.importorskip("ijson")
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    """Write a JSON document with nested arrays and escaped keys."""
+    path = tmp_path / "data.json"
+    path.write_bytes(orjson.dumps({
+        "results": [{"name": "a", "score": 0.5}, {"name": "b", "score": 1.5}],
+        "a/b": {"c~d": [1, 2]},
+        "empty": []
+    }))
+    return str(path)
+
+
+@pytest.mark.parametrize("pointer, expected", [
+    ("/results/item", [{"name": "a", "score": 0.5}, {"name": "b", "score": 1.5}]),
+    ("/results/item/name", ["a", "b"]),
+    ("/results", [[{"name": "a", "score": 0.5}, {"name": "b", "score": 1.5}]]),
+    ("/a~1b/c~0d/item", [1, 2]),
+    ("/empty/item", []),
+    ("/missing", []),
+])
+def test_read_json_path_converts_pointer(json_file, pointer, expected):
+    """Test that JSON Pointers, including ~0/~1 escapes, select the right values."""
+    assert file_tools.read_json_path(json_file, pointer) == expected
+
+
+def test_read_json_path_empty_pointer_reads_document(json_file):
+    """Test that the empty pointer returns the whole document."""
+    assert file_tools.read_json_path(json_file, "") == [file_tools.read_json(json_file)]
+
+
+def test_read_json_path_rejects_relative_pointer(json_file):
+    """Test that a pointer without a leading slash is rejected rather than misread."""
+    with pytest.raises(ValueError, match="start with '/'"):
+        file_tools.read_json_path(json_file, "results/item")
+
+
+def test_read_json_path_invalid_json(tmp_path):
+    """Test that malformed JSON raises ValueError."""
+    path = tmp_path / "bad.json"
+    path.write_bytes(b'{"results": [1, 2')
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        file_tools.read_json_path(str(path), "/results/item")
@@ -0,0 +1,133 @@
+"""Tests for the SynthLang agent web tools."""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from synthlang.proxy.agents import registry
+from synthlang.proxy.agents.tools import web_tools
+
+# Size of the large test page, well past EXTRACT_MAX_BYTES
+LARGE_PAGE_BYTES = 3 * web_tools.EXTRACT_MAX_BYTES
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve small, large, slow and missing HTML pages."""
+
+    # Requests being served, the most seen at once, and the User-Agents sent
+    in_flight = 0
+    max_in_flight = 0
+    user_agents = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            _Handler.in_flight += 1
+            _Handler.max_in_flight = max(_Handler.max_in_flight, _Handler.in_flight)
+            _Handler.user_agents.append(self.headers.get("User-Agent"))
+        try:
+            self._respond()
+        finally:
+            with self.lock:
+                _Handler.in_flight -= 1
+
+    def _respond(self):
+        if self.path.startswith("/missing"):
+            self.send_error(404)
+            return
+        if self.path.startswith("/slow"):
+            time.sleep(0.05)
+        if self.path.startswith("/large"):
+            body = b"<title>Large</title>" + b"word " * (LARGE_PAGE_BYTES // 5)
+        else:
+            body = b"<html><title>Small</title><body>Hello there</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server and yield its base URL."""
+    _Handler.in_flight = _Handler.max_in_flight = 0
+    _Handler.user_agents = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_url_reports_truncation(server):
+    """Test that fetch_url flags bodies cut off at max_bytes."""
+    full = web_tools.fetch_url(f"{server}/small")
+    cut = web_tools.fetch_url(f"{server}/large", max_bytes=1000)
+
+    assert full["truncated"] is False
+    assert cut["truncated"] is True
+    assert len(cut["text"]) == 1000
+
+
+def test_extract_content_reports_truncated_pages(server):
+    """Test that extract_content says when only the start of a page was read."""
+    small = web_tools.extract_content(f"{server}/small")
+    large = web_tools.extract_content(f"{server}/large")
+
+    assert small["title"] == "Small"
+    assert small["truncated"] is False
+    assert small["content_length"] == len("Small Hello there")
+    assert large["truncated"] is True
+    assert large["content_length"] <= web_tools.EXTRACT_MAX_BYTES
+
+
+def test_fetch_url_batch_bounds_concurrency(server):
+    """Test that a batch keeps at most BATCH_MAX_CONCURRENCY requests in flight."""
+    urls = [f"{server}/slow/{i}" for i in range(web_tools.BATCH_MAX_CONCURRENCY * 3)]
+
+    results = asyncio.run(web_tools.fetch_url_batch(urls))
+
+    assert len(results) == len(urls)
+    assert all(result["status_code"] == 200 for result in results)
+    assert 1 < _Handler.max_in_flight <= web_tools.BATCH_MAX_CONCURRENCY
+    assert set(_Handler.user_agents) == {web_tools.USER_AGENT}
+
+
+def test_fetch_url_batch_limits_bodies_and_reports_errors(server):
+    """Test that a batch honours max_bytes and keeps failed URLs in place."""
+    results = asyncio.run(web_tools.fetch_url_batch(
+        [f"{server}/large", f"{server}/missing", f"{server}/small"], max_bytes=1000
+    ))
+
+    assert results[0]["truncated"] is True
+    assert len(results[0]["text"]) == 1000
+    assert results[1] == {
+        "url": f"{server}/missing",
+        "error": "HTTP status 404",
+        "status_code": 404
+    }
+    assert results[2]["truncated"] is False
+
+
+def test_call_tool_runs_async_tools_without_event_loop(server):
+    """Test that calling an async tool from synchronous code returns its result."""
+    results = registry.call_tool("fetch_url_batch", urls=[f"{server}/small"])
+
+    assert results[0]["text"].startswith("<html>")
+
+
+def test_call_tool_returns_coroutine_inside_event_loop(server):
+    """Test that callers already in an event loop get an awaitable back."""
+    async def call():
+        pending = registry.call_tool("fetch_url_batch", urls=[f"{server}/small"])
+        assert asyncio.iscoroutine(pending)
+        return await pending
+
+    assert asyncio.run(call())[0]["status_code"] == 200
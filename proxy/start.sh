@@ -69,4 +69,4 @@ echo -e "   ${GREEN}✓ Configuration loaded${NC}"
 
 # Run the server with environment variables
 echo -e "\n🚀 ${GREEN}Starting SynthLang proxy server...${NC}\n"
-uvicorn src.app.main:app --reload
\ No newline at end of file
+uvicorn src.app.main:app --reload --loop uvloop --http httptools
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Tests for the API keys CLI storage.
+
+This module contains tests for the cached loading and saving of the
+API keys file.
+"""
+import os
+
+import orjson
+import pytest
+
+from src.cli import api_keys
+
+
+@pytest.fixture
+def keys_file(tmp_path, monkeypatch):
+    """Point the CLI at a temporary keys file and start with an empty cache."""
+    path = tmp_path / ".api_keys.json"
+    path.write_bytes(orjson.dumps({"api_keys": {"sk-old": "user1"}, "rate_limits": {}}))
+    monkeypatch.setattr(api_keys, "API_KEYS_FILE", str(path))
+    monkeypatch.setattr(api_keys, "_CACHE", {"mtime": None, "data": None})
+    return path
+
+
+def test_load_api_keys_missing_file(tmp_path, monkeypatch):
+    """Test that a missing keys file loads as empty."""
+    monkeypatch.setattr(api_keys, "API_KEYS_FILE", str(tmp_path / "missing.json"))
+
+    assert api_keys.load_api_keys() == {"api_keys": {}, "rate_limits": {}}
+
+
+def test_load_api_keys_parses_file_once(keys_file, monkeypatch):
+    """Test that an unchanged file is served from the cache."""
+    first = api_keys.load_api_keys()
+    monkeypatch.setattr(api_keys.orjson, "loads", lambda *args: pytest.fail("keys file parsed again"))
+
+    assert api_keys.load_api_keys() is first
+
+
+def test_load_api_keys_sees_external_changes(keys_file):
+    """Test that a file changed by another process is read again."""
+    assert "sk-old" in api_keys.load_api_keys()["api_keys"]
+
+    keys_file.write_bytes(orjson.dumps({"api_keys": {"sk-new": "user2"}, "rate_limits": {}}))
+    stat = os.stat(keys_file)
+    os.utime(keys_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert api_keys.load_api_keys()["api_keys"] == {"sk-new": "user2"}
+
+
+def test_save_api_keys_refreshes_cache(keys_file):
+    """Test that loading after a save returns the saved data."""
+    data = api_keys.load_api_keys()
+    data["api_keys"]["sk-added"] = "user3"
+
+    assert api_keys.save_api_keys(data) is True
+    assert api_keys.load_api_keys()["api_keys"] == {"sk-old": "user1", "sk-added": "user3"}
+    assert orjson.loads(keys_file.read_bytes()) == data
+
+
+def test_failed_save_keeps_original_file(keys_file, monkeypatch):
+    """Test that a failed rename leaves the keys file and cache consistent."""
+    original = keys_file.read_bytes()
+    data = api_keys.load_api_keys()
+    data["api_keys"]["sk-added"] = "user3"
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(api_keys.os, "replace", fail_replace)
+
+    assert api_keys.save_api_keys(data) is False
+    assert keys_file.read_bytes() == original
+    assert not os.path.exists(f"{keys_file}.tmp")
+    assert api_keys.load_api_keys()["api_keys"] == {"sk-old": "user1"}
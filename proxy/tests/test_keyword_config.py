@@ -0,0 +1,43 @@
+"""
+Tests for the keyword configuration file.
+
+This module contains tests for loading and atomically saving the
+keyword configuration TOML file.
+"""
+import os
+
+import pytest
+
+from src.app.config import keywords
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a keyword configuration file and return its path."""
+    path = tmp_path / "keywords.toml"
+    keywords.save_keyword_config({"settings": {"enable_detection": True}}, str(path))
+    return path
+
+
+def test_save_and_load_round_trip(config_file):
+    """Test that a saved configuration loads back unchanged."""
+    config = {"settings": {"enable_detection": False}, "patterns": {"weather": {"priority": 50}}}
+
+    assert keywords.save_keyword_config(config, str(config_file)) is True
+    assert keywords.load_keyword_config(str(config_file)) == config
+    assert not os.path.exists(f"{config_file}.tmp")
+
+
+def test_failed_save_keeps_original_file(config_file, monkeypatch):
+    """Test that a failed rename leaves the original configuration intact."""
+    original = config_file.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(keywords.os, "replace", fail_replace)
+
+    assert keywords.save_keyword_config({"settings": {"enable_detection": False}}, str(config_file)) is False
+    assert config_file.read_bytes() == original
+    assert not os.path.exists(f"{config_file}.tmp")
+    assert keywords.load_keyword_config(str(config_file)) == {"settings": {"enable_detection": True}}
@@ -258,4 +258,24 @@ def test_get_embedding():
         assert embedding == [0.1, 0.2, 0.3]
         
         # Verify the provider was called with the correct parameters
-        mock_get_embedding.assert_called_once_with("Hello")
\ No newline at end of file
+        mock_get_embedding.assert_called_once_with("Hello")
+
+@pytest.mark.asyncio
+async def test_clients_rebuilt_after_shared_pools_closed():
+    """Test that the provider replaces clients whose shared pool was closed at shutdown."""
+    from app.llm_providers.providers import openai_provider
+    
+    provider = openai_provider.OpenAIProvider()
+    with patch.object(openai_provider, "OPENAI_API_KEY", "sk-test"):
+        client = provider.get_openai_client()
+        async_client = provider.get_async_openai_client()
+        
+        await openai_provider.close_shared_http_clients()
+        
+        # The old clients are closed; the getters build new ones on fresh pools
+        assert client.is_closed()
+        assert async_client.is_closed()
+        assert not provider.get_openai_client().is_closed()
+        assert not provider.get_async_openai_client().is_closed()
+    
+    await openai_provider.close_shared_http_clients()
@@ -0,0 +1,68 @@
+"""
+Tests for the SynthLang prompt evolver.
+
+This module contains tests for PromptEvolver's generation loop.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.synthlang.core.module import MAX_GENERATIONS, PromptEvolver
+
+
+class CountingEvolver(PromptEvolver):
+    """Evolver whose mutate and score stand in for language model calls."""
+
+    uses_lm = True
+
+    def __init__(self):
+        super().__init__(lm=object())
+        self.threads = set()
+        self.mutations = 0
+
+    def mutate(self, prompt: str, index: int) -> str:
+        self.threads.add(threading.get_ident())
+        self.mutations += 1
+        return f"{prompt}!"
+
+    def score(self, prompt: str) -> float:
+        self.threads.add(threading.get_ident())
+        return len(prompt) / 1000
+
+
+def test_placeholder_evolve_runs_one_generation():
+    """Test that the placeholder evolver stops after one generation."""
+    evolver = PromptEvolver(lm=object())
+
+    result = evolver.evolve("Say hello", n_generations=10**6)
+
+    assert result["best_prompt"] == "Say hello"
+    assert result["generations"] == 1
+    assert result["total_variants"] == evolver.population_size
+
+
+@pytest.mark.asyncio
+async def test_placeholder_evolve_async_stays_on_event_loop(monkeypatch):
+    """Test that placeholder scoring does not use worker threads."""
+    async def fail(*args, **kwargs):
+        raise AssertionError("placeholder scoring must not use a worker thread")
+
+    monkeypatch.setattr(asyncio, "to_thread", fail)
+
+    result = await PromptEvolver(lm=object()).evolve_async("Say hello", 10**6)
+
+    assert result["generations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lm_evolve_async_is_capped_and_threaded():
+    """Test that LM-backed evolution is capped and runs mutate and score off the loop."""
+    evolver = CountingEvolver()
+
+    result = await evolver.evolve_async("Say hello", MAX_GENERATIONS + 50, asyncio.Semaphore(2))
+
+    assert result["generations"] == MAX_GENERATIONS
+    assert evolver.mutations == MAX_GENERATIONS * evolver.population_size
+    assert threading.get_ident() not in evolver.threads
+    assert result["best_prompt"] == "Say hello" + "!" * MAX_GENERATIONS
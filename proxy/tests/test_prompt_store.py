@@ -0,0 +1,148 @@
+"""
+Tests for the SynthLang prompt store.
+
+This module contains tests for the SQLite-backed PromptManager.
+"""
+import pytest
+import pytest_asyncio
+
+from app.synthlang.core import PromptManager
+
+
+@pytest_asyncio.fixture(scope="function")
+async def prompt_manager(tmp_path):
+    """Create a prompt manager backed by a temporary database."""
+    manager = PromptManager(str(tmp_path))
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_prompt(prompt_manager):
+    """Test that a saved prompt can be loaded with its metadata."""
+    await prompt_manager.save("greeting", "Say hello", {"user_id": "user1"})
+
+    result = await prompt_manager.load("greeting")
+
+    assert result == {"name": "greeting", "prompt": "Say hello", "metadata": {"user_id": "user1"}}
+
+
+@pytest.mark.asyncio
+async def test_save_replaces_existing_prompt(prompt_manager):
+    """Test that saving under an existing name replaces the prompt."""
+    await prompt_manager.save("greeting", "Say hello")
+    await prompt_manager.save("greeting", "Say goodbye")
+
+    prompts = await prompt_manager.list()
+
+    assert len(prompts) == 1
+    assert prompts[0]["prompt"] == "Say goodbye"
+
+
+@pytest.mark.asyncio
+async def test_load_missing_prompt_raises(prompt_manager):
+    """Test that loading an unknown prompt raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        await prompt_manager.load("missing")
+
+
+@pytest.mark.asyncio
+async def test_delete_prompt(prompt_manager):
+    """Test that deleted prompts are removed and unknown names raise."""
+    await prompt_manager.save("greeting", "Say hello")
+
+    await prompt_manager.delete("greeting")
+
+    assert await prompt_manager.list() == []
+    with pytest.raises(FileNotFoundError):
+        await prompt_manager.delete("greeting")
+
+
+@pytest.mark.asyncio
+async def test_compare_prompts(prompt_manager):
+    """Test that comparing prompts reports per-prompt metrics."""
+    await prompt_manager.save("short", "Say hello")
+    await prompt_manager.save("long", "Say hello to everyone")
+
+    result = await prompt_manager.compare("short", "long")
+
+    assert result["prompts"] == {"short": "Say hello", "long": "Say hello to everyone"}
+    assert result["metrics"]["short"]["word_count"] == 2
+    assert result["differences"]["word_count_diff"] == 2
+    assert result["differences"]["identical"] is False
+
+
+@pytest.mark.asyncio
+async def test_list_prompts_for_user(prompt_manager):
+    """Test that listing by user only returns that user's prompts."""
+    await prompt_manager.save("mine", "Say hello", {"user_id": "user1"})
+    await prompt_manager.save("theirs", "Say goodbye", {"user_id": "user2"})
+    await prompt_manager.save("unowned", "Say nothing")
+
+    prompts = await prompt_manager.list("user1")
+
+    assert [p["name"] for p in prompts] == ["mine"]
+    assert len(await prompt_manager.list()) == 3
+
+
+@pytest.mark.asyncio
+async def test_load_many_prompts(prompt_manager):
+    """Test that several prompts load in one call and missing names are skipped."""
+    await prompt_manager.save("first", "Say hello")
+    await prompt_manager.save("second", "Say goodbye")
+
+    loaded = await prompt_manager.load_many(["first", "second", "missing"])
+
+    assert set(loaded) == {"first", "second"}
+    assert loaded["second"]["prompt"] == "Say goodbye"
+
+
+@pytest.mark.asyncio
+async def test_delete_prompt_checks_owner(prompt_manager):
+    """Test that deleting on behalf of a user only removes that user's prompts."""
+    await prompt_manager.save("greeting", "Say hello", {"user_id": "user1"})
+
+    with pytest.raises(PermissionError):
+        await prompt_manager.delete("greeting", "user2")
+
+    metadata = await prompt_manager.delete("greeting", "user1")
+
+    assert metadata == {"user_id": "user1"}
+    assert await prompt_manager.list() == []
+
+
+@pytest.mark.asyncio
+async def test_save_prompt_checks_owner(prompt_manager):
+    """Test that saving on behalf of a user cannot replace another user's prompt."""
+    await prompt_manager.save("greeting", "Say hello", {"user_id": "user1"}, "user1")
+
+    with pytest.raises(PermissionError):
+        await prompt_manager.save("greeting", "Say goodbye", {"user_id": "user2"}, "user2")
+    with pytest.raises(PermissionError):
+        await prompt_manager.delete("greeting", "user2")
+
+    assert await prompt_manager.load("greeting") == {
+        "name": "greeting", "prompt": "Say hello", "metadata": {"user_id": "user1"}
+    }
+
+    await prompt_manager.save("greeting", "Say hi", {"user_id": "user1"}, "user1")
+    await prompt_manager.save("farewell", "Say goodbye", {"user_id": "user2"}, "user2")
+
+    assert (await prompt_manager.load("greeting"))["prompt"] == "Say hi"
+    assert [p["name"] for p in await prompt_manager.list("user2")] == ["farewell"]
+
+
+@pytest.mark.asyncio
+async def test_list_prompts_for_user_uses_index(prompt_manager):
+    """Test that listing by user is served from the user_id index."""
+    db = await prompt_manager.connect()
+
+    async with db.execute(
+        "EXPLAIN QUERY PLAN SELECT name, prompt, metadata_json FROM prompts "
+        "WHERE json_extract(metadata_json, '$.user_id') = ? ORDER BY name",
+        ("user1",)
+    ) as cursor:
+        plan = " ".join(row[-1] for row in await cursor.fetchall())
+
+    assert "prompts_user_id" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,283 @@
+"""
+Tests for the SynthLang API endpoints.
+
+This module mounts the SynthLang router on a bare FastAPI app with the
+shared validation error handler, so the routes can be exercised without
+the full application and its database.
+"""
+import orjson
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+from src.app import auth
+from src.app.synthlang import endpoints
+from src.app.synthlang.api import synthlang_api
+from src.app.synthlang.core.module import PromptEvolver, PromptManager
+from src.app.validation_handler import validation_exception_handler
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an app serving only the SynthLang router."""
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+
+    credentials = endpoints.AuthContext("sk-test", "user1", frozenset({"basic", "premium"}))
+    app.dependency_overrides[endpoints.verify_auth] = lambda: credentials
+    app.dependency_overrides[endpoints.authorize_basic] = lambda: credentials
+    app.dependency_overrides[endpoints.authorize_premium] = lambda: credentials
+    app.dependency_overrides[endpoints.ensure_language_model] = lambda: None
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("n_generations", [None, 0, 10**6])
+def test_evolve_rejects_invalid_generations(client, n_generations):
+    """Test that out-of-range or null generation counts are rejected with a 422."""
+    response = client.post(
+        "/v1/synthlang/evolve",
+        json={"seed_prompt": "Say hello", "n_generations": n_generations}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "n_generations"]
+
+
+def test_optimize_rejects_null_iterations(client):
+    """Test that a null iteration count is rejected before reaching the optimizer."""
+    response = client.post(
+        "/v1/synthlang/optimize",
+        json={"prompt": "Say hello", "max_iterations": None}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "max_iterations"]
+
+
+def test_malformed_json_uses_validation_format(client):
+    """Test that unparseable bodies get the same 422 format as schema errors."""
+    response = client.post(
+        "/v1/synthlang/translate",
+        content=b"{not json",
+        headers={"content-type": "application/json", "cookie": "session=secret"}
+    )
+
+    assert response.status_code == 422
+    assert list(response.json()) == ["detail"]
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+    assert "secret" not in response.text
+    assert "{not json" not in response.text
+
+
+class _Item(BaseModel):
+    """Request body for the validation handler tests."""
+
+    name: str
+    count: int
+
+    @field_validator("name")
+    @classmethod
+    def name_not_blank(cls, value: str) -> str:
+        if not value.strip():
+            raise ValueError("name must not be blank")
+        return value
+
+
+def _validation_app(with_handler: bool) -> TestClient:
+    """Create a test client for an app with one pydantic-validated route."""
+    app = FastAPI()
+
+    @app.post("/items")
+    async def create_item(item: _Item):
+        return item
+
+    if with_handler:
+        app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    return TestClient(app)
+
+
+def test_validation_handler_matches_fastapi_default():
+    """Test that the orjson handler returns exactly FastAPI's default 422 body."""
+    request = {
+        "json": {"name": "widget", "count": "many"},
+        "headers": {"authorization": "Bearer sk-secret", "cookie": "session=secret"}
+    }
+
+    response = _validation_app(True).post("/items", **request)
+    default = _validation_app(False).post("/items", **request)
+
+    assert response.status_code == default.status_code == 422
+    assert response.json() == default.json()
+    assert response.json()["detail"][0]["loc"] == ["body", "count"]
+    assert "secret" not in response.text
+
+
+def test_validation_handler_encodes_validator_exceptions():
+    """Test that exceptions carried in an error's ctx are serialized as strings."""
+    response = _validation_app(True).post("/items", json={"name": " ", "count": 1})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["ctx"] == {"error": "name must not be blank"}
+
+
+@pytest.fixture
+def evolver_api(monkeypatch):
+    """Give the shared SynthLang API a language model and a placeholder evolver."""
+    lm = object()
+    monkeypatch.setattr(synthlang_api, "enabled", True)
+    monkeypatch.setattr(synthlang_api, "lm", lm)
+    monkeypatch.setattr(synthlang_api, "evolver", PromptEvolver(lm))
+    return synthlang_api
+
+
+def _events(response) -> list:
+    """Decode the data frames of a server-sent event response."""
+    frames = [line[len("data: "):] for line in response.text.split("\n\n") if line]
+    assert frames[-1] == "[DONE]"
+    return [orjson.loads(frame) for frame in frames[:-1]]
+
+
+def test_evolve_streams_progress_events(client, evolver_api):
+    """Test that a streamed evolution sends generation events, then the result."""
+    response = client.post(
+        "/v1/synthlang/evolve",
+        json={"seed_prompt": "Say hello", "n_generations": 3, "stream": True}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    assert [event["event"] for event in events] == ["generation", "result"]
+    assert events[-1]["best_prompt"] == "Say hello"
+    assert events[0]["request_id"] == events[-1]["request_id"]
+    assert not evolver_api._active_streams
+
+
+@pytest.mark.asyncio
+async def test_abort_stops_stream_for_owner_only(evolver_api):
+    """Test that only the user who started a stream can abort it."""
+    async def steps():
+        for generation in range(1, 4):
+            yield {"event": "generation", "generation": generation}
+
+    stream = evolver_api._track_stream("synthlang-test", steps(), "user1")
+
+    assert (await stream.__anext__())["generation"] == 1
+    assert evolver_api.abort("synthlang-test", "user2") is False
+    assert evolver_api.abort("synthlang-test", "user1") is True
+    assert [step["event"] async for step in stream] == ["aborted"]
+    assert "synthlang-test" not in evolver_api._active_streams
+
+
+def test_abort_endpoint_checks_owner(client, monkeypatch):
+    """Test that the abort endpoint only stops the caller's own streams."""
+    monkeypatch.setattr(synthlang_api, "_active_streams", {"synthlang-mine": "user1", "synthlang-theirs": "user2"})
+    monkeypatch.setattr(synthlang_api, "_aborted_streams", set())
+
+    mine = client.post("/v1/synthlang/abort/synthlang-mine").json()
+    theirs = client.post("/v1/synthlang/abort/synthlang-theirs").json()
+    missing = client.post("/v1/synthlang/abort/synthlang-missing").json()
+
+    assert mine["success"] is True
+    assert theirs["success"] is False
+    assert missing["success"] is False
+    assert synthlang_api._aborted_streams == {"synthlang-mine"}
+
+
+@pytest.fixture
+def api_key(monkeypatch):
+    """Register a test API key for a basic user and start with an empty credentials cache."""
+    monkeypatch.setitem(auth.API_KEYS, "sk-cache-test", "cache_user")
+    monkeypatch.setattr(endpoints, "_auth_cache", {})
+    return "sk-cache-test"
+
+
+def test_verify_auth_rejects_removed_key_immediately(api_key):
+    """Test that a cached key stops working as soon as it is removed."""
+    assert endpoints.verify_auth(f"Bearer {api_key}").user_id == "cache_user"
+
+    del auth.API_KEYS[api_key]
+
+    with pytest.raises(HTTPException) as exc_info:
+        endpoints.verify_auth(f"Bearer {api_key}")
+    assert exc_info.value.status_code == 401
+
+
+def test_verify_auth_picks_up_role_changes(api_key, monkeypatch):
+    """Test that role changes drop the user's cached credentials."""
+    assert "premium" not in endpoints.verify_auth(f"Bearer {api_key}").roles
+
+    monkeypatch.setitem(auth.USER_ROLES, "cache_user", ["premium"])
+    auth.roles._notify_roles_changed("cache_user")
+
+    assert "premium" in endpoints.verify_auth(f"Bearer {api_key}").roles
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/v1/synthlang/optimize", {"prompt": "Say hello"}),
+    ("/v1/synthlang/evolve", {"seed_prompt": "Say hello"})
+])
+def test_premium_routes_reject_basic_users(monkeypatch, path, body):
+    """Test that optimize and evolve require the premium role."""
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    app.dependency_overrides[endpoints.verify_auth] = lambda: endpoints.AuthContext(
+        "sk-test", "user1", frozenset({"basic"})
+    )
+    app.dependency_overrides[endpoints.ensure_language_model] = lambda: None
+    monkeypatch.setattr(auth, "check_rate_limit", lambda *args, **kwargs: None)
+
+    response = TestClient(app).post(path, json=body)
+
+    assert response.status_code == 403
+    assert response.json()["detail"]["error"]["type"] == "permission_denied"
+
+
+@pytest.fixture
+def prompt_store(monkeypatch, tmp_path):
+    """Give the shared SynthLang API a prompt store in a temporary directory."""
+    monkeypatch.setattr(synthlang_api, "enabled", True)
+    monkeypatch.setattr(synthlang_api, "prompt_manager", PromptManager(str(tmp_path)))
+    monkeypatch.setattr(endpoints, "_prompts_cache", {})
+    return synthlang_api.prompt_manager
+
+
+def _as_user(client, user_id: str, roles=frozenset({"basic"})) -> None:
+    """Make the client's requests come from the given user."""
+    credentials = endpoints.AuthContext("sk-test", user_id, frozenset(roles))
+    client.app.dependency_overrides[endpoints.authorize_basic] = lambda: credentials
+
+
+def test_save_prompt_rejects_overwriting_other_users_prompt(client, prompt_store):
+    """Test that a user cannot take over another user's prompt by saving over it."""
+    _as_user(client, "user1")
+    assert client.post("/v1/synthlang/prompts/save", json={"name": "greeting", "prompt": "Say hello"}).json()["success"]
+
+    _as_user(client, "user2")
+    response = client.post("/v1/synthlang/prompts/save", json={"name": "greeting", "prompt": "Say goodbye"})
+    delete = client.post("/v1/synthlang/prompts/delete", json={"name": "greeting"})
+
+    assert response.status_code == 403
+    assert response.json()["error"]["type"] == "permission_denied"
+    assert delete.status_code == 401
+
+    _as_user(client, "user1")
+    loaded = client.post("/v1/synthlang/prompts/load", json={"name": "greeting"}).json()
+    assert loaded["prompt"] == "Say hello"
+    assert loaded["metadata"]["user_id"] == "user1"
+
+
+def test_admin_can_overwrite_any_prompt(client, prompt_store):
+    """Test that admins may replace prompts saved by other users."""
+    _as_user(client, "user1")
+    client.post("/v1/synthlang/prompts/save", json={"name": "greeting", "prompt": "Say hello"})
+
+    _as_user(client, "admin1", {"basic", "admin"})
+    response = client.post("/v1/synthlang/prompts/save", json={"name": "greeting", "prompt": "Say hi"})
+
+    assert response.status_code == 200
+    assert client.post("/v1/synthlang/prompts/load", json={"name": "greeting"}).json()["prompt"] == "Say hi"
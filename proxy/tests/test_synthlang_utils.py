@@ -0,0 +1,40 @@
+"""
+Tests for the SynthLang API utilities.
+
+This module contains tests for the shared DSPy language model cache.
+"""
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.app import config
+from src.app.synthlang import utils
+
+
+@pytest.fixture
+def fake_dspy(monkeypatch):
+    """Install a stand-in dspy module whose OpenAI constructor can be controlled."""
+    module = types.SimpleNamespace(OpenAI=MagicMock())
+    monkeypatch.setitem(sys.modules, "dspy", module)
+    monkeypatch.setattr(utils, "_lms", {})
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "sk-test")
+    return module
+
+
+def test_get_dspy_lm_reuses_instance(fake_dspy):
+    """Test that one language model is created per model name."""
+    first = utils.get_dspy_lm("gpt-4")
+
+    assert utils.get_dspy_lm("gpt-4") is first
+    assert fake_dspy.OpenAI.call_count == 1
+
+
+def test_get_dspy_lm_retries_after_failure(fake_dspy):
+    """Test that a failed creation is not cached."""
+    lm = object()
+    fake_dspy.OpenAI.side_effect = [RuntimeError("provider unavailable"), lm]
+
+    assert utils.get_dspy_lm("gpt-4") is None
+    assert utils.get_dspy_lm("gpt-4") is lm